@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from uuid import UUID
+
+from adaptix.integrations.orjson import OrjsonRetort
+
+
+@dataclass
+class Event:
+    id: UUID
+    created_at: datetime
+
+
+retort = OrjsonRetort()
+
+event = Event(
+    id=UUID("7e568b96-cd0c-4d3e-b0fa-43cb5d3aa699"),
+    created_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+)
+assert retort.dumps_bytes(event) == (
+    b'{"id":"7e568b96-cd0c-4d3e-b0fa-43cb5d3aa699","created_at":"2024-01-02T03:04:05+00:00"}'
+)
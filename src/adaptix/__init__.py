@@ -1,9 +1,11 @@
 from ._internal.common import Dumper, Loader, TypeHint
 from ._internal.definitions import DebugTrail
+from ._internal.morphing.facade.batch import BatchLoadResult
 from ._internal.morphing.facade.func import dump, load
 from ._internal.morphing.facade.provider import (
     as_is_dumper,
     as_is_loader,
+    compilation_cache,
     constructor,
     date_by_timestamp,
     datetime_by_format,
@@ -15,8 +17,14 @@ from ._internal.morphing.facade.provider import (
     enum_by_value,
     flag_by_exact_value,
     flag_by_member_names,
+    inline_nested_models,
+    lazy_loading,
     loader,
+    memoized_loader,
     name_mapping,
+    numeric_array,
+    numpy_array,
+    raw_bytes,
     validator,
     with_property,
 )
@@ -69,9 +77,17 @@ __all__ = (
     "datetime_by_format",
     "date_by_timestamp",
     "datetime_by_timestamp",
+    "numeric_array",
+    "numpy_array",
+    "raw_bytes",
+    "compilation_cache",
+    "inline_nested_models",
+    "lazy_loading",
+    "memoized_loader",
     "AdornedRetort",
     "FilledRetort",
     "Retort",
+    "BatchLoadResult",
     "Omittable",
     "Omitted",
     "provider",
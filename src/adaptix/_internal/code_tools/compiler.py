@@ -1,8 +1,16 @@
+import hashlib
 import linecache
+import marshal
+import os
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from contextlib import suppress
+from importlib.util import MAGIC_NUMBER
+from pathlib import Path
+from tempfile import NamedTemporaryFile
 from threading import Lock
-from typing import Any, Callable
+from types import CodeType
+from typing import Any, Callable, Optional, Union
 
 from .code_builder import CodeBuilder
 
@@ -54,8 +62,11 @@ class BasicClosureCompiler(ClosureCompiler):
 
         return main_builder
 
+    def _compile_source(self, source: str, unique_filename: str) -> CodeType:
+        return compile(source, unique_filename, "exec")
+
     def _compile(self, source: str, unique_filename: str, namespace: dict[str, Any]):
-        code_obj = compile(source, unique_filename, "exec")
+        code_obj = self._compile_source(source, unique_filename)
 
         local_namespace: dict[str, Any] = {}
         exec(code_obj, namespace, local_namespace)  # noqa: S102
@@ -83,3 +94,76 @@ class BasicClosureCompiler(ClosureCompiler):
         source = self._make_source_builder(builder).string()
         unique_id = self._get_unique_id(base_id)
         return self._compile(source, filename_maker(unique_id), namespace)
+
+
+def _replace_filename(code_obj: CodeType, filename: str) -> CodeType:
+    return code_obj.replace(
+        co_filename=filename,
+        co_consts=tuple(
+            _replace_filename(const, filename) if isinstance(const, CodeType) else const
+            for const in code_obj.co_consts
+        ),
+    )
+
+
+class DiskCachingClosureCompiler(BasicClosureCompiler):
+    """Closure compiler that stores marshalled code objects at the directory
+    and reuses them across processes.
+
+    Cache entry is addressed by the hash of the full generated source and the bytecode magic number.
+    Generated source reflects the model structure and every recipe option affecting it,
+    so any change of them leads to a new cache entry instead of reusing a stale one.
+    Objects referenced by the generated code are never cached, they are always taken from the current process.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike]):
+        self._directory = Path(directory)
+
+    def _get_cache_path(self, source: str) -> Path:
+        digest = hashlib.sha256(MAGIC_NUMBER + source.encode()).hexdigest()
+        return self._directory / f"{digest}.bin"
+
+    def _load_code(self, path: Path) -> Optional[CodeType]:
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+
+        if not data.startswith(MAGIC_NUMBER):
+            return None
+        try:
+            # the directory is chosen by the user and is populated only by this compiler
+            code_obj = marshal.loads(data[len(MAGIC_NUMBER):])  # noqa: S302
+        except (EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(code_obj, CodeType):
+            return None
+        return code_obj
+
+    def _store_code(self, path: Path, code_obj: CodeType) -> None:
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            file = NamedTemporaryFile(dir=self._directory, suffix=".tmp", delete=False)
+        except OSError:
+            return
+
+        temp_path = Path(file.name)
+        try:
+            with file:
+                file.write(MAGIC_NUMBER + marshal.dumps(code_obj))
+            temp_path.replace(path)
+        except OSError:
+            pass
+        finally:
+            # temporary file is left only if writing or replacing has failed
+            with suppress(OSError):
+                temp_path.unlink(missing_ok=True)
+
+    def _compile_source(self, source: str, unique_filename: str) -> CodeType:
+        path = self._get_cache_path(source)
+        code_obj = self._load_code(path)
+        if code_obj is None:
+            code_obj = super()._compile_source(source, unique_filename)
+            self._store_code(path, code_obj)
+            return code_obj
+        return _replace_filename(code_obj, unique_filename)
@@ -0,0 +1,111 @@
+import ast
+from ast import NodeTransformer
+from collections.abc import Mapping, Set
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class InlinableCode:
+    """Source of generated closure that can be inlined into another generated closure.
+
+    :param source: Code of single function definition taking one argument.
+        The function must end with the only return statement and must not contain nested scopes
+        except comprehensions.
+    :param namespace: Global variables of the function
+    :param depth: How many levels of other closures are already inlined into this one
+    """
+    source: str
+    namespace: Mapping[str, object]
+    depth: int = 0
+
+
+@dataclass(frozen=True)
+class InlinedCode:
+    """Result of inlining.
+
+    :param arg: Variable that must be bound to the argument before execution of the body
+    :param body: Statements of the function, the return statement is replaced with an assignment
+    :param namespace: Global variables of the function renamed to be used inside the enclosing closure
+    """
+    arg: str
+    body: str
+    namespace: Mapping[str, object]
+
+
+_FORBIDDEN_NODES = (
+    ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef,
+    ast.Global, ast.Nonlocal, ast.Return, ast.Yield, ast.YieldFrom, ast.Await,
+)
+
+
+class _Renamer(NodeTransformer):
+    def __init__(self, names: Set[str], prefix: str):
+        self._names = names
+        self._prefix = prefix
+
+    def visit_Name(self, node: ast.Name) -> ast.Name:  # noqa: N802
+        if node.id in self._names:
+            node.id = self._prefix + node.id
+        return node
+
+    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> ast.ExceptHandler:  # noqa: N802
+        if node.name is not None and node.name in self._names:
+            node.name = self._prefix + node.name
+        self.generic_visit(node)
+        return node
+
+
+def _collect_local_names(func_def: ast.FunctionDef) -> set[str]:
+    names = {arg.arg for arg in func_def.args.args}
+    for node in ast.walk(func_def):
+        if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Load):
+            names.add(node.id)
+        elif isinstance(node, ast.ExceptHandler) and node.name is not None:
+            names.add(node.name)
+    return names
+
+
+def _parse_function(source: str) -> ast.FunctionDef:
+    module = ast.parse(source)
+    if len(module.body) != 1 or not isinstance(module.body[0], ast.FunctionDef):
+        raise ValueError("Source must contain only one function definition")
+    func_def = module.body[0]
+    args = func_def.args
+    if (
+        len(args.args) != 1 or args.posonlyargs or args.kwonlyargs
+        or args.vararg or args.kwarg or args.defaults or func_def.decorator_list
+    ):
+        raise ValueError("Function must take exactly one argument")
+    if not isinstance(func_def.body[-1], ast.Return) or func_def.body[-1].value is None:
+        raise ValueError("Function must end with return statement")
+    forbidden_node = next(
+        (node for stmt in func_def.body[:-1] for node in ast.walk(stmt) if isinstance(node, _FORBIDDEN_NODES)),
+        None,
+    )
+    if forbidden_node is not None:
+        raise ValueError(f"Function containing {type(forbidden_node).__name__} cannot be inlined")
+    return func_def
+
+
+def inline_code(code: InlinableCode, *, prefix: str, result_target: str) -> InlinedCode:
+    """Converts the function into statements that can be placed inside another function.
+    All local variables and globals are prefixed to avoid collisions with names of the enclosing function,
+    so prefix must not be a beginning of any other name of the enclosing function.
+    Raises ValueError if the code cannot be inlined.
+
+    :param code: Code to inline
+    :param prefix: Prefix of all names of the inlined code
+    :param result_target: Target expression that the returned value is assigned to
+    """
+    func_def = _parse_function(code.source)
+    renamer = _Renamer(_collect_local_names(func_def) | code.namespace.keys(), prefix)
+    assignment = ast.parse(f"{result_target} = None").body[0]
+    assignment.value = renamer.visit(func_def.body[-1].value)  # type: ignore[attr-defined]
+    body = [renamer.visit(stmt) for stmt in func_def.body[:-1]]
+    body.append(assignment)
+    module = ast.fix_missing_locations(ast.Module(body=body, type_ignores=[]))
+    return InlinedCode(
+        arg=prefix + func_def.args.args[0].arg,
+        body=ast.unparse(module),
+        namespace={prefix + name: value for name, value in code.namespace.items()},
+    )
@@ -11,7 +11,8 @@ from collections.abc import (
     ValuesView,
 )
 from itertools import islice
-from typing import Callable, Generic, Optional, Protocol, TypeVar, Union, runtime_checkable
+from threading import Event, Lock, get_ident
+from typing import Any, Callable, Generic, Optional, Protocol, TypeVar, Union, runtime_checkable
 
 from .common import VarTuple
 from .utils import MappingHashWrapper
@@ -59,6 +60,66 @@ class UnrewritableDict(dict[K, V], Generic[K, V]):
         return f"{type(self).__name__}({super().__repr__()})"
 
 
+class _Flight:
+    __slots__ = ("owner", "done", "succeeded")
+
+    def __init__(self) -> None:
+        self.owner = get_ident()
+        self.done = Event()
+        self.succeeded = False
+
+
+class SingleFlightDict(dict[K, V], Generic[K, V]):
+    """Dict that computes missing values via :meth:`get_or_compute` at most once per key.
+
+    Threads requesting a key that is being computed wait for the result instead of computing it again.
+    If the computation fails, each waiting thread tries to compute the value by itself.
+    Values are published only after they are fully computed, so reading does not require any locks.
+    Reentrant requests of the key from the computing thread are computed directly.
+    """
+    __slots__ = ("_lock", "_flights")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = Lock()
+        self._flights: dict[K, _Flight] = {}
+
+    def get_or_compute(self, key: K, func: Callable[..., V], /, *args: Any, **kwargs: Any) -> V:
+        while True:
+            with self._lock:
+                try:
+                    return self[key]
+                except KeyError:
+                    pass
+
+                try:
+                    flight = self._flights[key]
+                except KeyError:
+                    flight = self._flights[key] = _Flight()
+                    break
+
+            if flight.owner == get_ident():
+                return func(*args, **kwargs)
+            flight.done.wait()
+            if flight.succeeded:
+                return self[key]
+
+        try:
+            value = func(*args, **kwargs)
+        except BaseException:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+            raise
+
+        with self._lock:
+            self[key] = value
+            del self._flights[key]
+        flight.succeeded = True
+        flight.done.set()
+        return value
+
+
 K_co = TypeVar("K_co", covariant=True)
 
 
@@ -174,5 +174,9 @@ HAS_SQLALCHEMY_PKG = DistributionRequirement("sqlalchemy")
 HAS_SUPPORTED_PYDANTIC_PKG = DistributionVersionRequirement("pydantic", "2.0.0")
 HAS_PYDANTIC_PKG = DistributionRequirement("pydantic")
 
+HAS_NUMPY_PKG = DistributionRequirement("numpy")
+
+HAS_ORJSON_PKG = DistributionRequirement("orjson")
+
 IS_CPYTHON = PythonImplementationRequirement("cpython")
 IS_PYPY = PythonImplementationRequirement("pypy")
@@ -0,0 +1,80 @@
+from contextlib import suppress
+from datetime import date, datetime
+from typing import Any, Callable, Optional, TypeVar
+from uuid import UUID
+
+from ...common import TypeHint
+from ...datastructures import SingleFlightDict
+from ...morphing.facade.provider import as_is_dumper
+from ...morphing.facade.retort import Retort
+from ...provider.essential import Provider
+from ...provider.loc_stack_filtering import Pred
+from ...provider.provider_wrapper import ConcatProvider
+
+with suppress(ImportError):
+    from orjson import dumps as orjson_dumps
+
+T = TypeVar("T")
+
+BytesDumper = Callable[[T], bytes]
+
+NATIVE_ORJSON_TYPES = (datetime, date, UUID)
+
+
+def native_orjson(*preds: Pred) -> Provider:
+    """Provider that passes values as-is at dumping, so they are serialized by orjson natively.
+    By default, it is applied to ``datetime``, ``date`` and ``UUID``,
+    orjson produces the same output for them as adaptix does (if no ``option`` changes the format).
+    Do not pass predicates matching types that orjson cannot serialize.
+
+    :param preds: Predicates specifying where the provider should be used.
+        See :ref:`predicate-system` for details.
+    :return: Desired provider
+    """
+    return ConcatProvider(*(as_is_dumper(pred) for pred in (preds or NATIVE_ORJSON_TYPES)))
+
+
+class OrjsonRetort(Retort):
+    """Retort dumping values of natively supported types as-is and encoding dumped data via orjson.
+
+    :param option: Flags passed to ``orjson.dumps()``
+    :param kwargs: Other parameters are passed to :class:`Retort` as is
+    """
+    recipe = [
+        native_orjson(),
+    ]
+
+    def __init__(self, *, option: Optional[int] = None, **kwargs: Any):
+        self._option = option
+        super().__init__(**kwargs)
+
+    def _calculate_derived(self) -> None:
+        super()._calculate_derived()
+        self._bytes_dumper_cache: SingleFlightDict[TypeHint, BytesDumper] = SingleFlightDict()
+
+    def get_bytes_dumper(self, tp: type[T]) -> BytesDumper[T]:
+        """Returns function dumping an instance of the type directly to JSON bytes"""
+        try:
+            return self._bytes_dumper_cache[tp]
+        except KeyError:
+            pass
+        return self._bytes_dumper_cache.get_or_compute(tp, self._make_bytes_dumper, tp)
+
+    def _make_bytes_dumper(self, tp: type[T]) -> BytesDumper[T]:
+        dumper_ = self.get_dumper(tp)
+        option = self._option
+
+        if option is None:
+            def orjson_bytes_dumper(data):
+                return orjson_dumps(dumper_(data))
+
+            return orjson_bytes_dumper
+
+        def orjson_bytes_dumper_with_option(data):
+            return orjson_dumps(dumper_(data), option=option)
+
+        return orjson_bytes_dumper_with_option
+
+    def dumps_bytes(self, data: Any, tp: Optional[TypeHint] = None, /) -> bytes:
+        """Dumps data to JSON bytes. The type is inferred from data if it is omitted"""
+        return self.get_bytes_dumper(self._infer_dumped_type(data, tp))(data)
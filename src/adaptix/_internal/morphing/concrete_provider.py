@@ -1,21 +1,37 @@
 import binascii
+import collections.abc
 import re
+import sys
 import typing
+from array import array
 from binascii import a2b_base64, b2a_base64
+from collections.abc import Mapping, Sequence
+from contextlib import suppress
 from dataclasses import replace
 from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal, InvalidOperation
 from fractions import Fraction
+from functools import partial
 from io import BytesIO
-from typing import Generic, Optional, TypeVar, Union
+from itertools import islice
+from operator import methodcaller
+from typing import Any, Callable, Generic, Literal, Optional, TypeVar, Union
 
-from ..common import Dumper, Loader
+from ..common import Dumper, Loader, TypeHint
 from ..feature_requirement import HAS_PY_311, HAS_SELF_TYPE
 from ..provider.essential import CannotProvide, Mediator
 from ..provider.loc_stack_filtering import P, create_loc_stack_checker
 from ..provider.loc_stack_tools import find_owner_with_field
 from ..provider.located_request import LocatedRequest, for_predicate
-from ..special_cases_optimization import as_is_stub
+from ..special_cases_optimization import (
+    ExactTypeCheck,
+    InputTypeFilter,
+    as_is_stub,
+    with_exact_type_check,
+    with_input_type_filter,
+    with_sequence_dumper,
+    with_sequence_loader,
+)
 from .json_schema.definitions import JSONSchema
 from .json_schema.request_cls import JSONSchemaRequest
 from .json_schema.schema_model import JSONSchemaBuiltinFormat, JSONSchemaType
@@ -112,6 +128,7 @@ class DatetimeTimestampProvider(MorphingProvider):
 
     def _make_loader(self):
         tz = self._tz
+        fromtimestamp = partial(datetime.fromtimestamp, tz=tz)
 
         def datetime_timestamp_loader(data):
             try:
@@ -126,7 +143,14 @@ class DatetimeTimestampProvider(MorphingProvider):
                     data,
                 )
 
-        return datetime_timestamp_loader
+        # all timestamps are converted at C level, loading of the failed element is repeated to raise LoadError
+        def datetime_timestamp_sequence_loader(data, result):
+            with suppress(TypeError, ValueError, OverflowError, OSError):
+                result.extend(map(fromtimestamp, data))
+                return
+            result.extend(map(datetime_timestamp_loader, islice(data, len(result), None)))
+
+        return with_sequence_loader(datetime_timestamp_sequence_loader, datetime_timestamp_loader)
 
     def provide_dumper(self, mediator: Mediator, request: DumperRequest) -> Dumper:
         return mediator.cached_call(self._make_dumper)
@@ -134,12 +158,22 @@ class DatetimeTimestampProvider(MorphingProvider):
     def _make_dumper(self):
         def datetime_timestamp_dumper(data: datetime):
             return data.timestamp()
-        return datetime_timestamp_dumper
+
+        # method is called without creating python frame, so sequences are dumped at C level
+        call_timestamp = methodcaller("timestamp")
+
+        def datetime_timestamp_sequence_dumper(data, result):
+            result.extend(map(call_timestamp, data))
+
+        return with_sequence_dumper(datetime_timestamp_sequence_dumper, datetime_timestamp_dumper)
 
     def _generate_json_schema(self, mediator: Mediator, request: JSONSchemaRequest) -> JSONSchema:
         return JSONSchema(type=JSONSchemaType.NUMBER)
 
 
+_TIMESTAMP_TYPES = frozenset([int, float])
+
+
 @for_predicate(date)
 class DateTimestampProvider(MorphingProvider):
     def _is_pydatetime(self) -> bool:
@@ -187,7 +221,18 @@ class DateTimestampProvider(MorphingProvider):
                     data,
                 )
 
-        return pydate_timestamp_loader if self._is_pydatetime() else date_timestamp_loader
+        element_loader = pydate_timestamp_loader if self._is_pydatetime() else date_timestamp_loader
+        return with_sequence_loader(self._make_sequence_loader(element_loader), element_loader)
+
+    def _make_sequence_loader(self, element_loader: Loader) -> Callable[[list[Any], list[Any]], None]:
+        def date_timestamp_sequence_loader(data, result):
+            if set(map(type, data)) <= _TIMESTAMP_TYPES:
+                with suppress(ValueError, OverflowError, OSError):
+                    result.extend(map(date.fromtimestamp, data))
+                    return
+            result.extend(map(element_loader, islice(data, len(result), None)))
+
+        return date_timestamp_sequence_loader
 
     def provide_dumper(self, mediator: Mediator, request: DumperRequest) -> Dumper:
         return mediator.cached_call(self._make_dumper)
@@ -240,6 +285,9 @@ def none_loader(data):
     raise TypeLoadError(None, data)
 
 
+with_input_type_filter(InputTypeFilter(accepted=frozenset([type(None)])), none_loader)
+
+
 @for_predicate(None)
 class NoneProvider(MorphingProvider):
     def provide_loader(self, mediator: Mediator, request: LoaderRequest) -> Loader:
@@ -312,21 +360,43 @@ class BytesIOBase64Provider(_Base64JSONSchemaMixin, MorphingProvider):
 
     def _make_dumper(self):
         def bytes_io_base64_dumper(data: BytesIO):
-            return b2a_base64(data.getvalue(), newline=False).decode("ascii")
+            with data.getbuffer() as buffer:
+                return b2a_base64(buffer, newline=False).decode("ascii")
         return bytes_io_base64_dumper
 
 
 @for_predicate(typing.IO[bytes])
 class IOBytesBase64Provider(BytesIOBase64Provider, _Base64JSONSchemaMixin, MorphingProvider):
+    def __init__(self, chunk_size: int = 3 * 2 ** 18):
+        self._chunk_size = chunk_size
+
     def provide_dumper(self, mediator: Mediator, request: DumperRequest) -> Dumper:
         return mediator.cached_call(self._make_dumper)
 
     def _make_dumper(self):
+        chunk_size = self._chunk_size
+
         def io_bytes_base64_dumper(data: typing.IO[bytes]):
             if data.seekable():
                 data.seek(0)
 
-            return b2a_base64(data.read(), newline=False).decode("ascii")
+            # stream is encoded by chunks to avoid holding the whole content several times,
+            # each encoded chunk except the last one must contain a multiple of 3 bytes to produce no padding
+            parts = []
+            tail = b""
+            while True:
+                chunk = data.read(chunk_size)
+                if not chunk:
+                    break
+                if tail:
+                    chunk = tail + chunk
+                cut = len(chunk) - len(chunk) % 3
+                with memoryview(chunk) as view:
+                    parts.append(b2a_base64(view[:cut], newline=False).decode("ascii"))
+                    tail = bytes(view[cut:])
+            if tail or not parts:
+                parts.append(b2a_base64(tail, newline=False).decode("ascii"))
+            return "".join(parts)
         return io_bytes_base64_dumper
 
 
@@ -351,6 +421,355 @@ class BytearrayBase64Provider(_Base64DumperMixin, _Base64JSONSchemaMixin, Morphi
         return bytearray_base64_loader
 
 
+@for_predicate(memoryview)
+class MemoryviewBase64Provider(_Base64DumperMixin, _Base64JSONSchemaMixin, MorphingProvider):
+    _BYTES_PROVIDER = BytesBase64Provider()
+
+    def provide_loader(self, mediator: Mediator, request: LoaderRequest) -> Loader:
+        bytes_loader = self._BYTES_PROVIDER.provide_loader(
+            mediator,
+            replace(request, loc_stack=request.loc_stack.replace_last_type(bytes)),
+        )
+
+        return mediator.cached_call(
+            self._make_loader,
+            loader=bytes_loader,
+        )
+
+    def _make_loader(self, loader: Loader):
+        def memoryview_base64_loader(data):
+            return memoryview(loader(data))
+        return memoryview_base64_loader
+
+
+if sys.version_info >= (3, 12):
+    _BUFFER_PRED: Any = collections.abc.Buffer
+else:
+    _BUFFER_PRED = ~P.ANY
+
+
+@for_predicate(_BUFFER_PRED)
+class BufferBase64Provider(_Base64DumperMixin, _Base64JSONSchemaMixin, MorphingProvider):
+    """Provider for ``collections.abc.Buffer``, loader produces ``bytes``"""
+    _BYTES_PROVIDER = BytesBase64Provider()
+
+    def provide_loader(self, mediator: Mediator, request: LoaderRequest) -> Loader:
+        return self._BYTES_PROVIDER.provide_loader(
+            mediator,
+            replace(request, loc_stack=request.loc_stack.replace_last_type(bytes)),
+        )
+
+
+def _load_raw_bytes(data):
+    if type(data) is bytes:
+        return data
+    try:
+        return bytes(memoryview(data))
+    except TypeError:
+        raise TypeLoadError(bytes, data)
+
+
+def _load_raw_bytearray(data):
+    try:
+        return bytearray(memoryview(data))
+    except TypeError:
+        raise TypeLoadError(bytes, data)
+
+
+def _load_raw_memoryview(data):
+    try:
+        return memoryview(data)
+    except TypeError:
+        raise TypeLoadError(bytes, data)
+
+
+def _load_raw_bytes_io(data):
+    try:
+        return BytesIO(memoryview(data))
+    except TypeError:
+        raise TypeLoadError(bytes, data)
+
+
+def _dump_raw_bytes_io(data: BytesIO):
+    return data.getvalue()
+
+
+def _dump_raw_io_bytes(data: typing.IO[bytes]):
+    if data.seekable():
+        data.seek(0)
+    return data.read()
+
+
+class RawBytesProvider(MorphingProvider):
+    """Provider passing binary data without base64 encoding.
+    It is intended for formats supporting binary values natively like msgpack or CBOR.
+
+    Loader accepts any object supporting buffer protocol,
+    dumper returns ``bytes``-like objects as is and reads the content of streams.
+    """
+    _CONVERTERS: Mapping[Any, tuple[Loader, Dumper]] = {
+        bytes: (_load_raw_bytes, as_is_stub),
+        bytearray: (_load_raw_bytearray, as_is_stub),
+        memoryview: (_load_raw_memoryview, as_is_stub),
+        BytesIO: (_load_raw_bytes_io, _dump_raw_bytes_io),
+        typing.IO[bytes]: (_load_raw_bytes_io, _dump_raw_io_bytes),
+    }
+
+    SUPPORTED_TYPES = tuple(_CONVERTERS)
+
+    def __init__(self, tp: TypeHint):
+        self._tp = tp
+        self._loader, self._dumper = self._CONVERTERS[tp]
+        self._loc_stack_checker = create_loc_stack_checker(tp)
+
+    def __repr__(self):
+        return f"{type(self)}(tp={self._tp})"
+
+    def provide_loader(self, mediator: Mediator, request: LoaderRequest) -> Loader:
+        return self._loader
+
+    def provide_dumper(self, mediator: Mediator, request: DumperRequest) -> Dumper:
+        return self._dumper
+
+    def _generate_json_schema(self, mediator: Mediator, request: JSONSchemaRequest) -> JSONSchema:
+        raise CannotProvide("Raw binary data has no JSON representation", is_demonstrative=True)
+
+
+def _decode_base64(data: str) -> bytes:
+    encoded = data.encode("ascii")
+    if not B64_PATTERN.fullmatch(encoded):
+        raise ValueLoadError("Bad base64 string", data)
+
+    try:
+        return a2b_base64(encoded)
+    except binascii.Error as e:
+        raise ValueLoadError(str(e), data)
+
+
+ArrayDumpFormat = Literal["list", "base64", "buffer"]
+_BUFFER_TYPES = (bytes, bytearray, memoryview)
+_ARRAY_INPUT_TYPE = Union[list, tuple, str, bytes, bytearray, memoryview]
+
+
+def _get_array_buffer(data: Any) -> Any:
+    if isinstance(data, str):
+        return _decode_base64(data)
+    if isinstance(data, _BUFFER_TYPES):
+        return data
+    raise TypeLoadError(_ARRAY_INPUT_TYPE, data)
+
+
+def _make_array_dumper(dump_as: ArrayDumpFormat, to_list: Callable[[Any], Any], to_buffer: Callable[[Any], Any]):
+    if dump_as == "list":
+        return to_list
+    if dump_as == "base64":
+        def array_base64_dumper(data):
+            return b2a_base64(to_buffer(data), newline=False).decode("ascii")
+        return array_base64_dumper
+    if dump_as == "buffer":
+        return to_buffer
+    raise ValueError(f"Unknown dump format {dump_as!r}")
+
+
+def _make_array_json_schema(dump_as: ArrayDumpFormat, item_schema: JSONSchema, ndim: Optional[int] = 1) -> JSONSchema:
+    if dump_as == "base64":
+        return JSONSchema(type=JSONSchemaType.STRING, content_encoding="base64")
+    if dump_as == "buffer":
+        raise CannotProvide("Raw buffer has no JSON representation", is_demonstrative=True)
+    if ndim is None:
+        return JSONSchema(type=JSONSchemaType.ARRAY)
+
+    schema = item_schema
+    for _ in range(ndim):
+        schema = JSONSchema(type=JSONSchemaType.ARRAY, items=schema)
+    return schema
+
+
+@for_predicate(array)
+class ArrayProvider(MorphingProvider):
+    """Provider for ``array.array``.
+
+    Loader accepts a list or a tuple of numbers, bytes-like object containing machine values
+    or base64 string of such bytes. Dumper produces a list, base64 string
+    or ``memoryview`` exposing the buffer of the array without copying.
+    """
+    _INTEGER_TYPECODES = frozenset("bBhHiIlLqQ")
+    _FLOAT_TYPECODES = frozenset("fd")
+
+    def __init__(self, typecode: Optional[str] = None, *, dump_as: ArrayDumpFormat = "list"):
+        if typecode is not None and typecode not in self._INTEGER_TYPECODES | self._FLOAT_TYPECODES:
+            raise ValueError(f"Typecode {typecode!r} is not supported")
+        self._typecode = typecode
+        self._dump_as = dump_as
+
+    def provide_loader(self, mediator: Mediator, request: LoaderRequest) -> Loader:
+        if self._typecode is None:
+            raise CannotProvide(
+                "Typecode of array is unknown, use numeric_array() to specify it",
+                is_demonstrative=True,
+            )
+        return mediator.cached_call(self._make_loader)
+
+    def _make_loader(self):
+        typecode = self._typecode
+
+        def array_loader(data):
+            if type(data) is list or type(data) is tuple:
+                try:
+                    return array(typecode, data)
+                except (TypeError, OverflowError) as e:
+                    raise ValueLoadError(str(e), data)
+
+            buffer = _get_array_buffer(data)
+            result = array(typecode)
+            try:
+                result.frombytes(memoryview(buffer).cast("B"))
+            except (TypeError, ValueError) as e:
+                raise ValueLoadError(str(e), data)
+            return result
+
+        return array_loader
+
+    def provide_dumper(self, mediator: Mediator, request: DumperRequest) -> Dumper:
+        return mediator.cached_call(self._make_dumper)
+
+    def _make_dumper(self):
+        return _make_array_dumper(self._dump_as, array.tolist, memoryview)
+
+    def _generate_json_schema(self, mediator: Mediator, request: JSONSchemaRequest) -> JSONSchema:
+        if self._typecode in self._INTEGER_TYPECODES:
+            item_schema = JSONSchema(type=JSONSchemaType.INTEGER)
+        else:
+            item_schema = JSONSchema(type=JSONSchemaType.NUMBER)
+        return _make_array_json_schema(self._dump_as, item_schema)
+
+
+class NumpyArrayProvider(MorphingProvider):
+    """Provider for ``numpy.ndarray``.
+
+    Data type and shape are taken from parameters or from the type hint
+    like ``numpy.ndarray[tuple[Literal[2], int], numpy.dtype[numpy.float64]]``
+    (``numpy.typing.NDArray[numpy.float64]`` specifies only data type).
+    Dimensions that are not ``Literal`` can have any size.
+
+    Loader accepts nested lists, bytes-like object or base64 string.
+    Bytes are wrapped by ``numpy.frombuffer`` without copying, so the data type must be known
+    and arrays loaded from immutable bytes are read-only.
+    Dumper produces nested lists, base64 string or ``memoryview`` of a C-contiguous array.
+    """
+
+    def __init__(
+        self,
+        dtype: Any = None,
+        shape: Optional[Sequence[Optional[int]]] = None,
+        *,
+        dump_as: ArrayDumpFormat = "list",
+    ):
+        import numpy  # noqa: ICN001
+
+        self._numpy = numpy
+        self._dtype = dtype
+        self._shape = None if shape is None else tuple(shape)
+        self._dump_as = dump_as
+        self._loc_stack_checker = create_loc_stack_checker(numpy.ndarray)
+
+    def _get_dtype(self, request: LocatedRequest):
+        if self._dtype is not None:
+            return self._numpy.dtype(self._dtype)
+
+        args = typing.get_args(request.last_loc.type)
+        if len(args) == 2:  # noqa: PLR2004
+            dtype_args = typing.get_args(args[1])
+            if len(dtype_args) == 1 and isinstance(dtype_args[0], type):
+                return self._numpy.dtype(dtype_args[0])
+        return None
+
+    def _get_shape(self, request: LocatedRequest) -> Optional[tuple[Optional[int], ...]]:
+        if self._shape is not None:
+            return self._shape
+
+        args = typing.get_args(request.last_loc.type)
+        if not args:
+            return None
+        shape_args = typing.get_args(args[0])
+        if typing.get_origin(args[0]) is not tuple or not shape_args or shape_args[-1] is Ellipsis:
+            return None
+        return tuple(
+            typing.get_args(dim)[0] if typing.get_origin(dim) is Literal else None
+            for dim in shape_args
+        )
+
+    def provide_loader(self, mediator: Mediator, request: LoaderRequest) -> Loader:
+        return mediator.cached_call(
+            self._make_loader,
+            dtype=self._get_dtype(request),
+            shape=self._get_shape(request),
+        )
+
+    def _make_loader(self, dtype, shape: Optional[tuple[Optional[int], ...]]):
+        np_array = self._numpy.array
+        np_frombuffer = self._numpy.frombuffer
+        buffer_shape = None
+        if shape is not None and list(shape).count(None) <= 1:
+            buffer_shape = tuple(-1 if dim is None else dim for dim in shape)
+
+        def check_shape(result, data):
+            if shape is not None and (
+                len(result.shape) != len(shape)
+                or any(
+                    expected is not None and actual != expected
+                    for actual, expected in zip(result.shape, shape)
+                )
+            ):
+                raise ValueLoadError(f"Array of shape {shape} is expected, got {result.shape}", data)
+            return result
+
+        def numpy_array_loader(data):
+            if type(data) is list or type(data) is tuple:
+                try:
+                    return check_shape(np_array(data, dtype=dtype), data)
+                except (TypeError, ValueError, OverflowError) as e:
+                    raise ValueLoadError(str(e), data)
+
+            if dtype is None:
+                raise TypeLoadError(Union[list, tuple], data)
+            buffer = _get_array_buffer(data)
+            try:
+                result = np_frombuffer(buffer, dtype=dtype)
+                if buffer_shape is not None:
+                    result = result.reshape(buffer_shape)
+            except ValueError as e:
+                raise ValueLoadError(str(e), data)
+            return check_shape(result, data)
+
+        return numpy_array_loader
+
+    def provide_dumper(self, mediator: Mediator, request: DumperRequest) -> Dumper:
+        return mediator.cached_call(self._make_dumper)
+
+    def _make_dumper(self):
+        ascontiguousarray = self._numpy.ascontiguousarray
+
+        def to_buffer(data):
+            return memoryview(ascontiguousarray(data))
+
+        return _make_array_dumper(self._dump_as, self._numpy.ndarray.tolist, to_buffer)
+
+    def _generate_json_schema(self, mediator: Mediator, request: JSONSchemaRequest) -> JSONSchema:
+        dtype = self._get_dtype(request)
+        shape = self._get_shape(request)
+        kind = None if dtype is None else dtype.kind
+        if kind == "b":
+            item_schema = JSONSchema(type=JSONSchemaType.BOOLEAN)
+        elif kind in ("i", "u"):
+            item_schema = JSONSchema(type=JSONSchemaType.INTEGER)
+        elif kind == "f":
+            item_schema = JSONSchema(type=JSONSchemaType.NUMBER)
+        else:
+            item_schema = JSONSchema()
+        return _make_array_json_schema(self._dump_as, item_schema, None if shape is None else len(shape))
+
+
 def _regex_dumper(data: re.Pattern):
     return data.pattern
 
@@ -427,6 +846,10 @@ def int_strict_coercion_loader(data):
     raise TypeLoadError(int, data)
 
 
+with_input_type_filter(InputTypeFilter(accepted=frozenset([int])), int_strict_coercion_loader)
+with_exact_type_check(ExactTypeCheck((int,), int), int_strict_coercion_loader)
+
+
 def int_lax_coercion_loader(data):
     try:
         return int(data)
@@ -454,6 +877,10 @@ def float_strict_coercion_loader(data):
     raise TypeLoadError(Union[float, int], data)
 
 
+with_input_type_filter(InputTypeFilter(accepted=frozenset([float, int])), float_strict_coercion_loader)
+with_exact_type_check(ExactTypeCheck((float, int), Union[float, int]), float_strict_coercion_loader)
+
+
 def float_lax_coercion_loader(data):
     try:
         return float(data)
@@ -481,6 +908,10 @@ def str_strict_coercion_loader(data):
     raise TypeLoadError(str, data)
 
 
+with_input_type_filter(InputTypeFilter(accepted=frozenset([str])), str_strict_coercion_loader)
+with_exact_type_check(ExactTypeCheck((str,), str), str_strict_coercion_loader)
+
+
 STR_PROVIDER = ScalarProvider(
     target=str,
     strict_coercion_loader=str_strict_coercion_loader,
@@ -496,6 +927,10 @@ def bool_strict_coercion_loader(data):
     raise TypeLoadError(bool, data)
 
 
+with_input_type_filter(InputTypeFilter(accepted=frozenset([bool])), bool_strict_coercion_loader)
+with_exact_type_check(ExactTypeCheck((bool,), bool), bool_strict_coercion_loader)
+
+
 BOOL_PROVIDER = ScalarProvider(
     target=bool,
     strict_coercion_loader=bool_strict_coercion_loader,
@@ -516,6 +951,9 @@ def decimal_strict_coercion_loader(data):
     raise TypeLoadError(Union[str, Decimal], data)
 
 
+with_input_type_filter(InputTypeFilter(accepted=frozenset([str, Decimal])), decimal_strict_coercion_loader)
+
+
 def decimal_lax_coercion_loader(data):
     try:
         return Decimal(data)
@@ -545,6 +983,9 @@ def fraction_strict_coercion_loader(data):
     raise TypeLoadError(Union[str, Fraction], data)
 
 
+with_input_type_filter(InputTypeFilter(accepted=frozenset([str, Fraction])), fraction_strict_coercion_loader)
+
+
 def fraction_lax_coercion_loader(data):
     try:
         return Fraction(data)
@@ -575,6 +1016,9 @@ def complex_strict_coercion_loader(data):
     raise TypeLoadError(Union[str, complex], data)
 
 
+with_input_type_filter(InputTypeFilter(accepted=frozenset([str, complex])), complex_strict_coercion_loader)
+
+
 def complex_lax_coercion_loader(data):
     try:
         return complex(data)
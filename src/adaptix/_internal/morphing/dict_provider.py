@@ -11,10 +11,12 @@ from ..morphing.provider_template import DumperProvider, LoaderProvider
 from ..provider.essential import Mediator
 from ..provider.located_request import LocatedRequest, for_predicate
 from ..provider.location import GenericParamLoc
+from ..special_cases_optimization import with_json_chunks_dumper
 from ..struct_trail import ItemKey, append_trail, render_trail_as_note
 from ..type_tools import BaseNormType
-from .load_error import AggregateLoadError, LoadError, TypeLoadError
-from .request_cls import DebugTrailRequest, DumperRequest, LoaderRequest
+from .json_stream import make_dict_json_chunks_dumper
+from .load_error import AggregateLoadError, LoadError, TypeLoadError, render_truncation_note
+from .request_cls import DebugTrailRequest, DumperRequest, LoaderRequest, MaxErrorsRequest
 from .utils import try_normalize_type
 
 CollectionsMapping = collections.abc.Mapping
@@ -45,20 +47,30 @@ class DictProvider(LoaderProvider, DumperProvider):
         debug_trail = mediator.mandatory_provide(
             DebugTrailRequest(loc_stack=request.loc_stack),
         )
+        max_errors = mediator.mandatory_provide(
+            MaxErrorsRequest(loc_stack=request.loc_stack),
+        )
         return mediator.cached_call(
             self._make_loader,
             key_loader=key_loader,
             value_loader=value_loader,
             debug_trail=debug_trail,
+            max_errors=max_errors,
         )
 
-    def _make_loader(self, key_loader: Loader, value_loader: Loader, debug_trail: DebugTrail):
+    def _make_loader(
+        self,
+        key_loader: Loader,
+        value_loader: Loader,
+        debug_trail: DebugTrail,
+        max_errors: Optional[int],
+    ):
         if debug_trail == DebugTrail.DISABLE:
             return self._get_loader_dt_disable(key_loader, value_loader)
         if debug_trail == DebugTrail.FIRST:
             return self._get_loader_dt_first(key_loader, value_loader)
         if debug_trail == DebugTrail.ALL:
-            return self._get_loader_dt_all(key_loader, value_loader)
+            return self._get_loader_dt_all(key_loader, value_loader, max_errors)
         raise ValueError
 
     def _get_loader_dt_disable(self, key_loader: Loader, value_loader: Loader):
@@ -103,7 +115,24 @@ class DictProvider(LoaderProvider, DumperProvider):
 
         return dict_loader_dt_first
 
-    def _get_loader_dt_all(self, key_loader: Loader, value_loader: Loader):  # noqa: C901
+    def _make_errors_group(self, errors: list[Exception], *, is_truncated: bool) -> Exception:
+        exc: Exception
+        load_errors = tuple(e for e in errors if isinstance(e, LoadError))
+        if len(load_errors) == len(errors):
+            exc = AggregateLoadError(
+                f"while loading {dict}",
+                tuple(render_trail_as_note(e) for e in load_errors),
+            )
+        else:
+            exc = CompatExceptionGroup(
+                f"while loading {dict}",
+                [render_trail_as_note(e) for e in errors],
+            )
+        if is_truncated:
+            render_truncation_note(exc, len(errors))
+        return exc
+
+    def _get_loader_dt_all(self, key_loader: Loader, value_loader: Loader, max_errors: Optional[int]):
         def dict_loader_dt_all(data):
             try:
                 items_method = data.items
@@ -112,37 +141,30 @@ class DictProvider(LoaderProvider, DumperProvider):
 
             result = {}
             errors = []
-            has_unexpected_error = False
+            is_truncated = False
             for k, v in items_method():
+                if max_errors is not None and len(errors) >= max_errors:
+                    is_truncated = True
+                    break
                 try:
                     loaded_key = key_loader(k)
-                except LoadError as e:
-                    errors.append(append_trail(e, ItemKey(k)))
                 except Exception as e:
                     errors.append(append_trail(e, ItemKey(k)))
-                    has_unexpected_error = True
 
                 try:
                     loaded_value = value_loader(v)
-                except LoadError as e:
-                    errors.append(append_trail(e, k))
                 except Exception as e:
                     errors.append(append_trail(e, k))
-                    has_unexpected_error = True
 
                 if not errors:
                     result[loaded_key] = loaded_value
 
             if errors:
-                if has_unexpected_error:
-                    raise CompatExceptionGroup(
-                        f"while loading {dict}",
-                        [render_trail_as_note(e) for e in errors],
-                    )
-                raise AggregateLoadError(
-                    f"while loading {dict}",
-                    [render_trail_as_note(e) for e in errors],
-                )
+                if max_errors is not None and len(errors) > max_errors:
+                    # both key and value of the last item are invalid
+                    del errors[max_errors:]
+                    is_truncated = True
+                raise self._make_errors_group(errors, is_truncated=is_truncated)
             return result
 
         return dict_loader_dt_all
@@ -169,6 +191,12 @@ class DictProvider(LoaderProvider, DumperProvider):
         )
 
     def _make_dumper(self, key_dumper: Dumper, value_dumper: Dumper, debug_trail: DebugTrail):
+        return with_json_chunks_dumper(
+            make_dict_json_chunks_dumper(key_dumper, value_dumper, debug_trail),
+            self._make_plain_dumper(key_dumper, value_dumper, debug_trail),
+        )
+
+    def _make_plain_dumper(self, key_dumper: Dumper, value_dumper: Dumper, debug_trail: DebugTrail):
         if debug_trail == DebugTrail.DISABLE:
             return self._get_dumper_dt_disable(
                 key_dumper=key_dumper,
@@ -0,0 +1,147 @@
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Callable, Generic, Optional, TypeVar, Union
+
+from ...common import Loader, TypeHint
+from ...compat import CompatExceptionGroup
+from ...definitions import DebugTrail
+from ...struct_trail import append_trail, render_trail_as_note
+from ..load_error import AggregateLoadError, LoadError, render_truncation_note
+
+T = TypeVar("T")
+
+
+@dataclass
+class BatchLoadResult(Generic[T]):
+    """Result of batch loading that collects errors instead of raising them.
+
+    :param values: Loaded values by index of the source record
+    :param errors: Errors by index of the source record
+    """
+    values: Mapping[int, T]
+    errors: Mapping[int, Exception]
+
+
+BatchLoader = Callable[[Iterable[Any]], list[T]]
+CollectingBatchLoader = Callable[[Iterable[Any]], BatchLoadResult[T]]
+
+
+def _make_dt_disable_batch_loader(loader: Loader[T]) -> BatchLoader[T]:
+    def batch_loader(data):
+        return list(map(loader, data))
+
+    return batch_loader
+
+
+def _make_dt_first_batch_loader(loader: Loader[T]) -> BatchLoader[T]:
+    def batch_loader_dt_first(data):
+        result = []
+        append = result.append
+        for idx, element in enumerate(data):
+            try:
+                append(loader(element))
+            except Exception as e:
+                render_trail_as_note(append_trail(e, idx))
+                raise
+        return result
+
+    return batch_loader_dt_first
+
+
+def _make_dt_all_batch_loader(loader: Loader[T], tp: TypeHint, max_errors: Optional[int]) -> BatchLoader[T]:
+    def batch_loader_dt_all(data):
+        result = []
+        append = result.append
+        errors = []
+        has_unexpected_error = False
+        is_truncated = False
+
+        for idx, element in enumerate(data):
+            if len(errors) == max_errors:
+                is_truncated = True
+                break
+            try:
+                append(loader(element))
+            except LoadError as e:
+                errors.append(append_trail(e, idx))
+            except Exception as e:
+                errors.append(append_trail(e, idx))
+                has_unexpected_error = True
+
+        if errors:
+            if has_unexpected_error:
+                exc = CompatExceptionGroup(
+                    f"while loading batch of {tp}",
+                    [render_trail_as_note(e) for e in errors],
+                )
+            else:
+                exc = AggregateLoadError(
+                    f"while loading batch of {tp}",
+                    [render_trail_as_note(e) for e in errors],
+                )
+            if is_truncated:
+                render_truncation_note(exc, len(errors))
+            raise exc
+        return result
+
+    return batch_loader_dt_all
+
+
+def make_batch_loader(
+    loader: Loader[T],
+    tp: TypeHint,
+    debug_trail: DebugTrail,
+    max_errors: Optional[int] = None,
+) -> BatchLoader[T]:
+    if debug_trail == DebugTrail.DISABLE:
+        return _make_dt_disable_batch_loader(loader)
+    if debug_trail == DebugTrail.FIRST:
+        return _make_dt_first_batch_loader(loader)
+    if debug_trail == DebugTrail.ALL:
+        return _make_dt_all_batch_loader(loader, tp, max_errors)
+    raise ValueError
+
+
+def make_collecting_batch_loader(loader: Loader[T]) -> CollectingBatchLoader[T]:
+    def collecting_batch_loader(data):
+        values = {}
+        errors = {}
+
+        for idx, element in enumerate(data):
+            try:
+                values[idx] = loader(element)
+            except Exception as e:
+                errors[idx] = render_trail_as_note(e)
+
+        return BatchLoadResult(values=values, errors=errors)
+
+    return collecting_batch_loader
+
+
+def iter_load_records(loader: Loader[T], records: Iterable[Any], debug_trail: DebugTrail) -> Iterator[T]:
+    if debug_trail == DebugTrail.DISABLE:
+        yield from map(loader, records)
+        return
+
+    for idx, record in enumerate(records):
+        try:
+            yield loader(record)
+        except Exception as e:
+            render_trail_as_note(append_trail(e, idx))
+            raise
+
+
+def iter_parsed_lines(lines: Iterable[Union[str, bytes]], parser: Callable[[Union[str, bytes]], Any]) -> Iterator[Any]:
+    for line in lines:
+        if line.strip():
+            yield parser(line)
+
+
+def iter_chunks(iterable: Iterable[T], chunk_size: int) -> Iterator[list[T]]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
@@ -0,0 +1,583 @@
+import ast
+import builtins
+import copy
+import importlib.metadata
+import linecache
+import math
+import pkgutil
+import re
+import sys
+import textwrap
+import types
+from collections.abc import Iterable, Mapping
+from contextlib import suppress
+from copyreg import __newobj__, __newobj_ex__  # type: ignore[attr-defined]
+from importlib import import_module
+from operator import getitem
+from typing import Any, Callable, Optional, Union
+
+from ...common import Dumper, Loader, TypeHint
+from ...retort.operating_retort import FuncWrapper
+
+
+def get_adaptix_version() -> Optional[str]:
+    try:
+        return importlib.metadata.version("adaptix")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+_HEADER_TEMPLATE = """\
+# This module is generated by adaptix Retort.freeze().
+# Do not edit it, regenerate it after any change of models, the retort, adaptix or Python versions.
+# It imports private modules of adaptix, so it is valid only for the adaptix version that produced it.
+import sys
+from importlib.metadata import PackageNotFoundError, version
+
+
+def _get_adaptix_version():
+    try:
+        return version("adaptix")
+    except PackageNotFoundError:
+        return None
+
+
+if sys.version_info[:2] != {python_version!r} or _get_adaptix_version() != {adaptix_version!r}:
+    raise ImportError(
+        "This module was generated by {adaptix_description} on Python {python_version_str},"
+        " you have to regenerate it via Retort.freeze()",
+    )
+"""
+
+_SET_CELL_HELPER = """\
+def _set_cell(func, name, value):
+    func.__closure__[func.__code__.co_freevars.index(name)].cell_contents = value
+"""
+
+_LINK_HELPER = """\
+class _Link:
+    # it calls the function that is created after the link
+    __slots__ = ("__call__",)
+"""
+
+_SET_STATE_HELPER = """\
+def _set_state(obj, state):
+    if hasattr(obj, "__setstate__"):
+        obj.__setstate__(state)
+        return
+    slot_state = None
+    if isinstance(state, tuple) and len(state) == 2:
+        state, slot_state = state
+    if state:
+        obj.__dict__.update(state)
+    if slot_state:
+        for key, value in slot_state.items():
+            setattr(obj, key, value)
+"""
+
+_FOOTER = """\
+def get_loader(tp):
+    try:
+        return loaders[tp]
+    except KeyError:
+        raise KeyError(f"Loader for {tp!r} was not frozen") from None
+
+
+def get_dumper(tp):
+    try:
+        return dumpers[tp]
+    except KeyError:
+        raise KeyError(f"Dumper for {tp!r} was not frozen") from None
+
+
+def load(data, tp, /):
+    return get_loader(tp)(data)
+
+
+def dump(data, tp=None, /):
+    return get_dumper(type(data) if tp is None else tp)(data)
+"""
+
+_RESERVED_NAMES = frozenset(
+    {
+        "sys", "version", "PackageNotFoundError", "_get_adaptix_version", "_Link", "_set_cell", "_set_state",
+        "loaders", "dumpers", "get_loader", "get_dumper", "load", "dump",
+    },
+)
+_MAX_SIGNATURE_LENGTH = 100
+_LITERAL_TYPES = (bool, int, str, bytes, complex)
+_SINGLETON_TYPES = {type(None): "type(None)", type(...): "type(...)", type(NotImplemented): "type(NotImplemented)"}
+
+
+def _get_arg_names(args: ast.arguments) -> set[str]:
+    return {
+        arg.arg
+        for arg in [*args.posonlyargs, *args.args, *args.kwonlyargs, args.vararg, args.kwarg]
+        if arg is not None
+    }
+
+
+def _get_code_arg_names(code: types.CodeType) -> set[str]:
+    count = (
+        code.co_argcount
+        + code.co_kwonlyargcount
+        + bool(code.co_flags & 0x04)  # CO_VARARGS
+        + bool(code.co_flags & 0x08)  # CO_VARKEYWORDS
+    )
+    return set(code.co_varnames[:count])
+
+
+def _iter_code_names(code: types.CodeType) -> Iterable[str]:
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _iter_code_names(const)
+
+
+def _strip_def_time_expressions(node: Union[ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda]) -> ast.AST:
+    # decorators, annotations and defaults are evaluated at definition time,
+    # decorators are already applied to the function and defaults are restored separately
+    node = copy.deepcopy(node)
+    if not isinstance(node, ast.Lambda):
+        node.decorator_list = []
+        node.returns = None
+    args = node.args
+    for arg in [*args.posonlyargs, *args.args, *args.kwonlyargs, args.vararg, args.kwarg]:
+        if arg is not None:
+            arg.annotation = None
+    args.defaults = [ast.Constant(None) for _ in args.defaults]
+    args.kw_defaults = [None if default is None else ast.Constant(None) for default in args.kw_defaults]
+    return node
+
+
+def _has_def_time_expressions(node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> bool:
+    args = node.args
+    return bool(
+        node.decorator_list
+        or node.returns
+        or args.defaults
+        or any(args.kw_defaults)
+        or any(
+            arg.annotation
+            for arg in [*args.posonlyargs, *args.args, *args.kwonlyargs, args.vararg, args.kwarg]
+            if arg is not None
+        ),
+    )
+
+
+def _import_public_modules() -> None:
+    import adaptix
+
+    for module_info in pkgutil.iter_modules(adaptix.__path__, "adaptix."):
+        if not module_info.name.startswith("adaptix._"):
+            # some modules require optional dependencies
+            with suppress(ImportError):
+                import_module(module_info.name)
+
+
+class _ModuleRenderer:
+    """Renders objects as Python source re-creating them.
+
+    Functions are re-created from their source code by factories receiving closure variables and used globals.
+    Importable objects are imported, other objects are re-created by their ``__reduce_ex__`` result as pickle does.
+    Closure cells and object states referencing an object that is still being created are set later.
+    """
+
+    def __init__(self) -> None:
+        self._imports: dict[tuple[str, str], str] = {}
+        self._module_imports: dict[str, str] = {}
+        self._helpers: list[str] = []
+        self._statements: list[str] = []
+        self._names: dict[int, str] = {}
+        self._pending: dict[int, list[Callable[[str], str]]] = {}
+        self._links: dict[int, str] = {}
+        self._used_names: set[str] = set(_RESERVED_NAMES) | set(dir(builtins))
+        # objects are kept alive to prevent reusing of their ids
+        self._kept_objects: list[Any] = []
+        self._trees: dict[str, tuple[str, ast.Module]] = {}
+        self._adaptix_locations: Optional[dict[int, tuple[str, str]]] = None
+
+    def render_module(self, loaders: Mapping[TypeHint, Loader], dumpers: Mapping[TypeHint, Dumper]) -> str:
+        loaders_expr = self._render_items_dict(loaders)
+        dumpers_expr = self._render_items_dict(dumpers)
+        adaptix_version = get_adaptix_version()
+        header = _HEADER_TEMPLATE.format(
+            python_version=tuple(sys.version_info[:2]),
+            python_version_str=".".join(map(str, sys.version_info[:2])),
+            adaptix_version=adaptix_version,
+            adaptix_description=(
+                "a development version of adaptix" if adaptix_version is None else f"adaptix {adaptix_version}"
+            ),
+        )
+        parts = [
+            header,
+            self._render_imports(),
+            *self._helpers,
+            "\n".join(self._statements),
+            f"loaders = {loaders_expr}\ndumpers = {dumpers_expr}",
+            _FOOTER,
+        ]
+        return "\n\n".join(part.strip("\n") for part in parts if part) + "\n"
+
+    def _render_imports(self) -> str:
+        lines = [
+            f"import {module}" if module == local_name else f"import {module} as {local_name}"
+            for module, local_name in sorted(self._module_imports.items())
+        ]
+        lines.extend(
+            f"from {module} import {name}" if name == local_name else f"from {module} import {name} as {local_name}"
+            for (module, name), local_name in sorted(self._imports.items())
+        )
+        return "\n".join(lines)
+
+    def _render_items_dict(self, mapping: Mapping[Any, Any]) -> str:
+        if not mapping:
+            return "{}"
+        items = "".join(f"    {self.render(key)}: {self.render(value)},\n" for key, value in mapping.items())
+        return f"{{\n{items}}}"
+
+    def render(self, obj: Any) -> str:
+        obj = self._unwrap(obj)
+        literal = self._render_literal(obj)
+        if literal is not None:
+            return literal
+        if id(obj) in self._names:
+            return self._names[id(obj)]
+        if id(obj) in self._pending:
+            if type(obj) is types.FunctionType:
+                return self._render_link(obj)
+            raise TypeError(f"Cannot freeze {obj!r}, it is created from a reference to itself")
+        if type(obj) is types.ModuleType:
+            return self._import_module(obj.__name__)
+
+        location = self._find_location(obj)
+        if location is not None:
+            return self._import(*location)
+
+        self._kept_objects.append(obj)
+        self._pending[id(obj)] = []
+        return self._render_new_object(obj)
+
+    def _unwrap(self, obj: Any) -> Any:
+        # wrappers are used to resolve recursive types, the frozen module references functions directly
+        while type(obj) is FuncWrapper:
+            obj = obj.__call__
+        return obj
+
+    def _render_link(self, func: types.FunctionType) -> str:
+        # function is referenced while it is being created and reference can not be patched later
+        if id(func) in self._links:
+            return self._links[id(func)]
+        self._add_helper(_LINK_HELPER)
+        name = self._allocate_name("_link")
+        self._statements.append(f"{name} = _Link()")
+        self._links[id(func)] = name
+        self._pending[id(func)].append(lambda func_name: f"{name}.__call__ = {func_name}")
+        return name
+
+    def _render_literal(self, obj: Any) -> Optional[str]:
+        obj_type = type(obj)
+        if obj is None or obj is ... or obj_type in _LITERAL_TYPES:
+            return repr(obj)
+        if obj_type is type and obj in _SINGLETON_TYPES:
+            return _SINGLETON_TYPES[obj]
+        if obj_type is float:
+            return repr(obj) if math.isfinite(obj) else f"float({str(obj)!r})"
+        if obj_type is tuple:
+            return f"({', '.join(map(self.render, obj))}{',' if len(obj) == 1 else ''})"
+        if obj_type is frozenset:
+            return f"frozenset({{{self._render_set_items(obj)}}})" if obj else "frozenset()"
+        return None
+
+    def _render_new_object(self, obj: Any) -> str:
+        obj_type = type(obj)
+        if obj_type is types.FunctionType:
+            return self._render_function(obj)
+        if obj_type in (list, set, dict):
+            return self._define(obj, self._allocate_name("_v"), self._render_container(obj))
+        if obj_type is types.MappingProxyType:
+            return self._define(
+                obj,
+                self._allocate_name("_v"),
+                f"{self._import('types', 'MappingProxyType')}({self.render(dict(obj))})",
+            )
+        if obj_type is types.GenericAlias and obj.__args__:
+            return self._define_inline(obj, self._render_subscription(obj.__origin__, obj.__args__))
+        return self._render_reduced(obj)
+
+    def _render_container(self, obj: Union[list, set, dict]) -> str:
+        if isinstance(obj, list):
+            return f"[{', '.join(map(self.render, obj))}]"
+        if isinstance(obj, set):
+            return f"{{{self._render_set_items(obj)}}}" if obj else "set()"
+        return "{" + ", ".join(f"{self.render(key)}: {self.render(value)}" for key, value in obj.items()) + "}"
+
+    def _render_set_items(self, obj: Iterable[Any]) -> str:
+        return ", ".join(sorted(map(self.render, obj)))
+
+    def _render_subscription(self, origin: Any, args: Any) -> str:
+        if type(args) is tuple and args:
+            return f"{self.render(origin)}[{', '.join(map(self.render, args))}]"
+        return f"{self.render(origin)}[{self.render(args)}]"
+
+    def _allocate_name(self, base: str) -> str:
+        base = re.sub(r"\W", "_", base)
+        if not base or base[0].isdigit():
+            base = "_" + base
+        name = base
+        idx = 2
+        while name in self._used_names:
+            name = f"{base}_{idx}"
+            idx += 1
+        self._used_names.add(name)
+        return name
+
+    def _add_helper(self, helper: str) -> None:
+        if helper not in self._helpers:
+            self._helpers.append(helper)
+
+    def _define(self, obj: Any, name: str, expr: str) -> str:
+        self._statements.append(f"{name} = {expr}")
+        return self._define_inline(obj, name)
+
+    def _define_inline(self, obj: Any, expr: str) -> str:
+        # expression is repeated at each usage, so it is used only for objects whose identity does not matter
+        self._names[id(obj)] = expr
+        for make_statement in self._pending.pop(id(obj)):
+            self._statements.append(make_statement(expr))
+        return expr
+
+    def _render_or_defer(self, value: Any, make_statement: Callable[[str], str]) -> str:
+        value = self._unwrap(value)
+        if id(value) in self._pending:
+            self._pending[id(value)].append(make_statement)
+            return "None"
+        return self.render(value)
+
+    def _import_module(self, module: str) -> str:
+        if module not in self._module_imports:
+            self._module_imports[module] = self._allocate_name(module)
+        return self._module_imports[module]
+
+    def _import(self, module: str, qualname: str) -> str:
+        first, *rest = qualname.split(".")
+        if module == "builtins":
+            local_name = first
+        else:
+            key = (module, first)
+            if key not in self._imports:
+                self._imports[key] = self._allocate_name(first)
+            local_name = self._imports[key]
+        return ".".join([local_name, *rest])
+
+    def _get_adaptix_locations(self) -> Mapping[int, tuple[str, str]]:
+        if self._adaptix_locations is None:
+            _import_public_modules()
+            # public modules are visited first to prefer public names over private ones
+            modules = sorted(
+                (
+                    (name, module)
+                    for name, module in list(sys.modules.items())
+                    if name == "adaptix" or name.startswith("adaptix.")
+                ),
+                key=lambda item: ("._internal" in item[0], len(item[0]), item[0]),
+            )
+            locations: dict[int, tuple[str, str]] = {}
+            for module_name, module in modules:
+                for attr, value in vars(module).items():
+                    if not attr.startswith("__") and not isinstance(value, (types.ModuleType, *_LITERAL_TYPES)):
+                        locations.setdefault(id(value), (module_name, attr))
+            self._adaptix_locations = locations
+        return self._adaptix_locations
+
+    def _find_location(self, obj: Any) -> Optional[tuple[str, str]]:
+        adaptix_location = self._get_adaptix_locations().get(id(obj))
+        module_name = getattr(obj, "__module__", None)
+        qualname = getattr(obj, "__qualname__", None)
+        if (
+            isinstance(module_name, str)
+            and isinstance(qualname, str)
+            and self._resolve_qualname(module_name, qualname) is obj
+            and not (module_name.startswith("adaptix._internal") and adaptix_location is not None)
+        ):
+            return module_name, qualname
+        return adaptix_location
+
+    def _resolve_qualname(self, module_name: str, qualname: str) -> Any:
+        value: Any = sys.modules.get(module_name)
+        for part in qualname.split("."):
+            value = getattr(value, part, None)
+        return value
+
+    def _render_reduced(self, obj: Any) -> str:
+        try:
+            reduced = obj.__reduce_ex__(4)
+        except Exception as e:
+            raise TypeError(f"Cannot freeze {obj!r}, it can not be imported and does not support pickling") from e
+        if isinstance(reduced, str):
+            module_name = getattr(obj, "__module__", None)
+            if module_name is None or self._resolve_qualname(module_name, reduced) is not obj:
+                raise TypeError(f"Cannot freeze {obj!r}, it can not be imported")
+            return self._define_inline(obj, self._import(module_name, reduced))
+
+        self._kept_objects.append(reduced)
+        func, args, state, list_items, dict_items, state_setter = (*reduced, None, None, None, None)[:6]
+        if (func is getattr or func is getitem) and (state, list_items, dict_items) == (None, None, None):
+            return self._define_inline(obj, self._render_call(func, args))
+
+        name = self._allocate_name("_" + type(obj).__name__.lstrip("_").lower())
+        self._define(obj, name, self._render_call(func, args))
+        if list_items is not None:
+            self._statements.append(f"{name}.extend([{', '.join(map(self.render, list_items))}])")
+        if dict_items is not None:
+            self._statements.append(f"{name}.update({self._render_container(dict(dict_items))})")
+        if state_setter is not None:
+            self._statements.append(f"{self.render(state_setter)}({name}, {self._render_state(state)})")
+        elif state is not None:
+            self._add_helper(_SET_STATE_HELPER)
+            self._statements.append(f"_set_state({name}, {self._render_state(state)})")
+        return name
+
+    def _render_call(self, func: Any, args: tuple[Any, ...]) -> str:
+        if func is __newobj__:
+            cls, *cls_args = args
+            rendered_cls = self.render(cls)
+            return f"{rendered_cls}.__new__({', '.join([rendered_cls, *map(self.render, cls_args)])})"
+        if func is __newobj_ex__:
+            cls, cls_args, cls_kwargs = args
+            rendered_cls = self.render(cls)
+            rendered_args = [
+                rendered_cls,
+                *map(self.render, cls_args),
+                *(f"**{{{self.render(key)}: {self.render(value)}}}" for key, value in cls_kwargs.items()),
+            ]
+            return f"{rendered_cls}.__new__({', '.join(rendered_args)})"
+        if func is getattr and isinstance(args[1], str) and args[1].isidentifier():
+            return f"{self.render(args[0])}.{args[1]}"
+        if func is getitem:
+            return self._render_subscription(*args)
+        return f"{self.render(func)}({', '.join(map(self.render, args))})"
+
+    def _render_state(self, state: Any) -> str:
+        # state is a temporary object, so its containers are rendered inplace
+        if type(state) is dict:
+            return self._render_container(state)
+        if type(state) is tuple:
+            return f"({', '.join(map(self._render_state, state))}{',' if len(state) == 1 else ''})"
+        return self.render(state)
+
+    def _get_tree(self, filename: str) -> tuple[str, ast.Module]:
+        if filename not in self._trees:
+            source = "".join(linecache.getlines(filename))
+            self._trees[filename] = (source, ast.parse(source) if source else ast.Module(body=[], type_ignores=[]))
+        return self._trees[filename]
+
+    def _find_function_node(self, func: types.FunctionType) -> tuple[str, ast.AST]:
+        code = func.__code__
+        source, tree = self._get_tree(code.co_filename)
+        candidates: list[ast.AST]
+        if code.co_name == "<lambda>":
+            candidates = [
+                node
+                for node in ast.walk(tree)
+                if (
+                    isinstance(node, ast.Lambda)
+                    and node.lineno == code.co_firstlineno
+                    and _get_arg_names(node.args) == _get_code_arg_names(code)
+                )
+            ]
+        else:
+            candidates = [
+                node
+                for node in ast.walk(tree)
+                if (
+                    isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+                    and node.name == code.co_name
+                    and min([node.lineno, *(decorator.lineno for decorator in node.decorator_list)])
+                    == code.co_firstlineno
+                )
+            ]
+        if len(candidates) != 1:
+            raise TypeError(
+                f"Cannot freeze function {func.__qualname__!r}, its source code can not be found unambiguously",
+            )
+        return source, candidates[0]
+
+    def _get_function_source(self, source: str, node: ast.AST) -> tuple[str, Optional[str]]:
+        """Returns source of the function definition and the name it defines.
+        For lambdas, source of the expression and None are returned.
+        """
+        if isinstance(node, ast.Lambda):
+            return ast.unparse(_strip_def_time_expressions(node)), None
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            raise TypeError(f"Unexpected node {node!r}")
+
+        if not _has_def_time_expressions(node):
+            # original text is used to keep comments of generated code
+            segment = ast.get_source_segment(source, node, padded=True)
+            if segment is not None:
+                def_source = textwrap.dedent(segment)
+                with suppress(SyntaxError):
+                    ast.parse(def_source)
+                    return def_source, node.name
+        return ast.unparse(_strip_def_time_expressions(node)), node.name
+
+    def _get_function_arguments(self, func: types.FunctionType, name: str) -> dict[str, str]:
+        """Renders closure variables and used globals of the function.
+        They are passed to the factory making them closure variables of the re-created function.
+        """
+
+        def make_cell_setter(var_name):
+            def make_statement(value_name):
+                self._add_helper(_SET_CELL_HELPER)
+                return f"_set_cell({name}, {var_name!r}, {value_name})"
+
+            return make_statement
+
+        arguments = {}
+        for var_name, cell in zip(func.__code__.co_freevars, func.__closure__ or ()):
+            try:
+                value = cell.cell_contents
+            except ValueError:
+                arguments[var_name] = "None"
+            else:
+                arguments[var_name] = self._render_or_defer(value, make_cell_setter(var_name))
+        for var_name in dict.fromkeys(_iter_code_names(func.__code__)):
+            if var_name not in arguments and var_name != "__builtins__" and var_name in func.__globals__:
+                arguments[var_name] = self._render_or_defer(func.__globals__[var_name], make_cell_setter(var_name))
+        return arguments
+
+    def _render_function(self, func: types.FunctionType) -> str:
+        source, node = self._find_function_node(func)
+        def_source, def_name = self._get_function_source(source, node)
+        name = self._allocate_name(func.__name__ if def_name else "_lambda")
+        arguments = self._get_function_arguments(func, name)
+
+        if not arguments and def_name is None:
+            self._define(func, name, def_source)
+        elif not arguments and def_name == name:
+            self._statements.append(f"\n\n{def_source.rstrip()}\n\n")
+            self._define_inline(func, name)
+        else:
+            factory_name = self._allocate_name(f"_make_{name}")
+            signature = ", ".join(arguments)
+            if len(signature) > _MAX_SIGNATURE_LENGTH:
+                signature = "".join(f"\n    {var_name}," for var_name in arguments) + "\n"
+            if def_name is None:
+                body = f"    return {def_source}"
+            else:
+                body = textwrap.indent(def_source.rstrip(), "    ") + f"\n    return {def_name}"
+            self._statements.append(f"\n\ndef {factory_name}({signature}):\n{body}\n\n")
+            call_arguments = "".join(f"    {var_name}={value},\n" for var_name, value in arguments.items())
+            self._define(func, name, f"{factory_name}(\n{call_arguments})" if call_arguments else f"{factory_name}()")
+
+        # function attributes are omitted, they keep only metadata used while loaders and dumpers are produced
+        if func.__defaults__ is not None:
+            self._statements.append(f"{name}.__defaults__ = {self.render(func.__defaults__)}")
+        if func.__kwdefaults__ is not None:
+            self._statements.append(f"{name}.__kwdefaults__ = {self.render(func.__kwdefaults__)}")
+        return name
+
+
+def render_frozen_module(loaders: Mapping[TypeHint, Loader], dumpers: Mapping[TypeHint, Dumper]) -> str:
+    return _ModuleRenderer().render_module(loaders, dumpers)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import os
 from collections.abc import Iterable, Mapping
-from datetime import timezone
+from datetime import date, datetime, time, timezone
 from enum import Enum, EnumMeta
+from ipaddress import IPv4Address, IPv4Interface, IPv4Network, IPv6Address, IPv6Interface, IPv6Network
 from types import MappingProxyType
 from typing import Any, Callable, Optional, TypeVar, Union
+from uuid import UUID
 
+from ...code_tools.compiler import DiskCachingClosureCompiler
 from ...common import Catchable, Dumper, Loader, TypeHint, VarTuple
 from ...model_tools.definitions import Default, DescriptorAccessor, NoDefault, OutputField
 from ...model_tools.introspection.callable import get_callable_shape
@@ -22,12 +26,20 @@ from ...provider.loc_stack_filtering import (
     create_loc_stack_checker,
 )
 from ...provider.overlay_schema import OverlayProvider
-from ...provider.provider_wrapper import Chain, ChainingProvider
+from ...provider.provider_wrapper import Chain, ChainingProvider, ConcatProvider
 from ...provider.shape_provider import PropertyExtender
 from ...provider.value_provider import ValueProvider
 from ...special_cases_optimization import as_is_stub
 from ...utils import Omittable, Omitted
-from ..concrete_provider import DatetimeFormatProvider, DateTimestampProvider, DatetimeTimestampProvider
+from ..concrete_provider import (
+    ArrayDumpFormat,
+    ArrayProvider,
+    DatetimeFormatProvider,
+    DateTimestampProvider,
+    DatetimeTimestampProvider,
+    NumpyArrayProvider,
+    RawBytesProvider,
+)
 from ..dict_provider import DefaultDictProvider
 from ..enum_provider import (
     ByNameEnumMappingGenerator,
@@ -38,6 +50,9 @@ from ..enum_provider import (
     FlagByListProvider,
 )
 from ..load_error import LoadError, ValidationLoadError
+from ..memoizing_provider import MemoizingLoaderProvider
+from ..model.basic_gen import ClosureCompilerRequest, InliningDepthRequest
+from ..model.lazy_loader_provider import LazyModelLoaderProvider
 from ..model.loader_provider import InlinedShapeModelLoaderProvider
 from ..name_layout.base import ExtraIn, ExtraOut
 from ..name_layout.component import ExtraMoveAndPoliciesOverlay, SievesOverlay, StructureOverlay
@@ -475,3 +490,130 @@ def date_by_timestamp(pred: Pred = P.ANY) -> Provider:
     """
     return bound(pred, DateTimestampProvider())
 
+
+def raw_bytes(pred: Pred = P.ANY) -> Provider:
+    """Provider that loads and dumps binary types without base64 encoding.
+    It is useful for formats supporting binary values natively, like msgpack or CBOR.
+
+    Loader of ``bytes``, ``bytearray``, ``memoryview``, ``BytesIO`` and ``IO[bytes]``
+    accepts any object supporting buffer protocol.
+    Dumper returns ``bytes``, ``bytearray`` and ``memoryview`` as is and ``bytes`` for streams.
+
+    :param pred: Predicate specifying where the provider should be used.
+        See :ref:`predicate-system` for details.
+    """
+    return bound(pred, ConcatProvider(*(RawBytesProvider(tp) for tp in RawBytesProvider.SUPPORTED_TYPES)))
+
+
+def numeric_array(pred: Pred = P.ANY, *, typecode: str, dump_as: ArrayDumpFormat = "list") -> Provider:
+    """Provider that can load/dump ``array.array`` of the specified typecode.
+
+    Loader accepts a list of numbers, bytes-like object or base64 string of machine values.
+
+    :param pred: Predicate specifying where the provider should be used.
+        See :ref:`predicate-system` for details.
+    :param typecode: Typecode of the array, only numeric typecodes are supported.
+    :param dump_as: Output representation: ``"list"`` of numbers,
+        ``"base64"`` string of machine values or ``"buffer"`` that is ``memoryview`` of the array.
+    """
+    return bound(pred, ArrayProvider(typecode, dump_as=dump_as))
+
+
+def numpy_array(
+    pred: Pred = P.ANY,
+    *,
+    dtype: Any = None,
+    shape: Optional[Iterable[Optional[int]]] = None,
+    dump_as: ArrayDumpFormat = "list",
+) -> Provider:
+    """Provider that can load/dump ``numpy.ndarray``. Requires ``numpy`` to be installed.
+
+    Loader accepts nested lists, bytes-like object or base64 string of machine values.
+    Bytes are wrapped without copying, so arrays loaded from ``bytes`` are read-only.
+
+    :param pred: Predicate specifying where the provider should be used.
+        See :ref:`predicate-system` for details.
+    :param dtype: Data type of the array. By default, it is taken from the type hint like
+        ``numpy.typing.NDArray[numpy.float64]``.
+        Loading from bytes-like objects requires known data type.
+    :param shape: Expected shape of the array, ``None`` marks dimension of any size.
+        By default, it is taken from the type hint like ``numpy.ndarray[tuple[Literal[3], int], ...]``.
+    :param dump_as: Output representation: nested ``"list"``,
+        ``"base64"`` string of machine values or ``"buffer"`` that is ``memoryview`` of the array.
+    """
+    return bound(pred, NumpyArrayProvider(dtype, None if shape is None else tuple(shape), dump_as=dump_as))
+
+
+def compilation_cache(pred: Pred = P.ANY, *, directory: Union[str, os.PathLike]) -> Provider:
+    """Provider that stores code of generated model loaders and dumpers at the directory
+    and reuses it at subsequent processes to skip compilation.
+
+    Entries are addressed by the hash of generated source,
+    so changes of models or of the recipe never lead to reusing outdated code.
+    The directory can be shared between several processes.
+
+    :param pred: Predicate specifying where the provider should be used.
+        See :ref:`predicate-system` for details.
+    :param directory: Directory to store compiled code. It is created on the first write.
+    """
+    return bound(pred, ValueProvider(ClosureCompilerRequest, DiskCachingClosureCompiler(directory)))
+
+
+def inline_nested_models(pred: Pred = P.ANY, *, max_depth: int = 3) -> Provider:
+    """Provider that inlines generated code of nested model loaders and dumpers
+    into the code of the enclosing model loader or dumper.
+
+    Loaders and dumpers of fields that are nested models or optional nested models are not called,
+    their bodies are copied into the body of the parent, saving a function call
+    and error handling per nesting level. Produced data and raised errors are the same.
+    Fields with loaders or dumpers replaced by other providers are not inlined.
+
+    :param pred: Predicate specifying where the provider should be used.
+        It is matched against the enclosing model.
+        See :ref:`predicate-system` for details.
+    :param max_depth: Maximum count of nested model levels merged into one function.
+        Levels are counted from the outermost model, deeper levels are called as usual.
+    """
+    return bound(pred, ValueProvider(InliningDepthRequest, max_depth))
+
+
+def lazy_loading(*preds: Pred) -> Provider:
+    """Provider that creates loaders of dataclasses and attrs classes
+    deferring loading of nested models and collections until the first access to the attribute.
+
+    The loader checks the top-level structure and loads other fields as usual.
+    Data of deferred fields is kept as-is, so errors inside it are raised at the attribute access.
+    The instance is created via a subclass of the model that pretends to be the original class,
+    it is equal to the eagerly loaded instance and it is pickled as the instance of the original class.
+    Nested models are loaded lazily only if the predicate matches them too.
+
+    :param preds: Predicates specifying where the provider should be used.
+        See :ref:`predicate-system` for details.
+    :return: Desired provider
+    """
+    return bound_by_any(preds, LazyModelLoaderProvider())
+
+
+MEMOIZABLE_TYPES = (
+    datetime, date, time,
+    UUID,
+    IPv4Address, IPv6Address,
+    IPv4Network, IPv6Network,
+    IPv4Interface, IPv6Interface,
+)
+
+
+def memoized_loader(*preds: Pred, maxsize: Optional[int] = 1024) -> Provider:
+    """Provider that caches results of loaders by input string, so repeated strings are parsed only once.
+    By default, it is applied to ``datetime``, ``date``, ``time``, ``UUID`` and IP address types.
+    At loading of lists and columns, each unique string of the sequence is parsed once
+    regardless of the cache.
+
+    Loaded values are shared between calls, so do not pass predicates matching mutable types.
+
+    :param preds: Predicates specifying where the provider should be used.
+        See :ref:`predicate-system` for details.
+    :param maxsize: Maximum number of cached values per loader, ``None`` means unbounded cache
+    :return: Desired provider
+    """
+    return bound_by_any(preds or MEMOIZABLE_TYPES, MemoizingLoaderProvider(maxsize))
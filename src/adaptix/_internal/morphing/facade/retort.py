@@ -1,22 +1,28 @@
+import os
 from abc import ABC
-from collections.abc import ByteString, Iterable, Mapping, MutableMapping  # noqa: PYI057
+from collections.abc import ByteString, Iterable, Iterator, Mapping, MutableMapping, Sequence  # noqa: PYI057
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, time
 from ipaddress import IPv4Address, IPv4Interface, IPv4Network, IPv6Address, IPv6Interface, IPv6Network
 from itertools import chain
 from pathlib import Path, PosixPath, PurePath, PurePosixPath, PureWindowsPath, WindowsPath
-from typing import Any, Optional, TypeVar, overload
+from typing import IO, Any, Callable, Literal, Optional, TypeVar, Union, overload
 from uuid import UUID
 
 from ...common import Dumper, Loader, TypeHint, VarTuple
+from ...datastructures import SingleFlightDict
 from ...definitions import DebugTrail
 from ...provider.essential import Provider, Request
 from ...provider.loc_stack_filtering import LocStack, P
 from ...provider.location import TypeHintLoc
 from ...provider.shape_provider import BUILTIN_SHAPE_PROVIDER
 from ...provider.value_provider import ValueProvider
+from ...retort.build_profiler import BuildProfiler
 from ...retort.operating_retort import OperatingRetort
+from ...special_cases_optimization import is_model_loader
 from ...struct_trail import render_trail_as_note
 from ...type_tools.basic_utils import is_generic_class
+from ...type_tools.normalize_type import NormalizationCache
 from ..concrete_provider import (
     BOOL_PROVIDER,
     COMPLEX_PROVIDER,
@@ -25,12 +31,15 @@ from ..concrete_provider import (
     FRACTION_PROVIDER,
     INT_PROVIDER,
     STR_PROVIDER,
+    ArrayProvider,
+    BufferBase64Provider,
     BytearrayBase64Provider,
     BytesBase64Provider,
     BytesIOBase64Provider,
     IOBytesBase64Provider,
     IsoFormatProvider,
     LiteralStringProvider,
+    MemoryviewBase64Provider,
     NoneProvider,
     RegexPatternProvider,
     SecondsTimedeltaProvider,
@@ -47,14 +56,35 @@ from ..generic_provider import (
     UnionProvider,
 )
 from ..iterable_provider import IterableProvider
+from ..json_stream import iter_json_bytes, iter_json_text, make_json_chunks_dumper
+from ..model.columns_provider import (
+    ColumnsDumper,
+    ColumnsDumperRequest,
+    ColumnsLoader,
+    ColumnsLoaderRequest,
+    ModelColumnsProvider,
+)
 from ..model.crown_definitions import ExtraSkip
 from ..model.dumper_provider import ModelDumperProvider
 from ..model.loader_provider import ModelLoaderProvider
+from ..model.projected_loader_provider import ProjectedModelLoaderProvider
 from ..name_layout.component import BuiltinExtraMoveAndPoliciesMaker, BuiltinSievesMaker, BuiltinStructureMaker
 from ..name_layout.name_mapping import SkipPrivateFieldsNameMappingProvider
 from ..name_layout.provider import BuiltinNameLayoutProvider
 from ..provider_template import ABCProxy
-from ..request_cls import DebugTrailRequest, DumperRequest, LoaderRequest, StrictCoercionRequest
+from ..request_cls import DebugTrailRequest, DumperRequest, LoaderRequest, MaxErrorsRequest, StrictCoercionRequest
+from ..runtime_profiler import RuntimeProfiler, RuntimeProfilingProvider
+from .batch import (
+    BatchLoader,
+    BatchLoadResult,
+    CollectingBatchLoader,
+    iter_chunks,
+    iter_load_records,
+    iter_parsed_lines,
+    make_batch_loader,
+    make_collecting_batch_loader,
+)
+from .freezing import render_frozen_module
 from .provider import as_is_dumper, as_is_loader, dumper, enum_by_exact_value, flag_by_exact_value, loader, name_mapping
 
 
@@ -89,6 +119,9 @@ class FilledRetort(OperatingRetort, ABC):
         BytesIOBase64Provider(),
         IOBytesBase64Provider(),
         BytearrayBase64Provider(),
+        MemoryviewBase64Provider(),
+        BufferBase64Provider(),
+        ArrayProvider(),
 
         *chain.from_iterable(
             (
@@ -151,6 +184,7 @@ class FilledRetort(OperatingRetort, ABC):
         ),
         ModelLoaderProvider(),
         ModelDumperProvider(),
+        ModelColumnsProvider(),
 
         BUILTIN_SHAPE_PROVIDER,
 
@@ -175,15 +209,34 @@ class AdornedRetort(OperatingRetort):
         strict_coercion: bool = True,
         debug_trail: DebugTrail = DebugTrail.ALL,
         hide_traceback: bool = True,
+        normalization_cache: Optional[NormalizationCache] = None,
+        build_profiler: Optional[BuildProfiler] = None,
+        runtime_profiler: Optional[RuntimeProfiler] = None,
+        max_errors: Optional[int] = None,
     ):
+        if max_errors is not None and max_errors < 1:
+            raise ValueError("max_errors must be positive")
         self._strict_coercion = strict_coercion
         self._debug_trail = debug_trail
-        super().__init__(recipe=recipe, hide_traceback=hide_traceback)
+        self._runtime_profiler = runtime_profiler
+        self._max_errors = max_errors
+        super().__init__(
+            recipe=recipe,
+            hide_traceback=hide_traceback,
+            normalization_cache=normalization_cache,
+            build_profiler=build_profiler,
+        )
 
     def _calculate_derived(self):
         super()._calculate_derived()
-        self._loader_cache = {}
-        self._dumper_cache = {}
+        self._raw_loader_cache: SingleFlightDict[TypeHint, Loader] = SingleFlightDict()
+        self._loader_cache: SingleFlightDict[TypeHint, Loader] = SingleFlightDict()
+        self._projected_loader_cache: SingleFlightDict[tuple[TypeHint, frozenset[str]], Loader] = SingleFlightDict()
+        self._raw_dumper_cache: SingleFlightDict[TypeHint, Dumper] = SingleFlightDict()
+        self._dumper_cache: SingleFlightDict[TypeHint, Dumper] = SingleFlightDict()
+        self._batch_loader_cache: SingleFlightDict[tuple[TypeHint, bool], Callable] = SingleFlightDict()
+        self._columns_loader_cache: SingleFlightDict[TypeHint, ColumnsLoader] = SingleFlightDict()
+        self._columns_dumper_cache: SingleFlightDict[TypeHint, ColumnsDumper] = SingleFlightDict()
 
     def replace(
         self: AR,
@@ -191,7 +244,13 @@ class AdornedRetort(OperatingRetort):
         strict_coercion: Optional[bool] = None,
         debug_trail: Optional[DebugTrail] = None,
         hide_traceback: Optional[bool] = None,
+        normalization_cache: Optional[NormalizationCache] = None,
+        build_profiler: Optional[BuildProfiler] = None,
+        runtime_profiler: Optional[RuntimeProfiler] = None,
+        max_errors: Optional[int] = None,
     ) -> AR:
+        if max_errors is not None and max_errors < 1:
+            raise ValueError("max_errors must be positive")
         with self._clone() as clone:
             if strict_coercion is not None:
                 clone._strict_coercion = strict_coercion
@@ -199,6 +258,14 @@ class AdornedRetort(OperatingRetort):
                 clone._debug_trail = debug_trail
             if hide_traceback is not None:
                 clone._hide_traceback = hide_traceback
+            if normalization_cache is not None:
+                clone._normalization_cache = normalization_cache
+            if build_profiler is not None:
+                clone._build_profiler = build_profiler
+            if runtime_profiler is not None:
+                clone._runtime_profiler = runtime_profiler
+            if max_errors is not None:
+                clone._max_errors = max_errors
         return clone
 
     def extend(self: AR, *, recipe: Iterable[Provider]) -> AR:
@@ -209,26 +276,68 @@ class AdornedRetort(OperatingRetort):
 
         return clone
 
+    def _get_recipe_head(self) -> Sequence[Provider]:
+        if self._runtime_profiler is None:
+            return super()._get_recipe_head()
+        return (
+            RuntimeProfilingProvider(self._runtime_profiler),
+            *super()._get_recipe_head(),
+        )
+
     def _get_recipe_tail(self) -> VarTuple[Provider]:
         return (
             ValueProvider(StrictCoercionRequest, self._strict_coercion),
             ValueProvider(DebugTrailRequest, self._debug_trail),
+            ValueProvider(MaxErrorsRequest, self._max_errors),
         )
 
-    def get_loader(self, tp: type[T]) -> Loader[T]:
+    def get_loader(self, tp: type[T], *, only: Optional[Iterable[str]] = None) -> Loader[T]:
+        """Create a function loading the type.
+
+        If ``only`` is passed, the type must be a model loaded by the builtin model loader provider
+        (a loader of the model itself must not be overridden by the recipe).
+        The loader processes only fields with these ids, other parts of the data are ignored.
+        Skipped optional fields get default values.
+        Skipped required fields are not set (for dataclasses and attrs classes only),
+        so access to them raises ``AttributeError``.
+        In this case the instance is created bypassing ``__init__``.
+        """
+        if only is not None:
+            return self._get_projected_loader(tp, frozenset(only))
         try:
             return self._loader_cache[tp]
         except KeyError:
             pass
-        loader_ = self._make_loader(tp)
-        self._loader_cache[tp] = loader_
-        return loader_
+        return self._loader_cache.get_or_compute(tp, self._make_loader, tp)
 
-    def _make_loader(self, tp: type[T]) -> Loader[T]:
-        loader_ = self._facade_provide(
+    def _get_projected_loader(self, tp: type[T], only: frozenset[str]) -> Loader[T]:
+        try:
+            return self._projected_loader_cache[(tp, only)]
+        except KeyError:
+            pass
+        return self._projected_loader_cache.get_or_compute((tp, only), self._make_projected_loader, tp, only)
+
+    def _make_projected_loader(self, tp: type[T], only: frozenset[str]) -> Loader[T]:
+        projected_loader = self.extend(recipe=[ProjectedModelLoaderProvider(only)])._make_loader(tp)
+        if not is_model_loader(self._get_raw_loader(tp)):
+            raise ValueError(f"Loader of {tp!r} is overridden by the recipe, so the type cannot be loaded partially")
+        return projected_loader
+
+    def _get_raw_loader(self, tp: type[T]) -> Loader[T]:
+        try:
+            return self._raw_loader_cache[tp]
+        except KeyError:
+            pass
+        return self._raw_loader_cache.get_or_compute(tp, self._provide_loader, tp)
+
+    def _provide_loader(self, tp: type[T]) -> Loader[T]:
+        return self._facade_provide(
             LoaderRequest(loc_stack=LocStack(TypeHintLoc(type=tp))),
             error_message=f"Cannot produce loader for type {tp!r}",
         )
+
+    def _make_loader(self, tp: type[T]) -> Loader[T]:
+        loader_ = self._get_raw_loader(tp)
         if self._debug_trail == DebugTrail.FIRST:
             def trail_rendering_wrapper(data):
                 try:
@@ -241,20 +350,118 @@ class AdornedRetort(OperatingRetort):
 
         return loader_
 
+    @overload
+    def get_batch_loader(self, tp: type[T], *, collect_errors: Literal[False] = False) -> BatchLoader[T]:
+        ...
+
+    @overload
+    def get_batch_loader(self, tp: type[T], *, collect_errors: Literal[True]) -> CollectingBatchLoader[T]:
+        ...
+
+    @overload
+    def get_batch_loader(self, tp: TypeHint, *, collect_errors: bool = False) -> Callable[[Iterable[Any]], Any]:
+        ...
+
+    def get_batch_loader(self, tp: TypeHint, *, collect_errors: bool = False):
+        """Create a function loading each record of the iterable. It returns a list of loaded values.
+
+        If ``collect_errors`` is enabled, the function does not raise errors of records,
+        it returns :class:`BatchLoadResult` containing loaded values and errors by index of the record.
+        """
+        try:
+            return self._batch_loader_cache[(tp, collect_errors)]
+        except KeyError:
+            pass
+        return self._batch_loader_cache.get_or_compute(
+            (tp, collect_errors), self._make_batch_loader, tp, collect_errors=collect_errors,
+        )
+
+    def _make_batch_loader(self, tp: TypeHint, *, collect_errors: bool):
+        loader_ = self._get_raw_loader(tp)
+        if collect_errors:
+            return make_collecting_batch_loader(loader_)
+        return make_batch_loader(loader_, tp, self._debug_trail, self._max_errors)
+
+    def get_columns_loader(self, tp: type[T]) -> ColumnsLoader[T]:
+        """Create a function loading column-oriented data to a list of model instances.
+
+        The function takes a mapping of keys to columns (iterables of field values of the same length).
+        Each column is loaded at once, so this is faster than loading each record separately.
+        Only models mapped to a flat dict without extra data are supported.
+        """
+        try:
+            return self._columns_loader_cache[tp]
+        except KeyError:
+            pass
+        return self._columns_loader_cache.get_or_compute(tp, self._make_columns_loader, tp)
+
+    def _make_columns_loader(self, tp: type[T]) -> ColumnsLoader[T]:
+        columns_loader = self._facade_provide(
+            ColumnsLoaderRequest(loc_stack=LocStack(TypeHintLoc(type=tp))),
+            error_message=f"Cannot produce columns loader for type {tp!r}",
+        )
+        if self._debug_trail == DebugTrail.FIRST:
+            def trail_rendering_wrapper(data):
+                try:
+                    return columns_loader(data)
+                except Exception as e:
+                    render_trail_as_note(e)
+                    raise
+
+            return trail_rendering_wrapper
+
+        return columns_loader
+
+    def get_columns_dumper(self, tp: type[T]) -> ColumnsDumper[T]:
+        """Create a function dumping an iterable of model instances to a dict of columns.
+
+        Only models mapped to a flat dict without extra data and omitted fields are supported.
+        """
+        try:
+            return self._columns_dumper_cache[tp]
+        except KeyError:
+            pass
+        return self._columns_dumper_cache.get_or_compute(tp, self._make_columns_dumper, tp)
+
+    def _make_columns_dumper(self, tp: type[T]) -> ColumnsDumper[T]:
+        columns_dumper = self._facade_provide(
+            ColumnsDumperRequest(loc_stack=LocStack(TypeHintLoc(type=tp))),
+            error_message=f"Cannot produce columns dumper for type {tp!r}",
+        )
+        if self._debug_trail == DebugTrail.FIRST:
+            def trail_rendering_wrapper(data):
+                try:
+                    return columns_dumper(data)
+                except Exception as e:
+                    render_trail_as_note(e)
+                    raise
+
+            return trail_rendering_wrapper
+
+        return columns_dumper
+
     def get_dumper(self, tp: type[T]) -> Dumper[T]:
         try:
             return self._dumper_cache[tp]
         except KeyError:
             pass
-        dumper_ = self._make_dumper(tp)
-        self._dumper_cache[tp] = dumper_
-        return dumper_
+        return self._dumper_cache.get_or_compute(tp, self._make_dumper, tp)
 
-    def _make_dumper(self, tp: type[T]) -> Dumper[T]:
-        dumper_ = self._facade_provide(
+    def _get_raw_dumper(self, tp: type[T]) -> Dumper[T]:
+        try:
+            return self._raw_dumper_cache[tp]
+        except KeyError:
+            pass
+        return self._raw_dumper_cache.get_or_compute(tp, self._provide_dumper, tp)
+
+    def _provide_dumper(self, tp: type[T]) -> Dumper[T]:
+        return self._facade_provide(
             DumperRequest(loc_stack=LocStack(TypeHintLoc(type=tp))),
             error_message=f"Cannot produce dumper for type {tp!r}",
         )
+
+    def _make_dumper(self, tp: type[T]) -> Dumper[T]:
+        dumper_ = self._get_raw_dumper(tp)
         if self._debug_trail == DebugTrail.FIRST:
             def trail_rendering_wrapper(data):
                 try:
@@ -267,6 +474,74 @@ class AdornedRetort(OperatingRetort):
 
         return dumper_
 
+    def freeze(
+        self,
+        tps: Iterable[TypeHint],
+        *,
+        path: Union[str, os.PathLike],
+        loaders: bool = True,
+        dumpers: bool = True,
+    ) -> None:
+        """Create loaders and dumpers for the passed types and write them to the Python module.
+
+        Importing this module gives ready-to-use loaders and dumpers
+        without any provider search, type introspection and code generation.
+        The module exposes ``loaders`` and ``dumpers`` dicts
+        and ``get_loader``, ``get_dumper``, ``load`` and ``dump`` functions.
+
+        The module can be imported only by the same Python and adaptix versions
+        and must be regenerated after any change of the retort or models.
+        Objects without a public name are imported from private modules of adaptix,
+        so the module is valid only for the exact adaptix version that produced it.
+
+        :param tps: Types to freeze
+        :param path: Path of the module to write
+        :param loaders: Include loaders
+        :param dumpers: Include dumpers
+        """
+        tps = tuple(tps)
+        source = render_frozen_module(
+            loaders={tp: self.get_loader(tp) for tp in tps} if loaders else {},
+            dumpers={tp: self.get_dumper(tp) for tp in tps} if dumpers else {},
+        )
+        Path(path).write_text(source, encoding="utf-8")
+
+    def warmup(
+        self,
+        tps: Iterable[TypeHint],
+        *,
+        loaders: bool = True,
+        dumpers: bool = True,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Create and cache loaders and dumpers for the passed types in advance.
+
+        Each loader and dumper is created only once even if other threads request it at the same time.
+        If several of them can not be created, the error of the first one (in order of passed types) is raised.
+
+        :param tps: Types to warm up
+        :param loaders: Create loaders
+        :param dumpers: Create dumpers
+        :param parallel: Create loaders and dumpers at a thread pool
+        :param max_workers: Maximum number of threads, it is passed to ``ThreadPoolExecutor``
+        """
+        tasks = [
+            (getter, tp)
+            for tp in tps
+            for getter, enabled in ((self.get_loader, loaders), (self.get_dumper, dumpers))
+            if enabled
+        ]
+        if not parallel:
+            for getter, tp in tasks:
+                getter(tp)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(getter, tp) for getter, tp in tasks]
+        for future in futures:
+            future.result()
+
     @overload
     def load(self, data: Any, tp: type[T], /) -> T:
         ...
@@ -278,6 +553,86 @@ class AdornedRetort(OperatingRetort):
     def load(self, data: Any, tp: TypeHint, /):
         return self.get_loader(tp)(data)
 
+    @overload
+    def load_many(self, data: Iterable[Any], tp: type[T], /, *, collect_errors: Literal[False] = False) -> list[T]:
+        ...
+
+    @overload
+    def load_many(self, data: Iterable[Any], tp: type[T], /, *, collect_errors: Literal[True]) -> BatchLoadResult[T]:
+        ...
+
+    @overload
+    def load_many(self, data: Iterable[Any], tp: TypeHint, /, *, collect_errors: bool = False) -> Any:
+        ...
+
+    def load_many(self, data: Iterable[Any], tp: TypeHint, /, *, collect_errors: bool = False):
+        return self.get_batch_loader(tp, collect_errors=collect_errors)(data)
+
+    @overload
+    def iter_load(
+        self,
+        source: Iterable[Any],
+        tp: type[T],
+        /,
+        *,
+        parser: Optional[Callable[[Any], Any]] = None,
+        chunk_size: None = None,
+    ) -> Iterator[T]:
+        ...
+
+    @overload
+    def iter_load(
+        self,
+        source: Iterable[Any],
+        tp: type[T],
+        /,
+        *,
+        parser: Optional[Callable[[Any], Any]] = None,
+        chunk_size: int,
+    ) -> Iterator[list[T]]:
+        ...
+
+    @overload
+    def iter_load(
+        self,
+        source: Iterable[Any],
+        tp: TypeHint,
+        /,
+        *,
+        parser: Optional[Callable[[Any], Any]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[Any]:
+        ...
+
+    def iter_load(
+        self,
+        source: Iterable[Any],
+        tp: TypeHint,
+        /,
+        *,
+        parser: Optional[Callable[[Any], Any]] = None,
+        chunk_size: Optional[int] = None,
+    ):
+        """Lazily load records of the source. Only one record (or one chunk) is held in memory at once.
+
+        :param source: Iterable of records. If parser is passed,
+            it is an iterable of lines, e.g. a file with JSON lines opened in text or binary mode
+        :param tp: Type of each record
+        :param parser: Function parsing a line to a record, e.g. ``json.loads``. Blank lines are skipped
+        :param chunk_size: If passed, lists of at most ``chunk_size`` loaded records are produced
+        """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        records = source if parser is None else iter_parsed_lines(source, parser)
+        values = iter_load_records(self._get_raw_loader(tp), records, self._debug_trail)
+        if chunk_size is None:
+            return values
+        return iter_chunks(values, chunk_size)
+
+    def load_columns(self, data: Mapping[str, Iterable[Any]], tp: type[T], /) -> list[T]:
+        return self.get_columns_loader(tp)(data)
+
     @overload
     def dump(self, data: T, tp: type[T], /) -> Any:
         ...
@@ -287,14 +642,114 @@ class AdornedRetort(OperatingRetort):
         ...
 
     def dump(self, data: Any, tp: Optional[TypeHint] = None, /) -> Any:
-        if tp is None:
-            tp = type(data)
-            if is_generic_class(tp):
-                raise ValueError(
-                    f"Can not infer the actual type of generic class instance ({tp!r}),"
-                    " you have to explicitly pass the type of object",
-                )
-        return self.get_dumper(tp)(data)
+        return self.get_dumper(self._infer_dumped_type(data, tp))(data)
+
+    def dump_columns(self, data: Iterable[T], tp: type[T], /) -> dict[str, list[Any]]:
+        return self.get_columns_dumper(tp)(data)
+
+    def _infer_dumped_type(self, data: Any, tp: Optional[TypeHint]) -> TypeHint:
+        if tp is not None:
+            return tp
+        tp = type(data)
+        if is_generic_class(tp):
+            raise ValueError(
+                f"Can not infer the actual type of generic class instance ({tp!r}),"
+                " you have to explicitly pass the type of object",
+            )
+        return tp
+
+    def _iter_json_chunks(self, data: Any, tp: TypeHint) -> Iterator[str]:
+        json_chunks_dumper = make_json_chunks_dumper(self._get_raw_dumper(tp))
+        if self._debug_trail == DebugTrail.DISABLE:
+            yield from json_chunks_dumper(data)
+            return
+
+        try:
+            yield from json_chunks_dumper(data)
+        except Exception as e:
+            render_trail_as_note(e)
+            raise
+
+    def iter_dump_json(
+        self,
+        data: Any,
+        tp: Optional[TypeHint] = None,
+        /,
+        *,
+        buffer_size: int = 2 ** 16,
+    ) -> Iterator[bytes]:
+        """Dump data to JSON producing UTF-8 encoded text by blocks.
+        The result is the same as encoding the output of :meth:`dump` with compact separators
+        and ``ensure_ascii=False``, but the whole dumped structure is never built in memory.
+
+        Models, iterables and dicts processed by builtin providers are emitted element by element,
+        output of other loaders (including user-defined ones) is encoded at once.
+        Dumping stops at the first error even if ``debug_trail`` is ``DebugTrail.ALL``,
+        the trail of the error is rendered as note like for ``DebugTrail.FIRST``.
+
+        :param data: Data to dump
+        :param tp: Type of data, it is inferred from data if omitted
+        :param buffer_size: Approximate count of characters in each produced block
+        """
+        return iter_json_bytes(self._iter_json_text(data, tp, buffer_size))
+
+    @overload
+    def dump_json(
+        self,
+        data: Any,
+        tp: Optional[TypeHint] = None,
+        /,
+        *,
+        fp: IO[str],
+        binary: Literal[False] = False,
+        buffer_size: int = 2 ** 16,
+    ) -> None:
+        ...
+
+    @overload
+    def dump_json(
+        self,
+        data: Any,
+        tp: Optional[TypeHint] = None,
+        /,
+        *,
+        fp: IO[bytes],
+        binary: Literal[True],
+        buffer_size: int = 2 ** 16,
+    ) -> None:
+        ...
+
+    def dump_json(
+        self,
+        data: Any,
+        tp: Optional[TypeHint] = None,
+        /,
+        *,
+        fp: IO[Any],
+        binary: bool = False,
+        buffer_size: int = 2 ** 16,
+    ) -> None:
+        """Dump data to JSON writing it to the file-like object by blocks.
+        See :meth:`iter_dump_json` for details.
+
+        :param data: Data to dump
+        :param tp: Type of data, it is inferred from data if omitted
+        :param fp: File-like object to write to
+        :param binary: Write UTF-8 encoded ``bytes`` instead of ``str``, it is required for binary streams
+        :param buffer_size: Approximate count of characters in each written block
+        """
+        blocks = self._iter_json_text(data, tp, buffer_size)
+        if binary:
+            for binary_block in iter_json_bytes(blocks):
+                fp.write(binary_block)
+        else:
+            for block in blocks:
+                fp.write(block)
+
+    def _iter_json_text(self, data: Any, tp: Optional[TypeHint], buffer_size: int) -> Iterator[str]:
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be positive")
+        return iter_json_text(self._iter_json_chunks(data, self._infer_dumped_type(data, tp)), buffer_size)
 
 
 class Retort(FilledRetort, AdornedRetort):
@@ -1,10 +1,10 @@
 import collections.abc
-from collections.abc import Collection, Iterable, Mapping, Sequence
+from collections.abc import Collection, Iterable, Mapping, Sequence, Set
 from dataclasses import dataclass
 from enum import Enum
 from os import PathLike
 from pathlib import Path
-from typing import Any, Literal, Optional, TypeVar, Union
+from typing import Any, Callable, Literal, Optional, TypeVar, Union
 
 from ..common import Dumper, Loader, TypeHint
 from ..compat import CompatExceptionGroup
@@ -14,7 +14,13 @@ from ..provider.essential import CannotProvide, Mediator
 from ..provider.loc_stack_filtering import LocStack
 from ..provider.located_request import LocatedRequestDelegatingProvider, LocatedRequestT, for_predicate
 from ..provider.location import GenericParamLoc, TypeHintLoc
-from ..special_cases_optimization import as_is_stub
+from ..special_cases_optimization import (
+    OptionalWrapping,
+    as_is_stub,
+    get_input_type_filter,
+    get_required_keys,
+    with_optional_wrapping,
+)
 from ..type_tools import BaseNormType, NormTypeAlias, is_new_type, is_subclass_soft, strip_tags
 from ..utils import MappingHashWrapper
 from .load_error import BadVariantLoadError, LoadError, TypeLoadError, UnionLoadError
@@ -378,20 +384,140 @@ class UnionProvider(LoaderProvider, DumperProvider):
             lambda: "Cannot create loader for union. Loaders for some union cases cannot be created",
         )
         if debug_trail == DebugTrail.DISABLE:
-            return mediator.cached_call(self._get_loader_dt_disable, tuple(loaders))
+            trial_loader = mediator.cached_call(self._get_loader_dt_disable, tuple(loaders))
+        elif debug_trail == DebugTrail.FIRST:
+            trial_loader = mediator.cached_call(self._get_loader_dt_first, norm.source, tuple(loaders))
+        elif debug_trail == DebugTrail.ALL:
+            trial_loader = mediator.cached_call(self._get_loader_dt_all, norm.source, tuple(loaders))
+        else:
+            raise ValueError
+        return mediator.cached_call(
+            self._get_dispatching_loader, norm.source, debug_trail, tuple(loaders), trial_loader,
+        )
+
+    def _get_dispatching_loader(
+        self,
+        tp: TypeHint,
+        debug_trail: DebugTrail,
+        loaders: Sequence[Loader],
+        trial_loader: Loader,
+    ) -> Loader:
+        """Creates a loader that calls only loaders that can accept the type of data.
+        If all of them fail, errors of skipped loaders are added to produce the same error as without dispatching.
+        """
+        input_type_filters = [get_input_type_filter(loader) for loader in loaders]
+        if all(input_type_filter is None for input_type_filter in input_type_filters):
+            return trial_loader
+
+        loaders_required_keys = [get_required_keys(loader) for loader in loaders]
+        dispatch_table: dict[type, Sequence[tuple[int, Loader, Optional[Set[str]]]]] = {}
+
+        def get_candidates(data):
+            data_type = type(data)
+            try:
+                return dispatch_table[data_type]
+            except KeyError:
+                pass
+
+            is_mapping = issubclass(data_type, collections.abc.Mapping)
+            candidates = dispatch_table[data_type] = [
+                (idx, loader, required_keys if is_mapping else None)
+                for idx, (loader, input_type_filter, required_keys)
+                in enumerate(zip(loaders, input_type_filters, loaders_required_keys))
+                if input_type_filter is None or input_type_filter.may_accept(data_type)
+            ]
+            return candidates
+
+        if debug_trail == DebugTrail.DISABLE:
+            return self._get_dispatching_loader_dt_disable(get_candidates)
         if debug_trail == DebugTrail.FIRST:
-            return mediator.cached_call(self._get_loader_dt_first, norm.source, tuple(loaders))
+            return self._get_dispatching_loader_dt_first(tp, loaders, get_candidates)
         if debug_trail == DebugTrail.ALL:
-            return mediator.cached_call(self._get_loader_dt_all, norm.source, tuple(loaders))
+            return self._get_dispatching_loader_dt_all(tp, loaders, get_candidates)
         raise ValueError
 
+    def _get_dispatching_loader_dt_disable(self, get_candidates: Callable[[Any], Iterable]) -> Loader:
+        def union_loader_dispatching(data):
+            for _, loader, required_keys in get_candidates(data):
+                if required_keys is not None and not data.keys() >= required_keys:
+                    continue
+                try:
+                    return loader(data)
+                except LoadError:
+                    pass
+            raise LoadError
+
+        return union_loader_dispatching
+
+    def _get_dispatching_loader_dt_first(
+        self,
+        tp: TypeHint,
+        loaders: Sequence[Loader],
+        get_candidates: Callable[[Any], Iterable],
+    ) -> Loader:
+        def union_loader_dispatching_dt_first(data):
+            errors: list[Optional[Exception]] = [None] * len(loaders)
+            for idx, loader, required_keys in get_candidates(data):
+                if required_keys is not None and not data.keys() >= required_keys:
+                    continue
+                try:
+                    return loader(data)
+                except LoadError as e:
+                    errors[idx] = e
+
+            # skipped loaders surely raise LoadError, they are called only to get this error
+            for idx, loader in enumerate(loaders):
+                if errors[idx] is None:
+                    try:
+                        return loader(data)
+                    except LoadError as e:
+                        errors[idx] = e
+            raise UnionLoadError(f"while loading {tp}", errors)
+
+        return union_loader_dispatching_dt_first
+
+    def _get_dispatching_loader_dt_all(
+        self,
+        tp: TypeHint,
+        loaders: Sequence[Loader],
+        get_candidates: Callable[[Any], Iterable],
+    ) -> Loader:
+        def union_loader_dispatching_dt_all(data):
+            errors: list[Optional[Exception]] = [None] * len(loaders)
+            for idx, loader, required_keys in get_candidates(data):
+                if required_keys is not None and not data.keys() >= required_keys:
+                    continue
+                try:
+                    return loader(data)
+                except LoadError as e:
+                    errors[idx] = e
+                except Exception as e:
+                    errors[idx] = e
+                    break
+
+            # errors of all loaders are collected like at the loader without dispatching,
+            # skipped loaders surely raise LoadError, they are called only to get this error
+            for idx, loader in enumerate(loaders):
+                if errors[idx] is None:
+                    try:
+                        loader(data)
+                    except Exception as e:
+                        errors[idx] = e
+
+            collected_errors = [error for error in errors if error is not None]
+            if all(isinstance(error, LoadError) for error in collected_errors):
+                raise UnionLoadError(f"while loading {tp}", collected_errors)
+            raise CompatExceptionGroup(f"while loading {tp}", collected_errors)
+
+        return union_loader_dispatching_dt_all
+
     def _single_optional_dt_disable_loader(self, loader: Loader) -> Loader:
         def optional_dt_disable_loader(data):
             if data is None:
                 return None
             return loader(data)
 
-        return optional_dt_disable_loader
+        return with_optional_wrapping(OptionalWrapping(loader), optional_dt_disable_loader)
 
     def _single_optional_dt_loader(self, tp, loader: Loader) -> Loader:
         def optional_dt_loader(data):
@@ -402,7 +528,10 @@ class UnionProvider(LoaderProvider, DumperProvider):
             except LoadError as e:
                 raise UnionLoadError(f"while loading {tp}", [TypeLoadError(None, data), e])
 
-        return optional_dt_loader
+        return with_optional_wrapping(
+            OptionalWrapping(loader, union_error_message=f"while loading {tp}"),
+            optional_dt_loader,
+        )
 
     def _get_loader_dt_disable(self, loader_iter: Iterable[Loader]) -> Loader:
         def union_loader(data):
@@ -555,7 +684,7 @@ class UnionProvider(LoaderProvider, DumperProvider):
                 return None
             return dumper(data)
 
-        return optional_dumper
+        return with_optional_wrapping(OptionalWrapping(dumper), optional_dumper)
 
 
 def path_like_dumper(data):
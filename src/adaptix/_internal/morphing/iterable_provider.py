@@ -2,7 +2,8 @@
 import collections.abc
 from collections.abc import Iterable, Mapping
 from inspect import isabstract
-from typing import Callable
+from itertools import islice
+from typing import Callable, Optional
 
 from ..common import Dumper, Loader
 from ..compat import CompatExceptionGroup
@@ -11,12 +12,21 @@ from ..morphing.provider_template import MorphingProvider
 from ..provider.essential import CannotProvide, Mediator
 from ..provider.located_request import LocatedRequest, for_predicate
 from ..provider.location import GenericParamLoc
+from ..special_cases_optimization import (
+    ExactTypeCheck,
+    as_is_stub,
+    get_exact_type_check,
+    get_sequence_dumper,
+    get_sequence_loader,
+    with_json_chunks_dumper,
+)
 from ..struct_trail import append_trail, render_trail_as_note
 from .json_schema.definitions import JSONSchema
 from .json_schema.request_cls import JSONSchemaRequest
 from .json_schema.schema_model import JSONSchemaType
-from .load_error import AggregateLoadError, ExcludedTypeLoadError, LoadError, TypeLoadError
-from .request_cls import DebugTrailRequest, DumperRequest, LoaderRequest, StrictCoercionRequest
+from .json_stream import make_iterable_json_chunks_dumper
+from .load_error import AggregateLoadError, ExcludedTypeLoadError, LoadError, TypeLoadError, render_truncation_note
+from .request_cls import DebugTrailRequest, DumperRequest, LoaderRequest, MaxErrorsRequest, StrictCoercionRequest
 from .utils import try_normalize_type
 
 CollectionsMapping = collections.abc.Mapping
@@ -74,6 +84,7 @@ class IterableProvider(MorphingProvider):
         )
         strict_coercion = mediator.mandatory_provide(StrictCoercionRequest(loc_stack=request.loc_stack))
         debug_trail = mediator.mandatory_provide(DebugTrailRequest(loc_stack=request.loc_stack))
+        max_errors = mediator.mandatory_provide(MaxErrorsRequest(loc_stack=request.loc_stack))
         return mediator.cached_call(
             self._make_loader,
             origin=norm.origin,
@@ -81,6 +92,7 @@ class IterableProvider(MorphingProvider):
             arg_loader=arg_loader,
             strict_coercion=strict_coercion,
             debug_trail=debug_trail,
+            max_errors=max_errors,
         )
 
     def _create_dt_first_iter_loader(self, origin, loader):
@@ -98,37 +110,158 @@ class IterableProvider(MorphingProvider):
 
         return iter_loader_dt_first
 
-    def _create_dt_all_iter_loader(self, origin, loader):
+    def _make_errors_group(self, origin, errors: list[Exception], *, is_truncated: bool) -> Exception:
+        exc: Exception
+        load_errors = tuple(e for e in errors if isinstance(e, LoadError))
+        if len(load_errors) == len(errors):
+            exc = AggregateLoadError(
+                f"while loading iterable {origin}",
+                tuple(render_trail_as_note(e) for e in load_errors),
+            )
+        else:
+            exc = CompatExceptionGroup(
+                f"while loading iterable {origin}",
+                [render_trail_as_note(e) for e in errors],
+            )
+        if is_truncated:
+            render_truncation_note(exc, len(errors))
+        return exc
+
+    def _create_dt_all_iter_loader(self, origin, loader, max_errors: Optional[int]):
         def iter_loader_dt_all(iterable):
             idx = 0
             errors = []
-            has_unexpected_error = False
+            is_truncated = False
 
             for el in iterable:
+                if len(errors) == max_errors:
+                    is_truncated = True
+                    break
                 try:
                     yield loader(el)
-                except LoadError as e:
-                    errors.append(append_trail(e, idx))
                 except Exception as e:
                     errors.append(append_trail(e, idx))
-                    has_unexpected_error = True
 
                 idx += 1
 
             if errors:
-                if has_unexpected_error:
-                    raise CompatExceptionGroup(
-                        f"while loading iterable {origin}",
-                        [render_trail_as_note(e) for e in errors],
-                    )
-                raise AggregateLoadError(
-                    f"while loading iterable {origin}",
-                    [render_trail_as_note(e) for e in errors],
-                )
+                raise self._make_errors_group(origin, errors, is_truncated=is_truncated)
 
         return iter_loader_dt_all
 
-    def _make_loader(self, *, origin, iter_factory, arg_loader, strict_coercion: bool, debug_trail: DebugTrail):
+    def _make_loader(
+        self,
+        *,
+        origin,
+        iter_factory,
+        arg_loader,
+        strict_coercion: bool,
+        debug_trail: DebugTrail,
+        max_errors: Optional[int],
+    ):
+        loader = self._make_general_loader(
+            origin=origin,
+            iter_factory=iter_factory,
+            arg_loader=arg_loader,
+            strict_coercion=strict_coercion,
+            debug_trail=debug_trail,
+            max_errors=max_errors,
+        )
+        exact_type_check = get_exact_type_check(arg_loader)
+        if strict_coercion and exact_type_check is not None:
+            return self._get_exact_type_elements_loader(iter_factory, exact_type_check, loader)
+        sequence_loader = get_sequence_loader(arg_loader)
+        if sequence_loader is not None:
+            return self._get_sequence_elements_loader(
+                origin=origin,
+                iter_factory=iter_factory,
+                sequence_loader=sequence_loader,
+                arg_loader=arg_loader,
+                general_loader=loader,
+                debug_trail=debug_trail,
+                max_errors=max_errors,
+            )
+        return loader
+
+    def _get_exact_type_elements_loader(self, iter_factory, exact_type_check: ExactTypeCheck, general_loader: Loader):
+        # types of all elements are collected by one pass at C level,
+        # any unexpected element is processed by general loader to produce the same error
+        main_type, *_ = exact_type_check.types
+        main_types = frozenset([main_type])
+        accepted_types = frozenset(exact_type_check.types)
+
+        def iter_loader_exact_type(data):
+            if type(data) is list or type(data) is tuple:
+                data_types = set(map(type, data))
+                if data_types <= main_types:
+                    return iter_factory(data)
+                if data_types <= accepted_types:
+                    return iter_factory(map(main_type, data))
+            return general_loader(data)
+
+        return iter_loader_exact_type
+
+    def _get_sequence_elements_loader(
+        self,
+        *,
+        origin,
+        iter_factory,
+        sequence_loader,
+        arg_loader: Loader,
+        general_loader: Loader,
+        debug_trail: DebugTrail,
+        max_errors: Optional[int],
+    ):
+        # the length of the result is the index of the failed element,
+        # so loading is resumed after it to find out other errors
+        def iter_loader_sequence(data):
+            if type(data) is list or type(data) is tuple:
+                result = []
+                try:
+                    sequence_loader(data, result)
+                except Exception as e:
+                    if debug_trail == DebugTrail.DISABLE:
+                        raise
+                    append_trail(e, len(result))
+                    if debug_trail == DebugTrail.FIRST:
+                        raise
+                    raise self._collect_rest_errors(origin, arg_loader, data, e, len(result), max_errors) from None
+                return iter_factory(result)
+            return general_loader(data)
+
+        return iter_loader_sequence
+
+    def _collect_rest_errors(
+        self,
+        origin,
+        arg_loader: Loader,
+        data,
+        error: Exception,
+        failed_idx: int,
+        max_errors: Optional[int],
+    ) -> Exception:
+        errors = [error]
+        is_truncated = False
+        for idx, el in enumerate(islice(data, failed_idx + 1, None), start=failed_idx + 1):
+            if len(errors) == max_errors:
+                is_truncated = True
+                break
+            try:
+                arg_loader(el)
+            except Exception as e:
+                errors.append(append_trail(e, idx))
+        return self._make_errors_group(origin, errors, is_truncated=is_truncated)
+
+    def _make_general_loader(
+        self,
+        *,
+        origin,
+        iter_factory,
+        arg_loader,
+        strict_coercion: bool,
+        debug_trail: DebugTrail,
+        max_errors: Optional[int],
+    ):
         if debug_trail == DebugTrail.DISABLE:
             if strict_coercion:
                 return self._get_dt_disable_sc_loader(iter_factory, arg_loader)
@@ -137,7 +270,7 @@ class IterableProvider(MorphingProvider):
         if debug_trail == DebugTrail.FIRST:
             iter_mapper = self._create_dt_first_iter_loader(origin, arg_loader)
         elif debug_trail == DebugTrail.ALL:
-            iter_mapper = self._create_dt_all_iter_loader(origin, arg_loader)
+            iter_mapper = self._create_dt_all_iter_loader(origin, arg_loader, max_errors)
         else:
             raise ValueError
 
@@ -217,13 +350,44 @@ class IterableProvider(MorphingProvider):
         )
 
     def _make_dumper(self, *, origin, iter_factory, arg_dumper, debug_trail: DebugTrail):
+        return with_json_chunks_dumper(
+            make_iterable_json_chunks_dumper(arg_dumper, debug_trail),
+            self._make_plain_dumper(
+                origin=origin,
+                iter_factory=iter_factory,
+                arg_dumper=arg_dumper,
+                debug_trail=debug_trail,
+            ),
+        )
+
+    def _make_plain_dumper(self, *, origin, iter_factory, arg_dumper, debug_trail: DebugTrail):
+        if arg_dumper == as_is_stub:
+            # elements are not changed and cannot raise errors
+            return self._get_as_is_elements_dumper(iter_factory)
+        sequence_dumper = get_sequence_dumper(arg_dumper)
         if debug_trail == DebugTrail.DISABLE:
+            if sequence_dumper is not None:
+                return self._get_dt_disable_sequence_dumper(iter_factory, sequence_dumper, arg_dumper)
             return self._get_dt_disable_dumper(iter_factory, arg_dumper)
+
         if debug_trail == DebugTrail.FIRST:
-            return self._get_dt_dumper(iter_factory, self._create_dt_first_iter_dumper(origin, arg_dumper))
-        if debug_trail == DebugTrail.ALL:
-            return self._get_dt_dumper(iter_factory, self._create_dt_all_iter_dumper(origin, arg_dumper))
-        raise ValueError
+            iter_dumper = self._create_dt_first_iter_dumper(origin, arg_dumper)
+        elif debug_trail == DebugTrail.ALL:
+            iter_dumper = self._create_dt_all_iter_dumper(origin, arg_dumper)
+        else:
+            raise ValueError
+
+        dumper = self._get_dt_dumper(iter_factory, iter_dumper)
+        if sequence_dumper is not None:
+            return self._get_sequence_elements_dumper(
+                origin=origin,
+                iter_factory=iter_factory,
+                sequence_dumper=sequence_dumper,
+                arg_dumper=arg_dumper,
+                general_dumper=dumper,
+                debug_trail=debug_trail,
+            )
+        return dumper
 
     def _create_dt_first_iter_dumper(self, origin, dumper):
         def iter_dumper_dt_first(iterable):
@@ -261,12 +425,67 @@ class IterableProvider(MorphingProvider):
 
         return iter_dumper_dt_all
 
+    def _get_as_is_elements_dumper(self, iter_factory):
+        def iter_dumper_as_is(data):
+            return iter_factory(data)
+
+        return iter_dumper_as_is
+
     def _get_dt_dumper(self, iter_factory, iter_dumper):
         def iter_dt_dumper(data):
             return iter_factory(iter_dumper(data))
 
         return iter_dt_dumper
 
+    def _get_sequence_elements_dumper(
+        self,
+        *,
+        origin,
+        iter_factory,
+        sequence_dumper,
+        arg_dumper: Dumper,
+        general_dumper: Dumper,
+        debug_trail: DebugTrail,
+    ):
+        # the length of the result is the index of the failed element,
+        # so dumping is resumed after it to find out other errors
+        def iter_dumper_sequence(data):
+            if type(data) is list or type(data) is tuple:
+                result = []
+                try:
+                    sequence_dumper(data, result)
+                except Exception as e:
+                    append_trail(e, len(result))
+                    if debug_trail == DebugTrail.FIRST:
+                        raise
+                    raise self._collect_rest_dumping_errors(origin, arg_dumper, data, e, len(result)) from None
+                return iter_factory(result)
+            return general_dumper(data)
+
+        return iter_dumper_sequence
+
+    def _collect_rest_dumping_errors(self, origin, arg_dumper: Dumper, data, error: Exception, failed_idx: int):
+        errors = [error]
+        for idx, el in enumerate(islice(data, failed_idx + 1, None), start=failed_idx + 1):
+            try:
+                arg_dumper(el)
+            except Exception as e:
+                errors.append(append_trail(e, idx))
+        return CompatExceptionGroup(
+            f"while dumping iterable {origin}",
+            [render_trail_as_note(e) for e in errors],
+        )
+
+    def _get_dt_disable_sequence_dumper(self, iter_factory, sequence_dumper, arg_dumper: Dumper):
+        def iter_dumper_sequence(data):
+            if type(data) is list or type(data) is tuple:
+                result = []
+                sequence_dumper(data, result)
+                return iter_factory(result)
+            return iter_factory(map(arg_dumper, data))
+
+        return iter_dumper_sequence
+
     def _get_dt_disable_dumper(self, iter_factory, arg_dumper: Dumper):
         def iter_dumper(data):
             return iter_factory(map(arg_dumper, data))
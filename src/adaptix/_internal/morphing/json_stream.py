@@ -0,0 +1,442 @@
+from collections.abc import Iterable, Iterator, Mapping
+from json import JSONEncoder
+from typing import Any, Callable, Optional
+
+from ..code_tools.utils import is_singleton
+from ..common import Dumper
+from ..definitions import DebugTrail
+from ..model_tools.definitions import DefaultFactory, DefaultFactoryWithSelf, DefaultValue, OutputField, OutputShape
+from ..special_cases_optimization import get_default_clause, get_json_chunks_dumper, get_optional_wrapping
+from ..struct_trail import ItemKey, append_trail
+from .model.crown_definitions import (
+    ExtraExtract,
+    ExtraTargets,
+    OutCrown,
+    OutDictCrown,
+    OutFieldCrown,
+    OutListCrown,
+    OutNoneCrown,
+    OutputNameLayout,
+    Sieve,
+)
+
+JSONChunksDumper = Callable[[Any], Iterable[str]]
+
+encode_json = JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _encode_key(key: Any) -> str:
+    if isinstance(key, str):
+        return encode_json(key)
+    if key is None or isinstance(key, (bool, int, float)):
+        # the same conversion as json module does for keys
+        return encode_json(encode_json(key))
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def _get_structured_json_chunks_dumper(dumper: Dumper) -> Optional[JSONChunksDumper]:
+    json_chunks_dumper = get_json_chunks_dumper(dumper)
+    if json_chunks_dumper is not None:
+        return json_chunks_dumper
+
+    optional_wrapping = get_optional_wrapping(dumper)
+    if optional_wrapping is not None:
+        inner_chunks_dumper = _get_structured_json_chunks_dumper(optional_wrapping.inner)
+        if inner_chunks_dumper is not None:
+            return _make_optional_json_chunks_dumper(inner_chunks_dumper)
+    return None
+
+
+def _make_optional_json_chunks_dumper(inner_chunks_dumper: JSONChunksDumper) -> JSONChunksDumper:
+    def optional_json_chunks_dumper(data):
+        if data is None:
+            return ("null", )
+        return inner_chunks_dumper(data)
+
+    return optional_json_chunks_dumper
+
+
+def make_json_chunks_dumper(dumper: Dumper) -> JSONChunksDumper:
+    """Creates function producing JSON text of dumped data by chunks.
+    Dumpers of models, iterables and dicts created by builtin providers are streamed element by element,
+    the result of any other dumper is encoded at once.
+    """
+    json_chunks_dumper = _get_structured_json_chunks_dumper(dumper)
+    if json_chunks_dumper is not None:
+        return json_chunks_dumper
+
+    def encoding_json_chunks_dumper(data):
+        return (encode_json(dumper(data)), )
+
+    return encoding_json_chunks_dumper
+
+
+def make_iterable_json_chunks_dumper(element_dumper: Dumper, debug_trail: DebugTrail) -> JSONChunksDumper:
+    element_chunks_dumper = make_json_chunks_dumper(element_dumper)
+
+    if debug_trail == DebugTrail.DISABLE:
+        def iterable_json_chunks_dumper(data):
+            yield "["
+            is_first = True
+            for element in data:
+                if is_first:
+                    is_first = False
+                else:
+                    yield ","
+                yield from element_chunks_dumper(element)
+            yield "]"
+
+        return iterable_json_chunks_dumper
+
+    def iterable_json_chunks_dumper_dt(data):
+        yield "["
+        for idx, element in enumerate(data):
+            if idx:
+                yield ","
+            try:
+                yield from element_chunks_dumper(element)
+            except Exception as e:
+                append_trail(e, idx)
+                raise
+        yield "]"
+
+    return iterable_json_chunks_dumper_dt
+
+
+def make_dict_json_chunks_dumper(
+    key_dumper: Dumper,
+    value_dumper: Dumper,
+    debug_trail: DebugTrail,
+) -> JSONChunksDumper:
+    value_chunks_dumper = make_json_chunks_dumper(value_dumper)
+
+    if debug_trail == DebugTrail.DISABLE:
+        def dict_json_chunks_dumper(data):
+            yield "{"
+            separator = ""
+            for key, value in data.items():
+                yield separator + _encode_key(key_dumper(key)) + ":"
+                separator = ","
+                yield from value_chunks_dumper(value)
+            yield "}"
+
+        return dict_json_chunks_dumper
+
+    def dict_json_chunks_dumper_dt(data):
+        yield "{"
+        separator = ""
+        for key, value in data.items():
+            try:
+                encoded_key = _encode_key(key_dumper(key))
+            except Exception as e:
+                append_trail(e, ItemKey(key))
+                raise
+
+            yield separator + encoded_key + ":"
+            separator = ","
+            try:
+                yield from value_chunks_dumper(value)
+            except Exception as e:
+                append_trail(e, key)
+                raise
+        yield "}"
+
+    return dict_json_chunks_dumper_dt
+
+
+# Node produces chunks of the crown element or returns None if the element must be skipped
+_CrownNode = Callable[[Any], Optional[Iterable[str]]]
+
+
+class _ModelJSONChunksDumperMaker:
+    def __init__(
+        self,
+        shape: OutputShape,
+        name_layout: OutputNameLayout,
+        fields_dumpers: Mapping[str, Dumper],
+        debug_trail: DebugTrail,
+    ):
+        self._id_to_field = {field.id: field for field in shape.fields}
+        self._name_layout = name_layout
+        self._fields_dumpers = fields_dumpers
+        self._debug_trail = debug_trail
+
+    def make(self) -> Optional[JSONChunksDumper]:
+        crown = self._name_layout.crown
+        if self._has_sieved_branch(crown):
+            return None
+        if self._name_layout.extra_move is None:
+            return self._make_node(crown)  # type: ignore[return-value]
+        if isinstance(crown, OutDictCrown):
+            return self._make_root_dict_with_extra(crown)
+        return None
+
+    def _has_sieved_branch(self, crown: OutCrown) -> bool:
+        if isinstance(crown, OutDictCrown):
+            return any(
+                (key in crown.sieves and not isinstance(sub_crown, OutFieldCrown))
+                or self._has_sieved_branch(sub_crown)
+                for key, sub_crown in crown.map.items()
+            )
+        if isinstance(crown, OutListCrown):
+            return any(self._has_sieved_branch(sub_crown) for sub_crown in crown.map)
+        return False
+
+    def _make_node(self, crown: OutCrown, sieve: Optional[Sieve] = None) -> _CrownNode:
+        if isinstance(crown, OutFieldCrown):
+            field = self._id_to_field[crown.id]
+            if sieve is not None:
+                return self._make_sieved_field_node(field, sieve)
+            return self._make_field_node(field)
+        if isinstance(crown, OutNoneCrown):
+            return self._make_none_node(crown)
+        if isinstance(crown, OutDictCrown):
+            return self._make_dict_node(crown)
+        if isinstance(crown, OutListCrown):
+            return self._make_list_node(crown)
+        raise TypeError
+
+    def _make_value_dumper(self, field: OutputField) -> Dumper:
+        """Returns function dumping the value of the field and appending trail to the raised errors"""
+        dumper = self._fields_dumpers[field.id]
+        if self._debug_trail == DebugTrail.DISABLE:
+            return dumper
+
+        trail_element = field.accessor.trail_element
+
+        def value_dumper(value):
+            try:
+                return dumper(value)
+            except Exception as e:
+                append_trail(e, trail_element)
+                raise
+
+        return value_dumper
+
+    def _make_value_chunks_dumper(self, field: OutputField) -> JSONChunksDumper:
+        chunks_dumper = make_json_chunks_dumper(self._fields_dumpers[field.id])
+        if self._debug_trail == DebugTrail.DISABLE:
+            return chunks_dumper
+
+        trail_element = field.accessor.trail_element
+
+        def value_chunks_dumper(value):
+            try:
+                yield from chunks_dumper(value)
+            except Exception as e:
+                append_trail(e, trail_element)
+                raise
+
+        return value_chunks_dumper
+
+    def _make_field_node(self, field: OutputField) -> _CrownNode:
+        getter = field.accessor.getter
+        chunks_dumper = make_json_chunks_dumper(self._fields_dumpers[field.id])
+
+        if field.is_required:
+            if self._debug_trail == DebugTrail.DISABLE:
+                def required_field_node(data):
+                    return chunks_dumper(getter(data))
+
+                return required_field_node
+
+            trail_element = field.accessor.trail_element
+
+            def required_field_node_dt(data):
+                try:
+                    yield from chunks_dumper(getter(data))
+                except Exception as e:
+                    append_trail(e, trail_element)
+                    raise
+
+            return required_field_node_dt
+
+        access_error = field.accessor.access_error
+        value_chunks_dumper = self._make_value_chunks_dumper(field)
+
+        def optional_field_node(data):
+            try:
+                value = getter(data)
+            except access_error:
+                return None
+            return value_chunks_dumper(value)
+
+        return optional_field_node
+
+    def _make_sieved_field_node(self, field: OutputField, sieve: Sieve) -> _CrownNode:
+        getter = field.accessor.getter
+        access_error = field.accessor.access_error
+        value_dumper = self._make_value_dumper(field)
+        is_required = field.is_required
+        condition = self._make_sieve_condition(sieve)
+
+        def sieved_field_node(data):
+            if is_required:
+                dumped = value_dumper(getter(data))
+            else:
+                try:
+                    value = getter(data)
+                except access_error:
+                    return None
+                dumped = value_dumper(value)
+
+            if condition(data, dumped):
+                return (encode_json(dumped), )
+            return None
+
+        return sieved_field_node
+
+    def _make_sieve_condition(self, sieve: Sieve) -> Callable[[Any, Any], bool]:
+        # mirrors the condition produced by the code generator of the model dumper
+        default_clause = get_default_clause(sieve)
+        if default_clause is None:
+            return lambda data, dumped: sieve(dumped)  # type: ignore[call-arg]
+        if isinstance(default_clause, DefaultValue):
+            default_value = default_clause.value
+            if is_singleton(default_value):
+                return lambda data, dumped: dumped is not default_value
+            return lambda data, dumped: dumped != default_value
+        if isinstance(default_clause, DefaultFactory):
+            default_factory = default_clause.factory
+            return lambda data, dumped: dumped != default_factory()
+        if isinstance(default_clause, DefaultFactoryWithSelf):
+            default_factory_with_self = default_clause.factory
+            return lambda data, dumped: dumped != default_factory_with_self(data)
+        raise TypeError
+
+    def _make_none_node(self, crown: OutNoneCrown) -> _CrownNode:
+        if isinstance(crown.placeholder, DefaultValue):
+            value = crown.placeholder.value
+            return lambda data: (encode_json(value), )
+
+        if isinstance(crown.placeholder, DefaultFactory):
+            factory = crown.placeholder.factory
+            return lambda data: (encode_json(factory()), )
+
+        raise TypeError
+
+    def _make_dict_items(self, crown: OutDictCrown) -> list[tuple[str, str, _CrownNode]]:
+        return [
+            (key, encode_json(key) + ":", self._make_node(sub_crown, crown.sieves.get(key)))
+            for key, sub_crown in crown.map.items()
+        ]
+
+    def _make_dict_node(self, crown: OutDictCrown) -> _CrownNode:
+        items = self._make_dict_items(crown)
+
+        def dict_node(data):
+            yield "{"
+            separator = ""
+            for _, key_chunk, node in items:
+                chunks = node(data)
+                if chunks is None:
+                    continue
+                yield separator + key_chunk
+                separator = ","
+                yield from chunks
+            yield "}"
+
+        return dict_node
+
+    def _make_list_node(self, crown: OutListCrown) -> _CrownNode:
+        nodes = [self._make_node(sub_crown) for sub_crown in crown.map]
+
+        def list_node(data):
+            yield "["
+            for idx, node in enumerate(nodes):
+                if idx:
+                    yield ","
+                yield from node(data)
+            yield "]"
+
+        return list_node
+
+    def _make_extra_getter(self) -> Callable[[Any], Mapping[str, Any]]:
+        extra_move = self._name_layout.extra_move
+        if isinstance(extra_move, ExtraExtract):
+            return extra_move.func
+        if not isinstance(extra_move, ExtraTargets):
+            raise TypeError
+
+        targets = [
+            (
+                field.accessor.getter,
+                field.accessor.access_error,
+                self._make_value_dumper(field),
+            )
+            for field in (self._id_to_field[field_id] for field_id in extra_move.fields)
+        ]
+
+        def extra_getter(data):
+            extra = {}
+            for getter, access_error, value_dumper in targets:
+                if access_error is None:
+                    extra.update(value_dumper(getter(data)))
+                    continue
+                try:
+                    value = getter(data)
+                except access_error:
+                    continue
+                extra.update(value_dumper(value))
+            return extra
+
+        return extra_getter
+
+    def _make_root_dict_with_extra(self, crown: OutDictCrown) -> JSONChunksDumper:
+        items = self._make_dict_items(crown)
+        extra_getter = self._make_extra_getter()
+
+        def root_dict_node(data):
+            extra = extra_getter(data)
+            yield "{"
+            separator = ""
+            for key, key_chunk, node in items:
+                if key in extra:
+                    continue
+                chunks = node(data)
+                if chunks is None:
+                    continue
+                yield separator + key_chunk
+                separator = ","
+                yield from chunks
+            for key, value in extra.items():
+                yield separator + _encode_key(key) + ":" + encode_json(value)
+                separator = ","
+            yield "}"
+
+        return root_dict_node
+
+
+def make_model_json_chunks_dumper(
+    shape: OutputShape,
+    name_layout: OutputNameLayout,
+    fields_dumpers: Mapping[str, Dumper],
+    debug_trail: DebugTrail,
+) -> Optional[JSONChunksDumper]:
+    """Creates function producing JSON text of the model by chunks
+    or returns None if the name layout cannot be streamed.
+    Unlike the model dumper, it stops at the first error even if all errors are requested to be collected,
+    because preceding chunks are already produced.
+    """
+    return _ModelJSONChunksDumperMaker(shape, name_layout, fields_dumpers, debug_trail).make()
+
+
+def iter_json_text(chunks: Iterable[str], buffer_size: int) -> Iterator[str]:
+    """Joins chunks of JSON text into blocks of approximately ``buffer_size`` characters"""
+    buffer: list[str] = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= buffer_size:
+            yield "".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def iter_json_bytes(blocks: Iterable[str]) -> Iterator[bytes]:
+    """Encodes blocks of JSON text to UTF-8"""
+    for block in blocks:
+        yield block.encode()
@@ -6,7 +6,8 @@ from typing import Any, Optional, Union
 
 from ..common import TypeHint, VarTuple
 from ..compat import CompatExceptionGroup
-from ..utils import fix_dataclass_from_builtin, with_module
+from ..struct_trail import BaseExcT
+from ..utils import add_note, fix_dataclass_from_builtin, with_module
 
 
 def _str_by_fields(cls):
@@ -163,3 +164,9 @@ class OutOfRangeLoadError(LoadError):
     min_value: Optional[Union[int, float]]
     max_value: Optional[Union[int, float]]
     input_value: Any
+
+
+def render_truncation_note(exc: BaseExcT, max_errors: int) -> BaseExcT:
+    """Mark the exception group that collection of errors was stopped at the limit of ``max_errors``"""
+    add_note(exc, f"Error collection is truncated after {max_errors} errors")
+    return exc
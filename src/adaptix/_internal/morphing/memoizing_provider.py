@@ -0,0 +1,53 @@
+from functools import lru_cache
+from itertools import islice
+from typing import Optional
+
+from ..common import Loader
+from ..provider.essential import Mediator
+from ..provider.located_request import LocatedRequestMethodsProvider
+from ..provider.methods_provider import method_handler
+from ..special_cases_optimization import with_sequence_loader
+from .request_cls import LoaderRequest
+
+_STR_TYPES = frozenset([str])
+
+
+class MemoizingLoaderProvider(LocatedRequestMethodsProvider):
+    """Provider wrapping the loader of the next providers with LRU cache keyed by input string.
+
+    Data of other types is passed to the original loader directly.
+    Loaded values are shared between calls, so it must be used only for immutable types.
+    """
+
+    def __init__(self, maxsize: Optional[int]):
+        self._maxsize = maxsize
+
+    @method_handler
+    def provide_loader(self, mediator: Mediator[Loader], request: LoaderRequest) -> Loader:
+        return mediator.cached_call(self._make_loader, mediator.provide_from_next())
+
+    def _make_loader(self, loader: Loader) -> Loader:
+        cached_loader = lru_cache(maxsize=self._maxsize)(loader)
+
+        def memoizing_loader(data):
+            if type(data) is str:
+                return cached_loader(data)
+            return loader(data)
+
+        def memoizing_sequence_loader(data, result):
+            if not set(map(type, data)) <= _STR_TYPES:
+                result.extend(map(memoizing_loader, data))
+                return
+
+            # each unique string of the sequence is parsed only once,
+            # strings are parsed in order of the first occurrence, so all values preceding the failed one are loaded
+            loaded = dict.fromkeys(data)
+            for value in loaded:
+                try:
+                    loaded[value] = loader(value)
+                except Exception:
+                    result.extend(map(loaded.__getitem__, islice(data, data.index(value))))
+                    raise
+            result.extend(map(loaded.__getitem__, data))
+
+        return with_sequence_loader(memoizing_sequence_loader, memoizing_loader)
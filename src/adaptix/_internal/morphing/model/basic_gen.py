@@ -2,16 +2,20 @@ import itertools
 from abc import ABC, abstractmethod
 from collections.abc import Collection, Container, Iterable, Mapping, Set
 from dataclasses import dataclass
-from typing import Any, Callable, TypeVar, Union
+from typing import Any, Callable, Optional, TypeVar, Union
 
 from ...code_tools.code_builder import CodeBuilder
-from ...code_tools.compiler import ClosureCompiler
+from ...code_tools.compiler import BasicClosureCompiler, ClosureCompiler
+from ...code_tools.inliner import InlinableCode
 from ...code_tools.utils import get_literal_expr
 from ...model_tools.definitions import InputField, OutputField
 from ...provider.essential import CannotProvide, Mediator
 from ...provider.loc_stack_filtering import LocStack
 from ...provider.located_request import LocatedRequest
+from ...provider.location import FieldLoc, GenericParamLoc
 from ...provider.methods_provider import MethodsProvider, method_handler
+from ...special_cases_optimization import OptionalWrapping, get_inlinable_code, get_optional_wrapping
+from ...type_tools import normalize_type
 from .crown_definitions import (
     BaseCrown,
     BaseDictCrown,
@@ -57,6 +61,95 @@ def fetch_code_gen_hook(mediator: Mediator, loc_stack: LocStack) -> CodeGenHook:
         return stub_code_gen_hook
 
 
+@dataclass(frozen=True)
+class ClosureCompilerRequest(LocatedRequest[ClosureCompiler]):
+    pass
+
+
+def fetch_closure_compiler(mediator: Mediator, loc_stack: LocStack) -> ClosureCompiler:
+    try:
+        return mediator.delegating_provide(ClosureCompilerRequest(loc_stack=loc_stack))
+    except CannotProvide:
+        return BasicClosureCompiler()
+
+
+@dataclass(frozen=True)
+class InliningDepthRequest(LocatedRequest[int]):
+    pass
+
+
+def fetch_max_inlining_depth(mediator: Mediator, loc_stack: LocStack) -> int:
+    try:
+        return mediator.delegating_provide(InliningDepthRequest(loc_stack=loc_stack))
+    except CannotProvide:
+        return 0
+
+
+def _get_inlining_parent(loc_stack: LocStack) -> Optional[LocStack]:
+    """Returns loc stack of the model that can inline the converter of the location"""
+    if len(loc_stack) >= 2 and loc_stack.last.is_castable(FieldLoc):  # noqa: PLR2004
+        return loc_stack.reversed_slice(1)
+    if (
+        len(loc_stack) >= 3  # noqa: PLR2004
+        and loc_stack.last.is_castable(GenericParamLoc)
+        and loc_stack[-2].is_castable(FieldLoc)
+    ):
+        try:
+            norm = normalize_type(loc_stack[-2].type)
+        except ValueError:
+            return None
+        if norm.origin == Union and len(norm.args) == 2 and None in [arg.origin for arg in norm.args]:  # noqa: PLR2004
+            return loc_stack.reversed_slice(2)
+    return None
+
+
+def fetch_parent_inlining_depth(mediator: Mediator, loc_stack: LocStack) -> int:
+    """Returns how many levels of nested models the parent model can inline starting from this location.
+    Zero means that the converter of the location is never inlined
+    """
+    parent_loc_stack = _get_inlining_parent(loc_stack)
+    if parent_loc_stack is None:
+        return 0
+    return fetch_inlining_depth(mediator, parent_loc_stack)
+
+
+def fetch_inlining_depth(mediator: Mediator, loc_stack: LocStack) -> int:
+    """Returns how many levels of nested models can be inlined into the converter of the location.
+    Levels are counted from the outermost model, so the model that is inlined into the parent
+    gets the rest of the parent depth
+    """
+    parent_depth = fetch_parent_inlining_depth(mediator, loc_stack)
+    if parent_depth > 0:
+        return parent_depth - 1
+    return fetch_max_inlining_depth(mediator, loc_stack)
+
+
+@dataclass(frozen=True)
+class InlinedConverter:
+    code: InlinableCode
+    optional_wrapping: Optional[OptionalWrapping] = None
+
+
+def select_inlined_converters(
+    converters: Mapping[str, Callable],
+    max_depth: int,
+) -> Mapping[str, InlinedConverter]:
+    if max_depth <= 0:
+        return {}
+
+    result = {}
+    for field_id, converter in converters.items():
+        optional_wrapping = get_optional_wrapping(converter)
+        code = get_inlinable_code(converter if optional_wrapping is None else optional_wrapping.inner)
+        if code is not None and code.depth < max_depth:
+            result[field_id] = InlinedConverter(code, optional_wrapping)
+    return result
+
+
+def get_inlining_depth(inlined_converters: Mapping[str, InlinedConverter]) -> int:
+    return max((inlined.code.depth + 1 for inlined in inlined_converters.values()), default=0)
+
+
 class CodeGenAccumulator(MethodsProvider):
     """Accumulates all generated code. It may be useful for debugging"""
 
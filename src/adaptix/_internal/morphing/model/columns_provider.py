@@ -0,0 +1,430 @@
+from collections.abc import Collection, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from itertools import islice, starmap
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Optional, TypeVar
+
+from ...common import Dumper, Loader, TypeHint
+from ...compat import CompatExceptionGroup
+from ...definitions import DebugTrail
+from ...model_tools.definitions import Accessor, DescriptorAccessor, InputShape, ItemAccessor, OutputShape, ParamKind
+from ...provider.essential import CannotProvide, Mediator
+from ...provider.fields import input_field_to_loc, output_field_to_loc
+from ...provider.located_request import LocatedRequest, LocatedRequestMethodsProvider
+from ...provider.methods_provider import method_handler
+from ...provider.shape_provider import InputShapeRequest, OutputShapeRequest, provide_generic_resolved_shape
+from ...special_cases_optimization import as_is_stub, get_exact_type_check, get_sequence_loader
+from ...struct_trail import append_trail, render_trail_as_note
+from ..load_error import (
+    AggregateLoadError,
+    ExtraFieldsLoadError,
+    LoadError,
+    NoRequiredFieldsLoadError,
+    TypeLoadError,
+    ValueLoadError,
+    render_truncation_note,
+)
+from ..request_cls import DebugTrailRequest, DumperRequest, LoaderRequest, MaxErrorsRequest, StrictCoercionRequest
+from .crown_definitions import (
+    ExtraForbid,
+    ExtraSkip,
+    InpDictCrown,
+    InpFieldCrown,
+    InputNameLayout,
+    InputNameLayoutRequest,
+    OutDictCrown,
+    OutFieldCrown,
+    OutputNameLayout,
+    OutputNameLayoutRequest,
+)
+
+T = TypeVar("T")
+
+ColumnsLoader = Callable[[Mapping[str, Iterable[Any]]], list[T]]
+ColumnsDumper = Callable[[Iterable[T]], dict[str, list[Any]]]
+ColumnLoader = Callable[[list[Any], Optional[list[Exception]]], list[Any]]
+
+_NOT_COLUMN_TYPES = (str, bytes, bytearray, Mapping)
+
+
+@dataclass(frozen=True)
+class ColumnsLoaderRequest(LocatedRequest[ColumnsLoader]):
+    pass
+
+
+@dataclass(frozen=True)
+class ColumnsDumperRequest(LocatedRequest[ColumnsDumper]):
+    pass
+
+
+def _to_column(key: str, data: Any) -> list[Any]:
+    if type(data) is list:
+        return data
+    if not isinstance(data, _NOT_COLUMN_TYPES):
+        try:
+            return list(data)
+        except TypeError:
+            pass
+    raise append_trail(TypeLoadError(Iterable, data), key)
+
+
+class _ErrorLimitReached(Exception):
+    """Raised when the limit of errors is reached and some elements of the column are left unchecked"""
+
+
+def _collect_errors(
+    key: str,
+    loader: Loader,
+    column: list[Any],
+    error: Exception,
+    idx: int,
+    errors: Optional[list[Exception]],
+    max_errors: Optional[int],
+) -> None:
+    # loading is resumed after each failed element only to find out the next failed one,
+    # loaded values are dropped because the error will be raised anyway
+    while True:
+        append_trail(append_trail(error, idx), key)
+        if errors is None:
+            raise error
+        errors.append(error)
+        if len(errors) == max_errors:
+            if idx + 1 < len(column):
+                raise _ErrorLimitReached
+            return
+
+        loaded: list[Any] = []
+        try:
+            loaded.extend(map(loader, islice(column, idx + 1, None)))
+        except Exception as e:
+            error = e
+            idx += len(loaded) + 1
+        else:
+            return
+
+
+def _get_column_getter(accessor: Accessor) -> Callable[[Any], Any]:
+    # builtin getters are called without creating python frames
+    if isinstance(accessor, DescriptorAccessor):
+        return attrgetter(accessor.attr_name)
+    if isinstance(accessor, ItemAccessor):
+        return itemgetter(accessor.key)
+    return accessor.getter
+
+
+def _make_general_column_loader(
+    key: str,
+    loader: Loader,
+    *,
+    debug_trail: DebugTrail,
+    max_errors: Optional[int],
+) -> ColumnLoader:
+    sequence_loader = get_sequence_loader(loader)
+    is_trail_disabled = debug_trail == DebugTrail.DISABLE
+
+    # values are appended one by one, so the length of the result is the index of the failed element
+    if sequence_loader is None:
+        def column_loader(column, errors):
+            result = []
+            try:
+                result.extend(map(loader, column))
+            except Exception as e:
+                if is_trail_disabled:
+                    raise
+                _collect_errors(key, loader, column, e, len(result), errors, max_errors)
+            return result
+
+        return column_loader
+
+    def column_loader_sequence(column, errors):
+        result = []
+        try:
+            sequence_loader(column, result)
+        except Exception as e:
+            if is_trail_disabled:
+                raise
+            _collect_errors(key, loader, column, e, len(result), errors, max_errors)
+        return result
+
+    return column_loader_sequence
+
+
+def _make_column_loader(
+    key: str,
+    loader: Loader,
+    *,
+    strict_coercion: bool,
+    debug_trail: DebugTrail,
+    max_errors: Optional[int],
+) -> ColumnLoader:
+    column_loader = _make_general_column_loader(key, loader, debug_trail=debug_trail, max_errors=max_errors)
+    exact_type_check = get_exact_type_check(loader) if strict_coercion else None
+    if exact_type_check is None:
+        return column_loader
+
+    # types of all elements are collected by one pass at C level
+    main_type, *_ = exact_type_check.types
+    main_types = frozenset([main_type])
+    accepted_types = frozenset(exact_type_check.types)
+
+    def column_loader_exact_type(column, errors):
+        column_types = set(map(type, column))
+        if column_types <= main_types:
+            return column
+        if column_types <= accepted_types:
+            return list(map(main_type, column))
+        return column_loader(column, errors)
+
+    return column_loader_exact_type
+
+
+def _fetch_columns(
+    data: Any,
+    required_keys: Sequence[str],
+    column_keys: Collection[str],
+    *,
+    forbid_extra: bool,
+) -> dict[str, list[Any]]:
+    if not isinstance(data, Mapping):
+        raise TypeLoadError(Mapping, data)
+
+    missing_keys = [key for key in required_keys if key not in data]
+    if missing_keys:
+        raise NoRequiredFieldsLoadError(missing_keys, data)
+    if forbid_extra:
+        extra_keys = [key for key in data if key not in column_keys]
+        if extra_keys:
+            raise ExtraFieldsLoadError(extra_keys, data)
+
+    columns = {key: _to_column(key, data[key]) for key in column_keys if key in data}
+    if len(set(map(len, columns.values()))) > 1:
+        raise ValueLoadError("Columns have different lengths", data)
+    return columns
+
+
+def _make_columns_error(tp: TypeHint, errors: list[Exception], *, is_truncated: bool) -> Exception:
+    exc: Exception
+    load_errors = tuple(e for e in errors if isinstance(e, LoadError))
+    if len(load_errors) == len(errors):
+        exc = AggregateLoadError(
+            f"while loading columns of {tp}",
+            tuple(render_trail_as_note(e) for e in load_errors),
+        )
+    else:
+        exc = CompatExceptionGroup(
+            f"while loading columns of {tp}",
+            [render_trail_as_note(e) for e in errors],
+        )
+    if is_truncated:
+        render_truncation_note(exc, len(errors))
+    return exc
+
+
+def _construct_models(
+    constructor: Callable[..., Any],
+    params: Iterable[tuple[Optional[str], str, ParamKind]],
+    loaded: Mapping[str, list[Any]],
+) -> list[Any]:
+    # fields are passed positionally until the first keyword-only or omitted one
+    args = []
+    kwargs_names = []
+    kwargs_columns = []
+    is_positional = True
+    for key, name, kind in params:
+        if key is None or key not in loaded:
+            is_positional = False
+        elif is_positional and kind != ParamKind.KW_ONLY:
+            args.append(loaded[key])
+        else:
+            is_positional = False
+            kwargs_names.append(name)
+            kwargs_columns.append(loaded[key])
+    if not kwargs_columns:
+        return list(starmap(constructor, zip(*args)))
+
+    args_count = len(args)
+    return [
+        constructor(*values[:args_count], **dict(zip(kwargs_names, values[args_count:])))
+        for values in zip(*args, *kwargs_columns)
+    ]
+
+
+class ModelColumnsProvider(LocatedRequestMethodsProvider):
+    """Provider of loaders and dumpers processing column-oriented data of the model.
+
+    Input data is a mapping of keys to columns (iterables of field values),
+    each column is loaded at once, then field values are zipped into constructor calls.
+    Only flat models without extra data are supported.
+    """
+
+    @method_handler
+    def provide_columns_loader(self, mediator: Mediator, request: ColumnsLoaderRequest) -> ColumnsLoader:
+        shape = provide_generic_resolved_shape(mediator, InputShapeRequest(loc_stack=request.loc_stack))
+        name_layout = mediator.mandatory_provide(
+            InputNameLayoutRequest(loc_stack=request.loc_stack, shape=shape),
+            lambda x: "Cannot create columns loader for model. Cannot fetch InputNameLayout",
+        )
+        self._validate_input_name_layout(name_layout)
+        loaders = mediator.mandatory_provide_by_iterable(
+            [
+                LoaderRequest(loc_stack=request.loc_stack.append_with(input_field_to_loc(field)))
+                for field in shape.fields
+            ],
+            lambda: "Cannot create columns loader for model. Loaders for some fields cannot be created",
+        )
+        return self._make_columns_loader(
+            tp=request.last_loc.type,
+            shape=shape,
+            name_layout=name_layout,
+            field_loaders={field.id: loader for field, loader in zip(shape.fields, loaders)},
+            strict_coercion=mediator.mandatory_provide(StrictCoercionRequest(loc_stack=request.loc_stack)),
+            debug_trail=mediator.mandatory_provide(DebugTrailRequest(loc_stack=request.loc_stack)),
+            max_errors=mediator.mandatory_provide(MaxErrorsRequest(loc_stack=request.loc_stack)),
+        )
+
+    def _validate_input_name_layout(self, name_layout: InputNameLayout) -> None:
+        if not (
+            isinstance(name_layout.crown, InpDictCrown)
+            and isinstance(name_layout.crown.extra_policy, (ExtraSkip, ExtraForbid))
+            and name_layout.extra_move is None
+            and all(isinstance(crown, InpFieldCrown) for crown in name_layout.crown.map.values())
+        ):
+            raise CannotProvide(
+                "Only models mapped to a flat dict without extra data can be loaded by columns",
+                is_terminal=True,
+                is_demonstrative=True,
+            )
+
+    def _make_columns_loader(
+        self,
+        *,
+        tp: TypeHint,
+        shape: InputShape,
+        name_layout: InputNameLayout,
+        field_loaders: Mapping[str, Loader],
+        strict_coercion: bool,
+        debug_trail: DebugTrail,
+        max_errors: Optional[int],
+    ) -> ColumnsLoader:
+        crown = name_layout.crown
+        if not isinstance(crown, InpDictCrown):
+            raise TypeError
+        field_keys = {
+            sub_crown.id: key
+            for key, sub_crown in crown.map.items()
+            if isinstance(sub_crown, InpFieldCrown)
+        }
+        params = [
+            (field_keys.get(param.field_id), param.name, param.kind)
+            for param in shape.params
+        ]
+        required_keys = [
+            field_keys[field.id] for field in shape.fields
+            if field.is_required
+        ]
+        column_loaders = {
+            key: _make_column_loader(
+                key,
+                field_loaders[field_id],
+                strict_coercion=strict_coercion,
+                debug_trail=debug_trail,
+                max_errors=max_errors,
+            )
+            for field_id, key in field_keys.items()
+        }
+        forbid_extra = isinstance(crown.extra_policy, ExtraForbid)
+        collect_all_errors = debug_trail == DebugTrail.ALL
+        constructor = shape.constructor
+
+        def columns_loader(data):
+            columns = _fetch_columns(data, required_keys, column_loaders, forbid_extra=forbid_extra)
+            errors: Optional[list[Exception]] = [] if collect_all_errors else None
+            loaded = {}
+            is_truncated = False
+            for key, column in columns.items():
+                if errors and len(errors) == max_errors:
+                    is_truncated = True
+                    break
+                try:
+                    loaded[key] = column_loaders[key](column, errors)
+                except _ErrorLimitReached:
+                    is_truncated = True
+                    break
+            if errors:
+                raise _make_columns_error(tp, errors, is_truncated=is_truncated)
+            return _construct_models(constructor, params, loaded)
+
+        return columns_loader
+
+    @method_handler
+    def provide_columns_dumper(self, mediator: Mediator, request: ColumnsDumperRequest) -> ColumnsDumper:
+        shape = provide_generic_resolved_shape(mediator, OutputShapeRequest(loc_stack=request.loc_stack))
+        name_layout = mediator.delegating_provide(
+            OutputNameLayoutRequest(loc_stack=request.loc_stack, shape=shape),
+        )
+        self._validate_output_name_layout(shape, name_layout)
+        dumpers = mediator.mandatory_provide_by_iterable(
+            [
+                DumperRequest(loc_stack=request.loc_stack.append_with(output_field_to_loc(field)))
+                for field in shape.fields
+            ],
+            lambda: "Cannot create columns dumper for model. Dumpers for some fields cannot be created",
+        )
+        return self._make_columns_dumper(
+            shape=shape,
+            name_layout=name_layout,
+            field_dumpers={field.id: dumper for field, dumper in zip(shape.fields, dumpers)},
+        )
+
+    def _validate_output_name_layout(self, shape: OutputShape, name_layout: OutputNameLayout) -> None:
+        if not (
+            isinstance(name_layout.crown, OutDictCrown)
+            and not name_layout.crown.sieves
+            and name_layout.extra_move is None
+            and all(isinstance(crown, OutFieldCrown) for crown in name_layout.crown.map.values())
+        ):
+            raise CannotProvide(
+                "Only models mapped to a flat dict without extra data and omitted fields can be dumped by columns",
+                is_terminal=True,
+                is_demonstrative=True,
+            )
+        optional_fields = [
+            crown.id for crown in name_layout.crown.map.values()  # type: ignore[union-attr]
+            if shape.fields_dict[crown.id].is_optional  # type: ignore[union-attr]
+        ]
+        if optional_fields:
+            raise CannotProvide(
+                f"Optional fields {optional_fields} cannot be dumped by columns",
+                is_terminal=True,
+                is_demonstrative=True,
+            )
+
+    def _make_columns_dumper(
+        self,
+        *,
+        shape: OutputShape,
+        name_layout: OutputNameLayout,
+        field_dumpers: Mapping[str, Dumper],
+    ) -> ColumnsDumper:
+        crown = name_layout.crown
+        if not isinstance(crown, OutDictCrown):
+            raise TypeError
+        column_makers = [
+            (
+                key,
+                _get_column_getter(shape.fields_dict[sub_crown.id].accessor),
+                field_dumpers[sub_crown.id],
+            )
+            for key, sub_crown in crown.map.items()
+            if isinstance(sub_crown, OutFieldCrown)
+        ]
+
+        def columns_dumper(data):
+            if not isinstance(data, Sequence):
+                data = list(data)
+            return {
+                key: list(map(getter, data)) if dumper is as_is_stub else list(map(dumper, map(getter, data)))
+                for key, getter, dumper in column_makers
+            }
+
+        return columns_dumper
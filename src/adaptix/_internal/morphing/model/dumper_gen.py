@@ -2,10 +2,11 @@ import contextlib
 from collections.abc import Mapping
 from dataclasses import replace
 from string import Template
-from typing import Any, Callable, NamedTuple
+from typing import Any, Callable, NamedTuple, Optional
 
 from ...code_tools.cascade_namespace import BuiltinCascadeNamespace, CascadeNamespace
 from ...code_tools.code_builder import CodeBuilder
+from ...code_tools.inliner import inline_code
 from ...code_tools.utils import get_literal_expr, get_literal_from_factory, is_singleton
 from ...common import Dumper
 from ...compat import CompatExceptionGroup
@@ -24,7 +25,7 @@ from ...struct_trail import append_trail, extend_trail, render_trail_as_note
 from ...utils import Omittable, Omitted
 from ..json_schema.definitions import JSONSchema
 from ..json_schema.schema_model import JSONSchemaType, JSONValue
-from .basic_gen import ModelDumperGen, get_skipped_fields
+from .basic_gen import InlinedConverter, ModelDumperGen, get_skipped_fields
 from .crown_definitions import (
     CrownPath,
     CrownPathElem,
@@ -107,6 +108,7 @@ class BuiltinModelDumperGen(ModelDumperGen):
         debug_trail: DebugTrail,
         fields_dumpers: Mapping[str, Dumper],
         model_identity: str,
+        inlined_dumpers: Mapping[str, InlinedConverter],
     ):
         self._shape = shape
         self._name_layout = name_layout
@@ -118,7 +120,9 @@ class BuiltinModelDumperGen(ModelDumperGen):
             else ()
         )
         self._id_to_field: dict[str, OutputField] = {field.id: field for field in self._shape.fields}
+        self._field_id_to_idx: dict[str, int] = {field.id: idx for idx, field in enumerate(self._shape.fields)}
         self._model_identity = model_identity
+        self._inlined_dumpers = inlined_dumpers
 
     def produce_code(self, closure_name: str) -> tuple[str, Mapping[str, object]]:
         body_builder = CodeBuilder()
@@ -192,6 +196,11 @@ class BuiltinModelDumperGen(ModelDumperGen):
     def _v_access_error(self, field: OutputField) -> str:
         return f"access_error_{field.id}"
 
+    def _v_inlined_result(self, field: OutputField) -> str:
+        # names of inlined code are prefixed by this name and underscore,
+        # so the name itself and other names of the closure never collide with them
+        return f"i{self._field_id_to_idx[field.id]}"
+
     def _gen_access_expr(self, namespace: CascadeNamespace, field: OutputField) -> str:
         accessor = field.accessor
         if isinstance(accessor, DescriptorAccessor):
@@ -225,31 +234,8 @@ class BuiltinModelDumperGen(ModelDumperGen):
     ):
         raw_access_expr = self._gen_access_expr(namespace, field)
         v_element_expr = self._get_trail_element_expr(namespace, field)
-
-        if self._fields_dumpers[field.id] == as_is_stub:
-            on_access_ok_stmt = Template(on_access_ok).substitute(expr=raw_access_expr)
-        else:
-            dumper = self._v_dumper(field)
-            on_access_ok_stmt = Template(on_access_ok).substitute(expr=f"{dumper}({raw_access_expr})")
-
-        if self._debug_trail == DebugTrail.ALL:
-            builder += f"""
-                try:
-                    {on_access_ok_stmt}
-                except Exception as e:
-                    errors.append(append_trail(e, {v_element_expr}))
-            """
-        elif self._debug_trail == DebugTrail.FIRST:
-            builder += f"""
-                try:
-                    {on_access_ok_stmt}
-                except Exception as e:
-                    append_trail(e, {v_element_expr})
-                    raise
-            """
-        else:
-            builder += on_access_ok_stmt
-
+        on_access_ok_stmt = self._gen_dumping_stmt(namespace, field, raw_access_expr, on_access_ok=on_access_ok)
+        self._gen_trail_appending(builder, on_access_ok_stmt, v_element_expr)
         builder.empty_line()
 
     def _gen_optional_field_extraction(
@@ -265,15 +251,7 @@ class BuiltinModelDumperGen(ModelDumperGen):
         path_element_expr = self._get_trail_element_expr(namespace, field)
 
         v_raw_field = self._v_raw_field(field)
-        if self._fields_dumpers[field.id] == as_is_stub:
-            on_access_ok_stmt = Template(on_access_ok).substitute(
-                expr=v_raw_field,
-            )
-        else:
-            dumper = self._v_dumper(field)
-            on_access_ok_stmt = Template(on_access_ok).substitute(
-                expr=f"{dumper}({v_raw_field})",
-            )
+        on_access_ok_stmt = self._gen_dumping_stmt(namespace, field, v_raw_field, on_access_ok=on_access_ok)
 
         access_error = field.accessor.access_error
         access_error_expr = get_literal_expr(access_error)
@@ -281,42 +259,85 @@ class BuiltinModelDumperGen(ModelDumperGen):
             access_error_expr = self._v_access_error(field)
             namespace.add_constant(access_error_expr, access_error)
 
+        builder += f"""
+            try:
+                {v_raw_field} = {raw_access_expr}
+            except {access_error_expr}:
+                {on_access_error}
+            else:
+        """
+        with builder:
+            self._gen_trail_appending(builder, on_access_ok_stmt, path_element_expr)
+
+        builder.empty_line()
+
+    def _gen_trail_appending(self, builder: CodeBuilder, stmt: str, trail_element_expr: str) -> None:
+        if self._debug_trail == DebugTrail.DISABLE:
+            builder += stmt
+            return
+
+        with builder("try:"):
+            builder += stmt
         if self._debug_trail == DebugTrail.ALL:
             builder += f"""
-                try:
-                    {v_raw_field} = {raw_access_expr}
-                except {access_error_expr}:
-                    {on_access_error}
-                else:
-                    try:
-                        {on_access_ok_stmt}
-                    except Exception as e:
-                        errors.append(append_trail(e, {path_element_expr}))
+                except Exception as e:
+                    errors.append(append_trail(e, {trail_element_expr}))
             """
-        elif self._debug_trail == DebugTrail.FIRST:
+        else:
             builder += f"""
-                try:
-                    {v_raw_field} = {raw_access_expr}
-                except {access_error_expr}:
-                    {on_access_error}
-                else:
-                    try:
-                        {on_access_ok_stmt}
-                    except Exception as e:
-                        append_trail(e, {path_element_expr})
-                        raise
+                except Exception as e:
+                    append_trail(e, {trail_element_expr})
+                    raise
             """
+
+    def _gen_dumping_stmt(
+        self,
+        namespace: CascadeNamespace,
+        field: OutputField,
+        dumper_arg: str,
+        *,
+        on_access_ok: str,
+    ) -> str:
+        if self._fields_dumpers[field.id] == as_is_stub:
+            return Template(on_access_ok).substitute(expr=dumper_arg)
+
+        inlined_code = self._gen_inlined_dumping(namespace, field, dumper_arg)
+        if inlined_code is None:
+            return Template(on_access_ok).substitute(expr=f"{self._v_dumper(field)}({dumper_arg})")
+        return inlined_code + "\n" + Template(on_access_ok).substitute(expr=self._v_inlined_result(field))
+
+    def _gen_inlined_dumping(self, namespace: CascadeNamespace, field: OutputField, dumper_arg: str) -> Optional[str]:
+        """Returns code assigning result of dumping to a variable
+        or None if the dumper of the field cannot be inlined
+        """
+        inlined = self._inlined_dumpers.get(field.id)
+        if inlined is None:
+            return None
+        try:
+            inlined_code = inline_code(
+                inlined.code,
+                prefix=self._v_inlined_result(field) + "_",
+                result_target=self._v_inlined_result(field),
+            )
+        except ValueError:
+            return None
+
+        for name, value in inlined_code.namespace.items():
+            namespace.add_constant(name, value)
+
+        builder = CodeBuilder()
+        builder += f"{inlined_code.arg} = {dumper_arg}"
+        if inlined.optional_wrapping is None:
+            builder += inlined_code.body
         else:
             builder += f"""
-                try:
-                    {v_raw_field} = {raw_access_expr}
-                except {access_error_expr}:
-                    {on_access_error}
+                if {inlined_code.arg} is None:
+                    {self._v_inlined_result(field)} = None
                 else:
-                    {on_access_ok_stmt}
             """
-
-        builder.empty_line()
+            with builder:
+                builder += inlined_code.body
+        return builder.string()
 
     def _gen_field_extraction(
         self,
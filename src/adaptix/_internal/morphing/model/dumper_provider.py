@@ -2,7 +2,8 @@ from collections.abc import Mapping, Sequence
 from functools import partial
 from typing import Any
 
-from ...code_tools.compiler import BasicClosureCompiler, ClosureCompiler
+from ...code_tools.compiler import ClosureCompiler
+from ...code_tools.inliner import InlinableCode
 from ...code_tools.name_sanitizer import BuiltinNameSanitizer, NameSanitizer
 from ...common import Dumper
 from ...definitions import DebugTrail, Direction
@@ -11,20 +12,29 @@ from ...provider.essential import CannotProvide, Mediator
 from ...provider.fields import output_field_to_loc
 from ...provider.located_request import LocatedRequest
 from ...provider.shape_provider import OutputShapeRequest, provide_generic_resolved_shape
+from ...special_cases_optimization import with_inlinable_code, with_json_chunks_dumper
 from ...utils import AlwaysEqualHashWrapper, Omittable, Omitted, OrderedMappingHashWrapper
 from ..json_schema.definitions import JSONSchema
 from ..json_schema.request_cls import JSONSchemaRequest
 from ..json_schema.schema_model import JSONValue
+from ..json_stream import make_model_json_chunks_dumper
 from ..provider_template import DumperProvider, JSONSchemaProvider
 from ..request_cls import DebugTrailRequest, DumperRequest
 from .basic_gen import (
     CodeGenHook,
+    InlinedConverter,
     ModelDumperGen,
     compile_closure_with_globals_capturing,
+    fetch_closure_compiler,
     fetch_code_gen_hook,
+    fetch_inlining_depth,
+    fetch_parent_inlining_depth,
     get_extra_targets_at_crown,
+    get_inlining_depth,
     get_optional_fields_at_list_crown,
+    get_skipped_fields,
     get_wild_extra_targets,
+    select_inlined_converters,
 )
 from .crown_definitions import OutExtraMove, OutputNameLayout, OutputNameLayoutRequest
 from .dumper_gen import BuiltinModelDumperGen, ModelOutputJSONSchemaGen
@@ -45,6 +55,9 @@ class ModelDumperProvider(DumperProvider, JSONSchemaProvider):
             fields_dumpers=OrderedMappingHashWrapper(fields_dumpers),
             debug_trail=mediator.mandatory_provide(DebugTrailRequest(loc_stack=request.loc_stack)),
             code_gen_hook=AlwaysEqualHashWrapper(fetch_code_gen_hook(mediator, request.loc_stack)),
+            compiler=AlwaysEqualHashWrapper(self._get_compiler(mediator, request)),
+            max_inlining_depth=fetch_inlining_depth(mediator, request.loc_stack),
+            is_inlinable=fetch_parent_inlining_depth(mediator, request.loc_stack) > 0,
             model_identity=self._fetch_model_identity(mediator, request, shape, name_layout),
             closure_name=self._get_closure_name(request),
             file_name=self._get_file_name(request),
@@ -58,27 +71,67 @@ class ModelDumperProvider(DumperProvider, JSONSchemaProvider):
         fields_dumpers: OrderedMappingHashWrapper[Mapping[str, Dumper]],
         debug_trail: DebugTrail,
         code_gen_hook: AlwaysEqualHashWrapper[CodeGenHook],
+        compiler: AlwaysEqualHashWrapper[ClosureCompiler],
+        max_inlining_depth: int,
+        is_inlinable: bool,
         model_identity: str,
         closure_name: str,
         file_name: str,
     ) -> Dumper:
         self._validate_params(shape, name_layout)
+        inlined_dumpers = self._select_inlined_dumpers(shape, name_layout, fields_dumpers.mapping, max_inlining_depth)
         dumper_gen = self._create_model_dumper_gen(
             debug_trail=debug_trail,
             shape=shape,
             name_layout=name_layout,
             fields_dumpers=fields_dumpers.mapping,
             model_identity=model_identity,
+            inlined_dumpers=inlined_dumpers,
         )
         dumper_code, dumper_namespace = dumper_gen.produce_code(closure_name=closure_name)
-        return compile_closure_with_globals_capturing(
-            compiler=self._get_compiler(),
+        dumper = compile_closure_with_globals_capturing(
+            compiler=compiler.value,
             code_gen_hook=code_gen_hook.value,
             namespace=dumper_namespace,
             closure_code=dumper_code,
             closure_name=closure_name,
             file_name=file_name,
         )
+        json_chunks_dumper = make_model_json_chunks_dumper(
+            shape=shape,
+            name_layout=name_layout,
+            fields_dumpers=fields_dumpers.mapping,
+            debug_trail=debug_trail,
+        )
+        if json_chunks_dumper is not None:
+            with_json_chunks_dumper(json_chunks_dumper, dumper)
+        if is_inlinable:
+            with_inlinable_code(
+                InlinableCode(
+                    source=dumper_code,
+                    namespace=dumper_namespace,
+                    depth=get_inlining_depth(inlined_dumpers),
+                ),
+                dumper,
+            )
+        return dumper
+
+    def _select_inlined_dumpers(
+        self,
+        shape: OutputShape,
+        name_layout: OutputNameLayout,
+        fields_dumpers: Mapping[str, Dumper],
+        max_inlining_depth: int,
+    ) -> Mapping[str, InlinedConverter]:
+        skipped_fields = get_skipped_fields(shape, name_layout)
+        return select_inlined_converters(
+            {
+                field_id: dumper
+                for field_id, dumper in fields_dumpers.items()
+                if field_id not in skipped_fields
+            },
+            max_inlining_depth,
+        )
 
     def _generate_json_schema(self, mediator: Mediator, request: JSONSchemaRequest) -> JSONSchema:
         if request.ctx.direction != Direction.OUTPUT:
@@ -154,6 +207,12 @@ class ModelDumperProvider(DumperProvider, JSONSchemaProvider):
             name_layout=name_layout,
             fields_dumpers=fields_dumpers,
             model_identity=self._fetch_model_identity(mediator, request, shape, name_layout),
+            inlined_dumpers=self._select_inlined_dumpers(
+                shape,
+                name_layout,
+                fields_dumpers,
+                fetch_inlining_depth(mediator, request.loc_stack),
+            ),
         )
 
     def _fetch_model_identity(
@@ -172,6 +231,7 @@ class ModelDumperProvider(DumperProvider, JSONSchemaProvider):
         name_layout: OutputNameLayout,
         fields_dumpers: Mapping[str, Dumper],
         model_identity: str,
+        inlined_dumpers: Mapping[str, InlinedConverter],
     ) -> ModelDumperGen:
         return BuiltinModelDumperGen(
             shape=shape,
@@ -179,6 +239,7 @@ class ModelDumperProvider(DumperProvider, JSONSchemaProvider):
             debug_trail=debug_trail,
             fields_dumpers=fields_dumpers,
             model_identity=model_identity,
+            inlined_dumpers=inlined_dumpers,
         )
 
     def _request_to_view_string(self, request: DumperRequest) -> str:
@@ -200,8 +261,8 @@ class ModelDumperProvider(DumperProvider, JSONSchemaProvider):
             "model_dumper", self._name_sanitizer.sanitize(self._request_to_view_string(request)),
         )
 
-    def _get_compiler(self) -> ClosureCompiler:
-        return BasicClosureCompiler()
+    def _get_compiler(self, mediator: Mediator, request: DumperRequest) -> ClosureCompiler:
+        return fetch_closure_compiler(mediator, request.loc_stack)
 
     def _fetch_shape(self, mediator: Mediator, request: LocatedRequest) -> OutputShape:
         return provide_generic_resolved_shape(mediator, OutputShapeRequest(loc_stack=request.loc_stack))
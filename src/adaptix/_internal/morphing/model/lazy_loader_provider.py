@@ -0,0 +1,220 @@
+import copyreg
+from collections.abc import Iterable, Mapping
+from contextlib import suppress
+from dataclasses import is_dataclass, replace
+from typing import Any, Callable, TypeVar, Union
+
+from ...common import Loader, TypeHint, VarTuple
+from ...definitions import DebugTrail
+from ...model_tools.definitions import InputField
+from ...provider.essential import CannotProvide, Mediator
+from ...special_cases_optimization import get_optional_wrapping, is_model_loader
+from ...struct_trail import TrailElement, extend_trail, render_trail_as_note
+from ...type_tools import normalize_type
+from ..request_cls import DebugTrailRequest, LoaderRequest
+from .crown_definitions import InpCrown, InpDictCrown, InpFieldCrown, InpListCrown
+from .loader_provider import ModelLoaderProvider
+
+T = TypeVar("T")
+
+_NOT_DEFERRED_ITERABLES = (str, bytes, bytearray)
+
+
+class _DeferredValue:
+    __slots__ = ("data", "loader", "trail", "debug_trail")
+
+    def __init__(self, loader: Loader, trail: tuple[TrailElement, ...], debug_trail: DebugTrail, data: Any):
+        self.loader = loader
+        self.trail = trail
+        self.debug_trail = debug_trail
+        self.data = data
+
+    def load(self) -> Any:
+        try:
+            return self.loader(self.data)
+        except Exception as e:
+            if self.debug_trail != DebugTrail.DISABLE:
+                render_trail_as_note(extend_trail(e, self.trail))
+            raise
+
+
+class _NotLoaded:
+    __slots__ = ()
+
+    def __repr__(self):
+        return "NOT_LOADED"
+
+
+# Marks attribute that is not loaded at all (see projected loaders)
+NOT_LOADED = _NotLoaded()
+
+
+class _LazyField:
+    """Data descriptor storing the value at instance ``__dict__``
+    and replacing deferred value with the loaded one on the first access
+    """
+    __slots__ = ("_name", )
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            value = instance.__dict__[self._name]
+        except KeyError:
+            raise AttributeError(self._name) from None
+        if type(value) is _DeferredValue:
+            value = value.load()
+            instance.__dict__[self._name] = value
+        elif value is NOT_LOADED:
+            raise AttributeError(f"Field {self._name!r} is not loaded")
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self._name] = value
+
+    def __delete__(self, instance):
+        try:
+            del instance.__dict__[self._name]
+        except KeyError:
+            raise AttributeError(self._name) from None
+
+
+def _restore_model(cls: type[T], state: Mapping[str, Any]) -> T:
+    instance = cls.__new__(cls)
+    for name, value in state.items():
+        object.__setattr__(instance, name, value)
+    return instance
+
+
+def is_lazy_model_supported(model: type) -> bool:
+    return is_dataclass(model) or hasattr(model, "__attrs_attrs__")
+
+
+def make_lazy_model_class(model: type, lazy_fields: frozenset[str], repr_fields: VarTuple[str] = ()) -> type:
+    slot_names = copyreg._slotnames(model)  # type: ignore[attr-defined]
+
+    def __reduce_ex__(self, protocol):  # noqa: N807
+        # instance is reduced to the original model, so it can be pickled and all fields are loaded
+        state = {
+            name: getattr(self, name)
+            for name, value in self.__dict__.items()
+            if value is not NOT_LOADED
+        }
+        for name in slot_names:
+            with suppress(AttributeError):
+                state[name] = getattr(self, name)
+        return _restore_model, (model, state)
+
+    namespace: dict[str, Any] = {
+        "__module__": model.__module__,
+        "__qualname__": model.__qualname__,
+        "__class__": property(lambda self: model),
+        "__reduce_ex__": __reduce_ex__,
+        **{name: _LazyField(name) for name in lazy_fields},
+    }
+    if repr_fields:
+        def get_repr_value(self, name):
+            value = self.__dict__.get(name)
+            return value if value is NOT_LOADED else getattr(self, name)
+
+        def __repr__(self):  # noqa: N807
+            fields = ", ".join(f"{name}={get_repr_value(self, name)!r}" for name in repr_fields)
+            return f"{model.__qualname__}({fields})"
+
+        namespace["__repr__"] = __repr__
+    return type(model.__name__, (model, ), namespace)
+
+
+def _find_field_trails(crown: InpCrown, trail: tuple[TrailElement, ...] = ()) -> Iterable[tuple[str, tuple]]:
+    if isinstance(crown, InpFieldCrown):
+        yield crown.id, trail
+    elif isinstance(crown, InpDictCrown):
+        for key, sub_crown in crown.map.items():
+            yield from _find_field_trails(sub_crown, (*trail, key))
+    elif isinstance(crown, InpListCrown):
+        for idx, sub_crown in enumerate(crown.map):
+            yield from _find_field_trails(sub_crown, (*trail, idx))
+
+
+def _is_collection_type(tp: TypeHint) -> bool:
+    norm = normalize_type(tp)
+    if norm.origin is Union:
+        return any(_is_collection_type(arg.source) for arg in norm.args)
+    return (
+        isinstance(norm.origin, type)
+        and issubclass(norm.origin, Iterable)
+        and not issubclass(norm.origin, _NOT_DEFERRED_ITERABLES)
+    )
+
+
+def _is_model_loader(loader: Loader) -> bool:
+    optional_wrapping = get_optional_wrapping(loader)
+    if optional_wrapping is not None:
+        loader = optional_wrapping.inner
+    return is_model_loader(loader)
+
+
+class LazyModelLoaderProvider(ModelLoaderProvider):
+    """Loader provider creating model instances right after loading of the top-level structure.
+
+    Nested models and collections are loaded on the first access to the attribute.
+    The model is created via a subclass with data descriptors for such fields
+    that pretends to be the original class (``__class__`` returns it).
+    Only dataclasses and attrs classes are supported.
+    """
+
+    def provide_loader(self, mediator: Mediator, request: LoaderRequest) -> Loader:
+        shape = self._fetch_shape(mediator, request)
+        constructor = shape.constructor
+        if not isinstance(constructor, type) or not is_lazy_model_supported(constructor):
+            raise CannotProvide(
+                "Lazy loading is supported only for dataclasses and attrs classes",
+                is_demonstrative=True,
+            )
+
+        name_layout = self._fetch_name_layout(mediator, request, shape)
+        field_loaders = self._fetch_field_loaders(mediator, request, shape)
+        lazy_fields = frozenset(
+            field.id
+            for field in shape.fields
+            if self._is_deferred(field, field_loaders[field.id])
+        )
+        if not lazy_fields:
+            return self._provide_loader_for_fields(mediator, request, shape, name_layout, field_loaders)
+
+        debug_trail = mediator.mandatory_provide(DebugTrailRequest(loc_stack=request.loc_stack))
+        trails = dict(_find_field_trails(name_layout.crown))
+        return self._provide_loader_for_fields(
+            mediator,
+            request,
+            replace(
+                shape,
+                constructor=mediator.cached_call(make_lazy_model_class, constructor, lazy_fields),
+            ),
+            name_layout,
+            {
+                field_id: (
+                    self._make_deferring_loader(loader, trails.get(field_id, ()), debug_trail)
+                    if field_id in lazy_fields else
+                    loader
+                )
+                for field_id, loader in field_loaders.items()
+            },
+        )
+
+    def _is_deferred(self, field: InputField, loader: Loader) -> bool:
+        return _is_model_loader(loader) or _is_collection_type(field.type)
+
+    def _make_deferring_loader(
+        self,
+        loader: Loader,
+        trail: tuple[TrailElement, ...],
+        debug_trail: DebugTrail,
+    ) -> Callable[[Any], _DeferredValue]:
+        def deferring_loader(data):
+            return _DeferredValue(loader, trail, debug_trail, data)
+
+        return deferring_loader
@@ -6,12 +6,13 @@ from typing import Callable, Optional
 
 from ...code_tools.cascade_namespace import BuiltinCascadeNamespace, CascadeNamespace
 from ...code_tools.code_builder import CodeBuilder
+from ...code_tools.inliner import inline_code
 from ...code_tools.utils import get_literal_expr, get_literal_from_factory
 from ...common import Loader
 from ...compat import CompatExceptionGroup
 from ...definitions import DebugTrail
 from ...model_tools.definitions import DefaultFactory, DefaultValue, InputField, InputShape, Param, ParamKind
-from ...special_cases_optimization import as_is_stub
+from ...special_cases_optimization import as_is_stub, get_exact_type_check
 from ...struct_trail import append_trail, extend_trail, render_trail_as_note
 from ...utils import Omittable, Omitted
 from ..json_schema.definitions import JSONSchema
@@ -25,8 +26,9 @@ from ..load_error import (
     NoRequiredFieldsLoadError,
     NoRequiredItemsLoadError,
     TypeLoadError,
+    UnionLoadError,
 )
-from .basic_gen import ModelLoaderGen
+from .basic_gen import InlinedConverter, ModelLoaderGen
 from .crown_definitions import (
     BranchInpCrown,
     CrownPath,
@@ -131,6 +133,9 @@ class GenState(Namer):
     def v_field_loader(self, field_id: str) -> str:
         return f"loader_{field_id}"
 
+    def v_field_expected_type(self, field_id: str) -> str:
+        return f"expected_type_{field_id}"
+
     def v_raw_field(self, field: InputField) -> str:
         return f"r_{field.id}"
 
@@ -155,13 +160,23 @@ class GenState(Namer):
         self._parent_path = self._path
         self._path += (key,)
         self._crown_stack.append(crown)
-        self._last_path_idx += 1
-        self.path_to_suffix[self._path] = str(self._last_path_idx)
+        if self._path not in self.path_to_suffix:
+            self._last_path_idx += 1
+            self.path_to_suffix[self._path] = str(self._last_path_idx)
         yield
         self._crown_stack.pop(-1)
         self._path = past
         self._parent_path = past_parent
 
+    @contextlib.contextmanager
+    def separate_builder(self):
+        past = self.builder
+        self.builder = CodeBuilder()
+        try:
+            yield self.builder
+        finally:
+            self.builder = past
+
     def get_field(self, crown: InpFieldCrown) -> InputField:
         self.field_id_to_path[crown.id] = self._path
         return self._name_to_field[crown.id]
@@ -188,6 +203,7 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         skipped_fields: Set[str],
         model_identity: str,
         props: ModelLoaderProps,
+        inlined_loaders: Mapping[str, InlinedConverter],
     ):
         self._shape = shape
         self._name_layout = name_layout
@@ -199,7 +215,9 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         self._field_id_to_param: dict[str, Param] = {
             param.field_id: param for param in self._shape.params
         }
+        self._field_id_to_idx: dict[str, int] = {field.id: idx for idx, field in enumerate(self._shape.fields)}
         self._field_loaders = field_loaders
+        self._inlined_loaders = inlined_loaders
         self._skipped_fields = skipped_fields
         self._model_identity = model_identity
         self._props = props
@@ -262,9 +280,7 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         if self._has_packed_fields:
             state.builder += "packed_fields = {}"
 
-        if not self._gen_root_crown_dispatch(state, self._name_layout.crown):
-            raise TypeError
-
+        self._gen_root_crown(state, self._name_layout.crown)
         self._gen_extra_targets_assignment(state)
 
         if self._debug_trail == DebugTrail.ALL:
@@ -354,6 +370,81 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
             state.builder += "return "
             state.builder.extend_including(constructor_builder)
 
+    def _gen_root_crown(self, state: GenState, crown: InpCrown) -> None:
+        # fast path repeats code of all fields, so it is not generated if code of nested models is inlined,
+        # otherwise the size of the code grows exponentially with the inlining depth
+        if not isinstance(crown, InpDictCrown) or not self._is_flat_dict_crown(crown) or self._inlined_loaders:
+            if not self._gen_root_crown_dispatch(state, crown):
+                raise TypeError
+            return
+
+        with state.separate_builder() as general_builder:
+            self._gen_dict_crown(state, crown)
+        with state.separate_builder() as fast_path_builder:
+            self._gen_flat_dict_crown_fast_path(state, crown)
+
+        if self._get_dict_crown_required_keys(crown) == crown.map.keys():
+            keys_check = f"{state.v_data}.keys() == {state.v_known_keys}"
+        else:
+            keys_check = f"{state.v_required_keys} <= {state.v_data}.keys() <= {state.v_known_keys}"
+
+        with state.builder(f"if type({state.v_data}) is dict and {keys_check}:"):
+            state.builder.extend(fast_path_builder)
+        with state.builder("else:"):
+            state.builder.extend(general_builder)
+        state.builder.empty_line()
+
+    def _is_flat_dict_crown(self, crown: InpDictCrown) -> bool:
+        return (
+            all(isinstance(sub_crown, (InpFieldCrown, InpNoneCrown)) for sub_crown in crown.map.values())
+            and any(isinstance(sub_crown, InpFieldCrown) for sub_crown in crown.map.values())
+        )
+
+    def _gen_flat_dict_crown_fast_path(self, state: GenState, crown: InpDictCrown) -> None:
+        """Generates code for the dict that contains all required keys and does not contain extra keys.
+        Such data cannot produce any lookup or type errors, so values are taken by direct indexing.
+        """
+        if self._can_collect_extra:
+            state.builder += f"{state.v_extra} = {{}}"
+
+        for key, sub_crown in crown.map.items():
+            if not isinstance(sub_crown, InpFieldCrown):
+                continue
+
+            with state.add_key(sub_crown, key):
+                field = state.get_field(sub_crown)
+                loader_arg = f"{state.parent.v_data}[{key!r}]"
+                if field.is_required:
+                    self._gen_field_assignment(
+                        assign_to=state.v_field(field),
+                        field_id=field.id,
+                        loader_arg=loader_arg,
+                        state=state,
+                    )
+                    continue
+
+                if self._is_packed_field(field):
+                    param_name = self._field_id_to_param[field.id].name
+                    assign_to = f"packed_fields[{param_name!r}]"
+                    on_lookup_error = "pass"
+                else:
+                    assign_to = state.v_field(field)
+                    on_lookup_error = f"{state.v_field(field)} = {self._get_default_clause_expr(state, field)}"
+
+                with state.builder(f"if {key!r} in {state.parent.v_data}:"):
+                    self._gen_field_assignment(
+                        assign_to=assign_to,
+                        field_id=field.id,
+                        loader_arg=loader_arg,
+                        state=state,
+                    )
+                state.builder(
+                    f"""
+                    else:
+                        {on_lookup_error}
+                    """,
+                )
+
     def _gen_root_crown_dispatch(self, state: GenState, crown: InpCrown) -> bool:
         """Returns True if code is generated"""
         if isinstance(crown, InpDictCrown):
@@ -730,25 +821,109 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         loader_arg: str,
         state: GenState,
     ):
-        if self._field_loaders[field_id] == as_is_stub:
-            processing_expr = loader_arg
-        else:
-            field_loader = state.v_field_loader(field_id)
-            processing_expr = f"{field_loader}({loader_arg})"
+        processing_code = (
+            self._gen_inlined_loading(state, field_id, loader_arg, assign_to)
+            or self._gen_exact_type_check(state, field_id, loader_arg, assign_to)
+        )
+        if processing_code is None:
+            if self._field_loaders[field_id] == as_is_stub:
+                processing_code = f"{assign_to} = {loader_arg}"
+            else:
+                processing_code = f"{assign_to} = {state.v_field_loader(field_id)}({loader_arg})"
 
         if self._debug_trail in (DebugTrail.ALL, DebugTrail.FIRST):
+            with state.builder("try:"):
+                state.builder(processing_code)
             state.builder(
                 f"""
-                try:
-                    {assign_to} = {processing_expr}
                 except Exception as e:
                     {state.emit_error('e')}
                 """,
             )
         else:
-            state.builder(
-                f"{assign_to} = {processing_expr}",
+            state.builder(processing_code)
+
+    def _gen_exact_type_check(self, state: GenState, field_id: str, loader_arg: str, assign_to: str) -> Optional[str]:
+        """Returns code replacing the call of the field loader that checks exact type of data
+        or None if the field loader is not such a loader
+        """
+        exact_type_check = get_exact_type_check(self._field_loaders[field_id])
+        if exact_type_check is None:
+            return None
+        type_exprs = [get_literal_expr(tp) for tp in exact_type_check.types]
+        if None in type_exprs:
+            return None
+
+        state.namespace.add_constant(state.v_field_expected_type(field_id), exact_type_check.expected_type)
+        builder = CodeBuilder()
+        if not loader_arg.isidentifier():
+            v_raw_field = state.v_raw_field(self._id_to_field[field_id])
+            builder += f"{v_raw_field} = {loader_arg}"
+            loader_arg = v_raw_field
+
+        first_type_expr, *other_type_exprs = type_exprs
+        builder += f"""
+            if type({loader_arg}) is {first_type_expr}:
+                {assign_to} = {loader_arg}
+        """
+        for type_expr in other_type_exprs:
+            builder += f"""
+                elif type({loader_arg}) is {type_expr}:
+                    {assign_to} = {first_type_expr}({loader_arg})
+            """
+        builder += f"""
+            else:
+                raise TypeLoadError({state.v_field_expected_type(field_id)}, {loader_arg})
+        """
+        return builder.string()
+
+    def _gen_inlined_loading(self, state: GenState, field_id: str, loader_arg: str, assign_to: str) -> Optional[str]:
+        """Returns code of the field loader inlined into the model loader
+        or None if the field loader cannot be inlined
+        """
+        inlined = self._inlined_loaders.get(field_id)
+        if inlined is None:
+            return None
+        try:
+            # other names of the closure never start with this prefix
+            inlined_code = inline_code(
+                inlined.code,
+                prefix=f"i{self._field_id_to_idx[field_id]}_",
+                result_target=assign_to,
             )
+        except ValueError:
+            return None
+
+        for name, value in inlined_code.namespace.items():
+            state.namespace.add_constant(name, value)
+
+        builder = CodeBuilder()
+        builder += f"{inlined_code.arg} = {loader_arg}"
+        optional_wrapping = inlined.optional_wrapping
+        if optional_wrapping is None:
+            builder += inlined_code.body
+            return builder.string()
+
+        builder += f"""
+            if {inlined_code.arg} is None:
+                {assign_to} = None
+            else:
+        """
+        with builder:
+            if optional_wrapping.union_error_message is None:
+                builder += inlined_code.body
+            else:
+                state.namespace.add_constant("UnionLoadError", UnionLoadError)
+                with builder("try:"):
+                    builder += inlined_code.body
+                builder += f"""
+                    except LoadError as e:
+                        raise UnionLoadError(
+                            {optional_wrapping.union_error_message!r},
+                            [TypeLoadError(None, {inlined_code.arg}), e],
+                        )
+                """
+        return builder.string()
 
     def _gen_extra_targets_assignment(self, state: GenState):
         # Saturate extra targets with data.
@@ -1,7 +1,8 @@
 from collections.abc import Mapping, Set
 from functools import partial
 
-from ...code_tools.compiler import BasicClosureCompiler, ClosureCompiler
+from ...code_tools.compiler import ClosureCompiler
+from ...code_tools.inliner import InlinableCode
 from ...code_tools.name_sanitizer import BuiltinNameSanitizer, NameSanitizer
 from ...common import Loader
 from ...definitions import DebugTrail, Direction
@@ -10,6 +11,13 @@ from ...provider.essential import CannotProvide, Mediator
 from ...provider.fields import input_field_to_loc
 from ...provider.located_request import LocatedRequest
 from ...provider.shape_provider import InputShapeRequest, provide_generic_resolved_shape
+from ...special_cases_optimization import (
+    InputTypeFilter,
+    mark_model_loader,
+    with_inlinable_code,
+    with_input_type_filter,
+    with_required_keys,
+)
 from ...utils import AlwaysEqualHashWrapper, Omittable, Omitted, OrderedMappingHashWrapper
 from ..json_schema.definitions import JSONSchema
 from ..json_schema.request_cls import JSONSchemaRequest
@@ -19,16 +27,26 @@ from ..provider_template import JSONSchemaProvider, LoaderProvider
 from ..request_cls import DebugTrailRequest, DumperRequest, LoaderRequest, StrictCoercionRequest
 from .basic_gen import (
     CodeGenHook,
+    InlinedConverter,
     ModelLoaderGen,
     compile_closure_with_globals_capturing,
+    fetch_closure_compiler,
     fetch_code_gen_hook,
+    fetch_inlining_depth,
+    fetch_parent_inlining_depth,
     get_extra_targets_at_crown,
+    get_inlining_depth,
     get_optional_fields_at_list_crown,
     get_skipped_fields,
     get_wild_extra_targets,
     has_collect_policy,
+    select_inlined_converters,
 )
-from .crown_definitions import InputNameLayout, InputNameLayoutRequest
+from .crown_definitions import InpDictCrown, InpFieldCrown, InpListCrown, InputNameLayout, InputNameLayoutRequest
+
+# data of these types raises TypeError at any lookup
+_NOT_MAPPING_TYPES = frozenset([type(None), bool, int, float, str, bytes, bytearray, list, tuple])
+_NOT_SEQUENCE_TYPES = frozenset([type(None), bool, int, float, dict])
 
 
 class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
@@ -45,6 +63,16 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
         shape = self._fetch_shape(mediator, request)
         name_layout = self._fetch_name_layout(mediator, request, shape)
         field_loaders = self._fetch_field_loaders(mediator, request, shape)
+        return self._provide_loader_for_fields(mediator, request, shape, name_layout, field_loaders)
+
+    def _provide_loader_for_fields(
+        self,
+        mediator: Mediator,
+        request: LoaderRequest,
+        shape: InputShape,
+        name_layout: InputNameLayout,
+        field_loaders: Mapping[str, Loader],
+    ) -> Loader:
         return mediator.cached_call(
             self._make_loader,
             shape=shape,
@@ -53,6 +81,9 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
             strict_coercion=mediator.mandatory_provide(StrictCoercionRequest(loc_stack=request.loc_stack)),
             debug_trail=mediator.mandatory_provide(DebugTrailRequest(loc_stack=request.loc_stack)),
             code_gen_hook=AlwaysEqualHashWrapper(fetch_code_gen_hook(mediator, request.loc_stack)),
+            compiler=AlwaysEqualHashWrapper(self._get_compiler(mediator, request)),
+            max_inlining_depth=fetch_inlining_depth(mediator, request.loc_stack),
+            is_inlinable=fetch_parent_inlining_depth(mediator, request.loc_stack) > 0,
             model_identity=self._fetch_model_identity(mediator, request, shape, name_layout),
             closure_name=self._get_closure_name(request),
             file_name=self._get_file_name(request),
@@ -67,12 +98,16 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
         strict_coercion: bool,
         debug_trail: DebugTrail,
         code_gen_hook: AlwaysEqualHashWrapper[CodeGenHook],
+        compiler: AlwaysEqualHashWrapper[ClosureCompiler],
+        max_inlining_depth: int,
+        is_inlinable: bool,
         model_identity: str,
         closure_name: str,
         file_name: str,
     ) -> Loader:
         skipped_fields = get_skipped_fields(shape, name_layout)
         self._validate_params(shape, name_layout, skipped_fields)
+        inlined_loaders = self._select_inlined_loaders(field_loaders.mapping, skipped_fields, max_inlining_depth)
         loader_gen = self._create_model_loader_gen(
             debug_trail=debug_trail,
             strict_coercion=strict_coercion,
@@ -81,16 +116,62 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
             field_loaders=field_loaders.mapping,
             skipped_fields=skipped_fields,
             model_identity=model_identity,
+            inlined_loaders=inlined_loaders,
         )
         loader_code, loader_namespace = loader_gen.produce_code(closure_name=closure_name)
-        return compile_closure_with_globals_capturing(
-            compiler=self._get_compiler(),
+        loader = compile_closure_with_globals_capturing(
+            compiler=compiler.value,
             code_gen_hook=code_gen_hook.value,
             namespace=loader_namespace,
             closure_code=loader_code,
             closure_name=closure_name,
             file_name=file_name,
         )
+        if is_inlinable:
+            with_inlinable_code(
+                InlinableCode(
+                    source=loader_code,
+                    namespace=loader_namespace,
+                    depth=get_inlining_depth(inlined_loaders),
+                ),
+                loader,
+            )
+        mark_model_loader(loader)
+        return self._attach_input_metadata(shape, name_layout, loader)
+
+    def _select_inlined_loaders(
+        self,
+        field_loaders: Mapping[str, Loader],
+        skipped_fields: Set[str],
+        max_inlining_depth: int,
+    ) -> Mapping[str, InlinedConverter]:
+        return select_inlined_converters(
+            {
+                field_id: loader
+                for field_id, loader in field_loaders.items()
+                if field_id not in skipped_fields
+            },
+            max_inlining_depth,
+        )
+
+    def _attach_input_metadata(self, shape: InputShape, name_layout: InputNameLayout, loader: Loader) -> Loader:
+        crown = name_layout.crown
+        if isinstance(crown, InpDictCrown):
+            with_input_type_filter(InputTypeFilter(rejected=_NOT_MAPPING_TYPES), loader)
+            with_required_keys(
+                frozenset(
+                    key for key, sub_crown in crown.map.items()
+                    if (
+                        shape.fields_dict[sub_crown.id].is_required
+                        if isinstance(sub_crown, InpFieldCrown) else
+                        isinstance(sub_crown, (InpDictCrown, InpListCrown))
+                    )
+                ),
+                loader,
+            )
+        elif isinstance(crown, InpListCrown):
+            with_input_type_filter(InputTypeFilter(rejected=_NOT_SEQUENCE_TYPES), loader)
+        return loader
 
     def _generate_json_schema(self, mediator: Mediator, request: JSONSchemaRequest) -> JSONSchema:
         if request.ctx.direction != Direction.INPUT:
@@ -158,6 +239,11 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
             field_loaders=field_loaders,
             skipped_fields=skipped_fields,
             model_identity=self._fetch_model_identity(mediator, request, shape, name_layout),
+            inlined_loaders=self._select_inlined_loaders(
+                field_loaders,
+                skipped_fields,
+                fetch_inlining_depth(mediator, request.loc_stack),
+            ),
         )
 
     def _fetch_model_identity(
@@ -179,6 +265,7 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
         field_loaders: Mapping[str, Loader],
         skipped_fields: Set[str],
         model_identity: str,
+        inlined_loaders: Mapping[str, InlinedConverter],
     ) -> ModelLoaderGen:
         return BuiltinModelLoaderGen(
             shape=shape,
@@ -189,6 +276,7 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
             skipped_fields=skipped_fields,
             model_identity=model_identity,
             props=self._props,
+            inlined_loaders=inlined_loaders,
         )
 
     def _request_to_view_string(self, request: LoaderRequest) -> str:
@@ -210,8 +298,8 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
             "model_loader", self._name_sanitizer.sanitize(self._request_to_view_string(request)),
         )
 
-    def _get_compiler(self) -> ClosureCompiler:
-        return BasicClosureCompiler()
+    def _get_compiler(self, mediator: Mediator, request: LoaderRequest) -> ClosureCompiler:
+        return fetch_closure_compiler(mediator, request.loc_stack)
 
     def _fetch_shape(self, mediator: Mediator, request: LocatedRequest) -> InputShape:
         return provide_generic_resolved_shape(mediator, InputShapeRequest(loc_stack=request.loc_stack))
@@ -0,0 +1,197 @@
+import copyreg
+from collections.abc import Iterable, Set
+from dataclasses import replace
+from typing import Any, Callable, Optional
+
+from ...common import Loader
+from ...model_tools.definitions import (
+    DefaultFactory,
+    DefaultFactoryWithSelf,
+    DefaultValue,
+    InputField,
+    InputShape,
+    Param,
+    ParamKind,
+)
+from ...provider.essential import CannotProvide, Mediator
+from ..request_cls import LoaderRequest
+from .crown_definitions import (
+    ExtraSkip,
+    ExtraTargets,
+    InpCrown,
+    InpDictCrown,
+    InpFieldCrown,
+    InpListCrown,
+    InpNoneCrown,
+    InputNameLayout,
+)
+from .lazy_loader_provider import NOT_LOADED, is_lazy_model_supported, make_lazy_model_class
+from .loader_provider import ModelLoaderProvider
+
+
+def _make_projection_constructor(lazy_model: type, skipped_fields: Iterable[InputField]) -> Callable[..., Any]:
+    # Some required fields are not loaded, so the original constructor cannot be called.
+    # The instance is filled directly bypassing __init__,
+    # so __post_init__, attrs validators and converters are not executed.
+    template = {}
+    factories = {}
+    factories_with_self = {}
+    for field in skipped_fields:
+        if isinstance(field.default, DefaultValue):
+            template[field.id] = field.default.value
+        elif isinstance(field.default, DefaultFactory):
+            factories[field.id] = field.default.factory
+        elif isinstance(field.default, DefaultFactoryWithSelf):
+            factories_with_self[field.id] = field.default.factory
+        else:
+            template[field.id] = NOT_LOADED
+
+    def projection_constructor(**kwargs):
+        instance = lazy_model.__new__(lazy_model)
+        instance_dict = instance.__dict__
+        instance_dict.update(template)
+        for name, factory in factories.items():
+            instance_dict[name] = factory()
+        instance_dict.update(kwargs)
+        for name, factory_with_self in factories_with_self.items():
+            try:
+                instance_dict[name] = factory_with_self(instance)
+            except AttributeError:  # factory requires not loaded field
+                instance_dict[name] = NOT_LOADED
+        return instance
+
+    return projection_constructor
+
+
+def _project_crown(crown: InpCrown, only: Set[str]) -> Optional[InpCrown]:
+    if isinstance(crown, InpFieldCrown):
+        return crown if crown.id in only else None
+    if isinstance(crown, InpNoneCrown):
+        return None
+    if isinstance(crown, InpDictCrown):
+        dict_map = {}
+        for key, sub_crown in crown.map.items():
+            projected = _project_crown(sub_crown, only)
+            if projected is not None:
+                dict_map[key] = projected
+        return InpDictCrown(dict_map, extra_policy=ExtraSkip()) if dict_map else None
+    if isinstance(crown, InpListCrown):
+        list_map = [_project_crown(sub_crown, only) for sub_crown in crown.map]
+        while list_map and list_map[-1] is None:
+            list_map.pop()
+        if not list_map:
+            return None
+        return InpListCrown(
+            tuple(InpNoneCrown() if sub_crown is None else sub_crown for sub_crown in list_map),
+            extra_policy=ExtraSkip(),
+        )
+    raise TypeError
+
+
+class ProjectedModelLoaderProvider(ModelLoaderProvider):
+    """Loader provider loading only selected fields of the model at the root of the request.
+
+    Other parts of input data are ignored, skipped optional fields get default values.
+    If all required fields are selected, the model is created by its constructor.
+    Otherwise, instances of dataclasses and attrs classes are filled bypassing ``__init__``
+    (``__post_init__``, validators and converters are not executed),
+    skipped required fields are not set, so the access raises ``AttributeError``.
+    """
+
+    def __init__(self, only: Set[str]):
+        super().__init__()
+        self._only = only
+
+    def provide_loader(self, mediator: Mediator, request: LoaderRequest) -> Loader:
+        if len(request.loc_stack) != 1:
+            raise CannotProvide
+
+        try:
+            shape = self._fetch_shape(mediator, request)
+        except CannotProvide:
+            raise CannotProvide(
+                "Only models can be loaded partially",
+                is_terminal=True,
+                is_demonstrative=True,
+            ) from None
+
+        unknown_fields = self._only - shape.fields_dict.keys()
+        if unknown_fields:
+            raise CannotProvide(
+                f"Fields {sorted(unknown_fields)} are not found at the model",
+                is_terminal=True,
+                is_demonstrative=True,
+            )
+
+        name_layout = self._project_name_layout(self._fetch_name_layout(mediator, request, shape))
+        projected_shape = self._project_shape(mediator, shape)
+        field_loaders = self._fetch_field_loaders(mediator, request, projected_shape)
+        return self._provide_loader_for_fields(mediator, request, projected_shape, name_layout, field_loaders)
+
+    def _project_name_layout(self, name_layout: InputNameLayout) -> InputNameLayout:
+        if isinstance(name_layout.extra_move, ExtraTargets):
+            selected_extra_targets = self._only & set(name_layout.extra_move.fields)
+            if selected_extra_targets:
+                raise CannotProvide(
+                    f"Fields {sorted(selected_extra_targets)} collecting extra data cannot be loaded partially",
+                    is_terminal=True,
+                    is_demonstrative=True,
+                )
+
+        crown = _project_crown(name_layout.crown, self._only)
+        if not isinstance(crown, (InpDictCrown, InpListCrown)):
+            crown = (
+                InpListCrown((), extra_policy=ExtraSkip())
+                if isinstance(name_layout.crown, InpListCrown) else
+                InpDictCrown({}, extra_policy=ExtraSkip())
+            )
+        return replace(name_layout, crown=crown, extra_move=None)
+
+    def _project_shape(self, mediator: Mediator, shape: InputShape) -> InputShape:
+        not_loaded_fields = [
+            field.id for field in shape.fields
+            if field.is_required and field.id not in self._only
+        ]
+        if not not_loaded_fields:
+            return shape
+
+        model = shape.constructor
+        if isinstance(model, type) and is_lazy_model_supported(model):
+            return self._project_lazy_model_shape(mediator, shape, model)
+        raise CannotProvide(
+            f"Required fields {not_loaded_fields} are not selected,"
+            f" only dataclasses and attrs classes can be created without them",
+            is_terminal=True,
+            is_demonstrative=True,
+        )
+
+    def _project_lazy_model_shape(self, mediator: Mediator, shape: InputShape, model: type) -> InputShape:
+        slot_names = set(copyreg._slotnames(model))  # type: ignore[attr-defined]
+        lazy_model = mediator.cached_call(
+            make_lazy_model_class,
+            model,
+            frozenset(
+                field.id for field in shape.fields
+                if field.id in slot_names or (
+                    field.id not in self._only
+                    and not isinstance(field.default, (DefaultValue, DefaultFactory))
+                )
+            ),
+            tuple(field.id for field in shape.fields),
+        )
+        return replace(
+            shape,
+            fields=tuple(
+                field if field.id in self._only else replace(field, is_required=False)
+                for field in shape.fields
+            ),
+            params=tuple(
+                Param(field_id=field.id, name=field.id, kind=ParamKind.KW_ONLY)
+                for field in shape.fields
+            ),
+            kwargs=None,
+            constructor=_make_projection_constructor(
+                lazy_model,
+                [field for field in shape.fields if field.id not in self._only],
+            ),
+        )
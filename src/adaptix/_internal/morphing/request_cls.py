@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from ..common import Dumper, Loader
 from ..definitions import DebugTrail
@@ -21,3 +22,7 @@ class StrictCoercionRequest(LocatedRequest[bool]):
 
 class DebugTrailRequest(LocatedRequest[DebugTrail]):
     pass
+
+
+class MaxErrorsRequest(LocatedRequest[Optional[int]]):
+    pass
@@ -0,0 +1,194 @@
+import json
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, dataclass
+from itertools import islice
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from ..common import Dumper, Loader
+from ..provider.essential import Mediator
+from ..provider.loc_stack_filtering import LocStack
+from ..provider.loc_stack_tools import format_type
+from ..provider.located_request import LocatedRequestMethodsProvider
+from ..provider.location import FieldLoc, GenericParamLoc, InputFieldLoc
+from ..provider.methods_provider import method_handler
+from ..retort.build_profiler import render_text_table
+from ..special_cases_optimization import as_is_stub, copy_converter_metadata
+from .request_cls import DumperRequest, LoaderRequest
+
+
+@dataclass(frozen=True)
+class ConverterStats:
+    """Runtime statistics of a loader or dumper at a specific location.
+
+    :param kind: ``"loader"`` or ``"dumper"``
+    :param path: Path from the root type to the location, like ``Library.books[0].title``
+    :param type: Type at the location
+    :param calls: How many times the converter was called
+    :param errors: How many of these calls raised an exception
+    :param total_time: Cumulative time of calls including time of nested converters
+    :param absent: For optional input fields, how many times the owner model loader was called
+        without calling the field loader, that is, the field was absent
+        or loading stopped before reaching it. ``None`` for other locations.
+    """
+    kind: str
+    path: str
+    type: str
+    calls: int
+    errors: int
+    total_time: float
+    absent: Optional[int] = None
+
+
+class _ConverterCounter:
+    __slots__ = ("calls", "errors", "total_time")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+
+
+def _format_path(loc_stack: LocStack) -> str:
+    parts = [format_type(loc_stack[0].type)]
+    for loc in islice(loc_stack, 1, None):
+        if loc.is_castable(FieldLoc):
+            parts.append(f".{loc.field_id}")
+        elif loc.is_castable(GenericParamLoc):
+            parts.append(f"[{loc.generic_pos}]")
+    return "".join(parts)
+
+
+_CounterKey = tuple[str, str, str]
+
+
+def _make_key(kind: str, loc_stack: LocStack) -> _CounterKey:
+    return kind, _format_path(loc_stack), format_type(loc_stack.last.type)
+
+
+class RuntimeProfiler:
+    """Collects statistics of produced loaders and dumpers at runtime.
+
+    Pass the instance to the retort via ``runtime_profiler`` parameter.
+    The retort wraps the loader and dumper of each location (models, their fields, collection elements and so on)
+    with counters and timers, so time spent inside generated code is attributed to specific fields.
+    Wrapping adds overhead to each call, so it is intended for profiling sessions, not for regular usage.
+    Wrappers keep the optimization metadata of converters, so the outer converter may do the work of the inner one
+    (skip as-is converters, check exact types or inline the code) without calling it,
+    then the time is attributed to the outer converter.
+    Counters are not synchronized, values may be inaccurate if converters are called from several threads.
+    """
+
+    def __init__(self) -> None:
+        self._counters: dict[_CounterKey, _ConverterCounter] = {}
+        self._optional_field_owners: dict[_CounterKey, _CounterKey] = {}
+
+    def _get_counter(self, key: _CounterKey) -> _ConverterCounter:
+        try:
+            return self._counters[key]
+        except KeyError:
+            counter = self._counters[key] = _ConverterCounter()
+            return counter
+
+    def _wrap(self, kind: str, loc_stack: LocStack, converter: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        if converter is as_is_stub:
+            return converter
+
+        key = _make_key(kind, loc_stack)
+        counter = self._get_counter(key)
+        if (
+            len(loc_stack) > 1
+            and loc_stack.last.is_castable(InputFieldLoc)
+            and not loc_stack.last.is_required
+        ):
+            self._optional_field_owners[key] = _make_key(kind, loc_stack.reversed_slice(1))
+
+        def profiling_converter(data):
+            start = perf_counter()
+            try:
+                return converter(data)
+            except Exception:
+                counter.errors += 1
+                raise
+            finally:
+                counter.calls += 1
+                counter.total_time += perf_counter() - start
+
+        return copy_converter_metadata(converter, profiling_converter)
+
+    def wrap_loader(self, loc_stack: LocStack, loader: Loader) -> Loader:
+        return self._wrap("loader", loc_stack, loader)
+
+    def wrap_dumper(self, loc_stack: LocStack, dumper: Dumper) -> Dumper:
+        return self._wrap("dumper", loc_stack, dumper)
+
+    def reset(self) -> None:
+        for counter in self._counters.values():
+            counter.reset()
+
+    def _get_absent(self, key: _CounterKey) -> Optional[int]:
+        owner_key = self._optional_field_owners.get(key)
+        if owner_key is None or owner_key not in self._counters:
+            return None
+        return max(self._counters[owner_key].calls - self._counters[key].calls, 0)
+
+    def get_stats(self) -> Sequence[ConverterStats]:
+        """Returns statistics of called converters sorted by total time descending"""
+        result = [
+            ConverterStats(
+                kind=key[0],
+                path=key[1],
+                type=key[2],
+                calls=counter.calls,
+                errors=counter.errors,
+                total_time=counter.total_time,
+                absent=self._get_absent(key),
+            )
+            for key, counter in list(self._counters.items())
+            if counter.calls
+        ]
+        result.sort(key=lambda stats: stats.total_time, reverse=True)
+        return result
+
+    def to_dict(self) -> Mapping[str, Any]:
+        """Returns the report as JSON-compatible data"""
+        return {"converters": [asdict(stats) for stats in self.get_stats()]}
+
+    def to_json(self, **kwargs: Any) -> str:
+        """Returns the report as JSON string, keyword arguments are passed to :func:`json.dumps`"""
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def render_table(self) -> str:
+        """Returns the report as plain text table"""
+        return render_text_table(
+            ["kind", "path", "type", "calls", "errors", "absent", "total, ms"],
+            [
+                [
+                    stats.kind,
+                    stats.path,
+                    stats.type,
+                    str(stats.calls),
+                    str(stats.errors),
+                    "" if stats.absent is None else str(stats.absent),
+                    f"{stats.total_time * 1000:.3f}",
+                ]
+                for stats in self.get_stats()
+            ],
+            text_columns=3,
+        )
+
+
+class RuntimeProfilingProvider(LocatedRequestMethodsProvider):
+    def __init__(self, runtime_profiler: RuntimeProfiler):
+        self._runtime_profiler = runtime_profiler
+
+    @method_handler
+    def provide_loader(self, mediator: Mediator[Loader], request: LoaderRequest) -> Loader:
+        return self._runtime_profiler.wrap_loader(request.loc_stack, mediator.provide_from_next())
+
+    @method_handler
+    def provide_dumper(self, mediator: Mediator[Dumper], request: DumperRequest) -> Dumper:
+        return self._runtime_profiler.wrap_dumper(request.loc_stack, mediator.provide_from_next())
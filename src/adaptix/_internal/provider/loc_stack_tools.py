@@ -6,7 +6,7 @@ from .loc_stack_filtering import LocStack
 from .location import AnyLoc, FieldLoc, InputFuncFieldLoc, TypeHintLoc
 
 
-def _format_type(tp: TypeHint) -> str:
+def format_type(tp: TypeHint) -> str:
     if isinstance(tp, type) and not is_parametrized(tp):
         return tp.__qualname__
     str_tp = str(tp)
@@ -16,7 +16,7 @@ def _format_type(tp: TypeHint) -> str:
 
 
 def format_loc_stack(loc_stack: LocStack[AnyLoc]) -> str:
-    fmt_tp = _format_type(loc_stack.last.type)
+    fmt_tp = format_type(loc_stack.last.type)
 
     try:
         field_loc = loc_stack.last.cast(FieldLoc)
@@ -31,7 +31,7 @@ def format_loc_stack(loc_stack: LocStack[AnyLoc]) -> str:
         return f"{func_name}({fmt_field})"
 
     if len(loc_stack) >= 2:  # noqa: PLR2004
-        src_owner = _format_type(loc_stack[-2].type)
+        src_owner = format_type(loc_stack[-2].type)
         return f"{src_owner}.{fmt_field}"
     return fmt_tp
 
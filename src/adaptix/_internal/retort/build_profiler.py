@@ -0,0 +1,213 @@
+import json
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, dataclass
+from threading import Lock, local
+from time import perf_counter
+from typing import Any, Callable
+
+from ..provider.essential import CannotProvide, Mediator, Provider, Request, RequestHandler
+
+
+@dataclass(frozen=True)
+class HandlerStats:
+    """Statistics of a request handler of a provider.
+
+    :param request_cls: Name of the request class
+    :param provider: Name of the provider class with its position inside the full recipe
+    :param calls: How many times the handler was called
+    :param cannot_provide: How many of these calls raised :class:`.CannotProvide`
+        and the search moved to the next provider
+    :param total_time: Cumulative time of calls including time of nested requests
+    :param own_time: Cumulative time of calls excluding time of nested requests handled by profiled providers
+    """
+    request_cls: str
+    provider: str
+    calls: int
+    cannot_provide: int
+    total_time: float
+    own_time: float
+
+
+@dataclass(frozen=True)
+class CachedCallStats:
+    """Statistics of ``Mediator.cached_call()`` by called function.
+
+    :param func: Qualified name of the function
+    :param hits: How many calls were served from the cache
+    :param misses: How many calls evaluated the function
+    """
+    func: str
+    hits: int
+    misses: int
+
+
+class _HandlerCounter:
+    __slots__ = ("calls", "cannot_provide", "total_time", "own_time")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.cannot_provide = 0
+        self.total_time = 0.0
+        self.own_time = 0.0
+
+
+def _get_func_name(func: Callable) -> str:
+    name = getattr(func, "__qualname__", None)
+    if name is None:
+        return repr(func)
+    module = getattr(func, "__module__", None)
+    return name if module is None else f"{module}.{name}"
+
+
+class BuildProfiler:
+    """Collects statistics of providers work while retort creates loaders, dumpers and other objects.
+
+    Pass the instance to the retort via ``build_profiler`` parameter,
+    then call ``get_loader()``, ``get_dumper()`` and other methods and inspect the report.
+    One profiler can be shared between several retorts.
+    Profiling slows down the creation of objects, but does not affect produced loaders and dumpers.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._local = local()
+        self._handler_counters: dict[tuple[type[Request], str], _HandlerCounter] = {}
+        self._cached_call_counters: dict[str, list[int]] = {}
+
+    def wrap_handler(
+        self,
+        request_cls: type[Request],
+        provider: Provider,
+        recipe_position: int,
+        handler: RequestHandler,
+    ) -> RequestHandler:
+        provider_desc = f"{type(provider).__qualname__} #{recipe_position}"
+        with self._lock:
+            counter = self._handler_counters.setdefault((request_cls, provider_desc), _HandlerCounter())
+
+        thread_local = self._local
+        lock = self._lock
+
+        def profiling_handler(mediator: Mediator, request: Request) -> Any:
+            try:
+                nested_times = thread_local.nested_times
+            except AttributeError:
+                nested_times = thread_local.nested_times = []
+
+            is_cannot_provide = False
+            nested_times.append(0.0)
+            start = perf_counter()
+            try:
+                return handler(mediator, request)
+            except CannotProvide:
+                is_cannot_provide = True
+                raise
+            finally:
+                elapsed = perf_counter() - start
+                nested_time = nested_times.pop()
+                if nested_times:
+                    nested_times[-1] += elapsed
+                with lock:
+                    counter.calls += 1
+                    counter.cannot_provide += is_cannot_provide
+                    counter.total_time += elapsed
+                    counter.own_time += elapsed - nested_time
+
+        return profiling_handler
+
+    def record_cached_call(self, func: Callable, *, hit: bool) -> None:
+        name = _get_func_name(func)
+        with self._lock:
+            counter = self._cached_call_counters.setdefault(name, [0, 0])
+            counter[0 if hit else 1] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            for counter in self._handler_counters.values():
+                counter.reset()
+            self._cached_call_counters.clear()
+
+    def get_handler_stats(self) -> Sequence[HandlerStats]:
+        """Returns statistics of called handlers sorted by own time descending"""
+        with self._lock:
+            result = [
+                HandlerStats(
+                    request_cls=request_cls.__qualname__,
+                    provider=provider_desc,
+                    calls=counter.calls,
+                    cannot_provide=counter.cannot_provide,
+                    total_time=counter.total_time,
+                    own_time=counter.own_time,
+                )
+                for (request_cls, provider_desc), counter in self._handler_counters.items()
+                if counter.calls
+            ]
+        result.sort(key=lambda stats: stats.own_time, reverse=True)
+        return result
+
+    def get_cached_call_stats(self) -> Sequence[CachedCallStats]:
+        """Returns statistics of cached calls sorted by total call count descending"""
+        with self._lock:
+            result = [
+                CachedCallStats(func=func, hits=hits, misses=misses)
+                for func, (hits, misses) in self._cached_call_counters.items()
+            ]
+        result.sort(key=lambda stats: stats.hits + stats.misses, reverse=True)
+        return result
+
+    def to_dict(self) -> Mapping[str, Any]:
+        """Returns the report as JSON-compatible data"""
+        return {
+            "handlers": [asdict(stats) for stats in self.get_handler_stats()],
+            "cached_calls": [asdict(stats) for stats in self.get_cached_call_stats()],
+        }
+
+    def to_json(self, **kwargs: Any) -> str:
+        """Returns the report as JSON string, keyword arguments are passed to :func:`json.dumps`"""
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def render_table(self) -> str:
+        """Returns the report as plain text tables"""
+        handler_table = render_text_table(
+            ["request", "provider", "calls", "cannot provide", "total, ms", "own, ms"],
+            [
+                [
+                    stats.request_cls,
+                    stats.provider,
+                    str(stats.calls),
+                    str(stats.cannot_provide),
+                    f"{stats.total_time * 1000:.3f}",
+                    f"{stats.own_time * 1000:.3f}",
+                ]
+                for stats in self.get_handler_stats()
+            ],
+            text_columns=2,
+        )
+        cached_call_table = render_text_table(
+            ["cached function", "hits", "misses"],
+            [
+                [stats.func, str(stats.hits), str(stats.misses)]
+                for stats in self.get_cached_call_stats()
+            ],
+            text_columns=1,
+        )
+        return f"{handler_table}\n\n{cached_call_table}"
+
+
+def render_text_table(header: Sequence[str], rows: Sequence[Sequence[str]], text_columns: int) -> str:
+    widths = [
+        max(len(row[i]) for row in [header, *rows])
+        for i in range(len(header))
+    ]
+    lines = [
+        "  ".join(
+            cell.ljust(width) if i < text_columns else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        )
+        for row in [header, *rows]
+    ]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(line.rstrip() for line in lines)
@@ -2,7 +2,9 @@ from abc import ABC, abstractmethod
 from collections.abc import Mapping
 from typing import Any, Callable, Generic, TypeVar
 
+from ..datastructures import SingleFlightDict
 from ..provider.essential import CannotProvide, Mediator, Request
+from .build_profiler import BuildProfiler
 
 T = TypeVar("T")
 
@@ -30,7 +32,7 @@ class BuiltinMediator(Mediator[ResponseT], Generic[ResponseT]):
         request: Request,
         search_offset: int,
         no_request_bus_error_maker: Callable[[Request], CannotProvide],
-        call_cache: dict[Any, Any],
+        call_cache: SingleFlightDict[Any, Any],
     ):
         self._request_buses = request_buses
         self._request = request
@@ -53,8 +55,29 @@ class BuiltinMediator(Mediator[ResponseT], Generic[ResponseT]):
 
     def cached_call(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:  # type: ignore[override]
         key = (func, *args, *kwargs.items())
-        if key in self._call_cache:
+        try:
             return self._call_cache[key]
-        result = func(*args, **kwargs)
-        self._call_cache[key] = result
-        return result
+        except KeyError:
+            pass
+        return self._call_cache.get_or_compute(key, func, *args, **kwargs)
+
+
+class ProfilingMediator(BuiltinMediator[ResponseT], Generic[ResponseT]):
+    __slots__ = ("_build_profiler", )
+
+    def __init__(
+        self,
+        request_buses: Mapping[type[Request], RequestBus],
+        request: Request,
+        search_offset: int,
+        no_request_bus_error_maker: Callable[[Request], CannotProvide],
+        call_cache: SingleFlightDict[Any, Any],
+        build_profiler: BuildProfiler,
+    ):
+        super().__init__(request_buses, request, search_offset, no_request_bus_error_maker, call_cache)
+        self._build_profiler = build_profiler
+
+    def cached_call(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:  # type: ignore[override]
+        key = (func, *args, *kwargs.items())
+        self._build_profiler.record_cached_call(func, hit=key in self._call_cache)
+        return super().cached_call(func, *args, **kwargs)
@@ -1,11 +1,30 @@
-from collections.abc import Sequence
+import operator
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from functools import reduce
 from itertools import islice
-from typing import Optional, TypeVar, Union
+from typing import Any, Callable, NamedTuple, Optional, TypeVar, Union
 
 from ..common import TypeHint
 from ..provider.essential import DirectMediator, Request, RequestChecker, RequestHandler
-from ..provider.loc_stack_filtering import ExactOriginLSC
+from ..provider.loc_stack_filtering import (
+    AndLocStackChecker,
+    AnyLocStackChecker,
+    BinOperatorLSC,
+    ExactFieldNameLSC,
+    ExactOriginLSC,
+    ExactTypeLSC,
+    GenericParamLSC,
+    InvertLSC,
+    LocStackChecker,
+    LocStackEndChecker,
+    OrLocStackChecker,
+    ReFieldNameLSC,
+    XorLocStackChecker,
+)
 from ..provider.located_request import LocatedRequest, LocatedRequestChecker
+from ..provider.location import AnyLoc, FieldLoc, GenericParamLoc
 from ..type_tools import normalize_type
 from .request_bus import RequestRouter
 
@@ -41,11 +60,178 @@ OriginToHandler = dict[TypeHint, RequestHandler]
 LRRoutingItem = Union[CheckerAndHandler, OriginToHandler]
 
 
+class LastLocSignature(NamedTuple):
+    """Properties of the last location that are enough to evaluate the most of the builtin checkers"""
+    origin: Any
+    field_id: Optional[str]
+    generic_pos: Optional[int]
+
+
+SignatureFilter = Callable[[LastLocSignature], bool]
+
+# a unique object used as the origin of types that can not be normalized,
+# no checker matches such origin like they do not match types raising ValueError
+_NOT_NORMALIZABLE = object()
+
+
+@dataclass(frozen=True)
+class _DerivedFilter:
+    func: SignatureFilter
+    is_exact: bool  # the filter gives the same result as the checker, so the checker may be skipped
+
+
+def _derive_bin_operator_filter(lsc: BinOperatorLSC) -> Optional[_DerivedFilter]:
+    sub_filters = [_derive_filter(sub_lsc) for sub_lsc in lsc._loc_stack_checkers]
+    if type(lsc) is AndLocStackChecker:
+        known_sub_filters = [sub_filter for sub_filter in sub_filters if sub_filter is not None]
+        if not known_sub_filters:
+            return None
+        funcs = [sub_filter.func for sub_filter in known_sub_filters]
+        return _DerivedFilter(
+            lambda sig: all(func(sig) for func in funcs),
+            is_exact=len(known_sub_filters) == len(sub_filters) and all(f.is_exact for f in known_sub_filters),
+        )
+
+    exact_funcs = [sub_filter.func for sub_filter in sub_filters if sub_filter is not None and sub_filter.is_exact]
+    if len(exact_funcs) != len(sub_filters):
+        return None
+    if type(lsc) is OrLocStackChecker:
+        return _DerivedFilter(lambda sig: any(func(sig) for func in exact_funcs), is_exact=True)
+    return _DerivedFilter(lambda sig: reduce(operator.xor, (func(sig) for func in exact_funcs)), is_exact=True)
+
+
+def _derive_exact_field_name_filter(lsc: ExactFieldNameLSC) -> Optional[_DerivedFilter]:
+    field_id = lsc.field_id
+    return _DerivedFilter(lambda sig: sig.field_id == field_id, is_exact=True)
+
+
+def _derive_re_field_name_filter(lsc: ReFieldNameLSC) -> Optional[_DerivedFilter]:
+    pattern = lsc.pattern
+    return _DerivedFilter(
+        lambda sig: sig.field_id is not None and pattern.fullmatch(sig.field_id) is not None,
+        is_exact=True,
+    )
+
+
+def _derive_exact_origin_filter(lsc: ExactOriginLSC) -> Optional[_DerivedFilter]:
+    origin = lsc.origin
+    return _DerivedFilter(lambda sig: sig.origin == origin, is_exact=True)
+
+
+def _derive_exact_type_filter(lsc: ExactTypeLSC) -> Optional[_DerivedFilter]:
+    origin = lsc.norm.origin
+    return _DerivedFilter(lambda sig: sig.origin == origin, is_exact=False)
+
+
+def _derive_generic_param_filter(lsc: GenericParamLSC) -> Optional[_DerivedFilter]:
+    pos = lsc.pos
+    return _DerivedFilter(lambda sig: sig.generic_pos == pos, is_exact=True)
+
+
+def _derive_any_filter(lsc: AnyLocStackChecker) -> Optional[_DerivedFilter]:
+    return _DerivedFilter(lambda sig: True, is_exact=True)
+
+
+def _derive_loc_stack_end_filter(lsc: LocStackEndChecker) -> Optional[_DerivedFilter]:
+    checkers = lsc.loc_stack_checkers
+    if not checkers:
+        return None
+    last_filter = _derive_filter(checkers[-1])
+    if last_filter is None:
+        return None
+    return _DerivedFilter(last_filter.func, is_exact=last_filter.is_exact and len(checkers) == 1)
+
+
+def _derive_invert_filter(lsc: InvertLSC) -> Optional[_DerivedFilter]:
+    sub_filter = _derive_filter(lsc._lsc)
+    if sub_filter is None or not sub_filter.is_exact:
+        return None
+    func = sub_filter.func
+    return _DerivedFilter(lambda sig: not func(sig), is_exact=True)
+
+
+# OriginSubclassLSC has no filter, because the result of a subclass check can change after ABC.register()
+# and candidates are cached per signature
+_FILTER_DERIVERS: Mapping[type, Callable[[Any], Optional[_DerivedFilter]]] = {
+    ExactFieldNameLSC: _derive_exact_field_name_filter,
+    ReFieldNameLSC: _derive_re_field_name_filter,
+    ExactOriginLSC: _derive_exact_origin_filter,
+    ExactTypeLSC: _derive_exact_type_filter,
+    GenericParamLSC: _derive_generic_param_filter,
+    AnyLocStackChecker: _derive_any_filter,
+    LocStackEndChecker: _derive_loc_stack_end_filter,
+    InvertLSC: _derive_invert_filter,
+    AndLocStackChecker: _derive_bin_operator_filter,
+    OrLocStackChecker: _derive_bin_operator_filter,
+    XorLocStackChecker: _derive_bin_operator_filter,
+}
+
+
+def _derive_filter(lsc: LocStackChecker) -> Optional[_DerivedFilter]:
+    """Derive a necessary condition of loc stack checker that depends only on the signature of the last location.
+    Only the exact builtin classes are processed, because children can override any behavior
+    """
+    try:
+        deriver = _FILTER_DERIVERS[type(lsc)]
+    except KeyError:
+        return None
+    return deriver(lsc)
+
+
+def _derive_item_filter(item: LRRoutingItem) -> Optional[_DerivedFilter]:
+    if type(item) is not tuple:
+        return _DerivedFilter(lambda sig: sig.origin in item, is_exact=True)
+    checker = item[0]
+    if type(checker) is LocatedRequestChecker:
+        return _derive_filter(checker.loc_stack_checker)
+    return None
+
+
+# (offset, routing item, the routing item requires full check)
+RoutingCandidate = tuple[int, LRRoutingItem, bool]
+
+
 class LocatedRequestRouter(RequestRouter[LocatedRequest]):
-    __slots__ = ("_items", )
+    """Router that selects candidates for the signature of the last location once
+    and then checks only them. Offsets of candidates are preserved, so the first match wins like at linear search.
+    """
+    __slots__ = ("_items", "_filters", "_signature_to_candidates")
 
     def __init__(self, items: Sequence[Union[CheckerAndHandler, OriginToHandler]]):
         self._items = items
+        self._filters = [_derive_item_filter(item) for item in items]
+        self._signature_to_candidates: dict[LastLocSignature, tuple[Sequence[int], Sequence[RoutingCandidate]]] = {}
+
+    def _get_signature(self, loc: AnyLoc) -> LastLocSignature:
+        try:
+            origin = normalize_type(loc.type).origin
+        except ValueError:
+            origin = _NOT_NORMALIZABLE
+
+        return LastLocSignature(
+            origin=origin,
+            field_id=loc.field_id if loc.is_castable(FieldLoc) else None,  # type: ignore[union-attr]
+            generic_pos=loc.generic_pos if loc.is_castable(GenericParamLoc) else None,  # type: ignore[union-attr]
+        )
+
+    def _select_candidates(self, signature: LastLocSignature) -> tuple[Sequence[int], Sequence[RoutingCandidate]]:
+        candidates = [
+            (i, item, item_filter is None or not item_filter.is_exact)
+            for i, (item, item_filter) in enumerate(zip(self._items, self._filters))
+            if item_filter is None or item_filter.func(signature)
+        ]
+        return [candidate[0] for candidate in candidates], candidates
+
+    def _get_candidates(self, signature: LastLocSignature) -> tuple[Sequence[int], Sequence[RoutingCandidate]]:
+        try:
+            return self._signature_to_candidates[signature]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable origin
+            return self._select_candidates(signature)
+        result = self._select_candidates(signature)
+        self._signature_to_candidates[signature] = result
+        return result
 
     def route_handler(
         self,
@@ -53,22 +239,15 @@ class LocatedRequestRouter(RequestRouter[LocatedRequest]):
         request: LocatedRequest,
         search_offset: int,
     ) -> tuple[RequestHandler, int]:
-        try:
-            origin = normalize_type(request.last_loc.type).origin
-        except ValueError:
-            origin = object()
+        signature = self._get_signature(request.last_loc)
+        offsets, candidates = self._get_candidates(signature)
 
-        for i, routing_item in enumerate(
-            islice(self._items, search_offset, None),
-            start=search_offset,
-        ):
-            if type(routing_item) is tuple:
-                if routing_item[0].check_request(mediator, request):
+        for i, routing_item, requires_check in islice(candidates, bisect_left(offsets, search_offset), None):
+            if isinstance(routing_item, tuple):
+                if not requires_check or routing_item[0].check_request(mediator, request):
                     return routing_item[1], i + 1
             else:
-                handler = routing_item.get(origin)  # type: ignore[union-attr]
-                if handler is not None:
-                    return handler, i + 1
+                return routing_item[signature.origin], i + 1
         raise StopIteration
 
     def get_max_offset(self) -> int:
@@ -87,7 +266,7 @@ class ExactOriginCombiner:
                 result.append((LocatedRequestChecker(ExactOriginLSC(origin)), handler))
             else:
                 result.append(self._combo)
-                self._combo = {}
+            self._combo = {}
 
         if checker_and_handler is not None:
             result.append(checker_and_handler)
@@ -4,6 +4,7 @@ from collections.abc import Iterable, Mapping, Sequence
 from typing import Any, Callable, Optional, TypeVar
 
 from ..compat import CompatBaseExceptionGroup
+from ..datastructures import SingleFlightDict
 from ..provider.essential import (
     AggregateCannotProvide,
     CannotProvide,
@@ -14,9 +15,11 @@ from ..provider.essential import (
     RequestHandler,
 )
 from ..provider.request_checkers import AlwaysTrueRequestChecker
+from ..type_tools.normalize_type import NormalizationCache, using_normalization_cache
 from ..utils import add_note, copy_exception_dunders, with_module
 from .base_retort import BaseRetort
-from .builtin_mediator import BuiltinMediator, RequestBus
+from .build_profiler import BuildProfiler
+from .builtin_mediator import BuiltinMediator, ProfilingMediator, RequestBus
 from .request_bus import BasicRequestBus, ErrorRepresentor, RecursionResolver, RecursiveRequestBus, RequestRouter
 from .routers import CheckerAndHandler
 
@@ -37,12 +40,24 @@ RequestT = TypeVar("RequestT", bound=Request)
 class SearchingRetort(BaseRetort, Provider, ABC):
     """A retort that can operate as Retort but have no predefined providers and no high-level user interface"""
 
-    def __init__(self, *, recipe: Iterable[Provider] = (), hide_traceback: bool = True):
+    def __init__(
+        self,
+        *,
+        recipe: Iterable[Provider] = (),
+        hide_traceback: bool = True,
+        normalization_cache: Optional[NormalizationCache] = None,
+        build_profiler: Optional[BuildProfiler] = None,
+    ):
         self._hide_traceback = hide_traceback
+        self._normalization_cache = normalization_cache
+        self._build_profiler = build_profiler
         super().__init__(recipe=recipe)
 
     def _provide_from_recipe(self, request: Request[T]) -> T:
-        return self._create_mediator(request).provide(request)
+        if self._normalization_cache is None:
+            return self._create_mediator(request).provide(request)
+        with using_normalization_cache(self._normalization_cache):
+            return self._create_mediator(request).provide(request)
 
     def get_request_handlers(self) -> Sequence[tuple[type[Request], RequestChecker, RequestHandler]]:
         def retort_request_handler(mediator, request):
@@ -109,12 +124,14 @@ class SearchingRetort(BaseRetort, Provider, ABC):
             request_cls: self._create_error_representor(request_cls)
             for request_cls in self._request_cls_to_router
         }
-        self._call_cache: dict[Any, Any] = {}
+        self._call_cache: SingleFlightDict[Any, Any] = SingleFlightDict()
 
     def _create_request_cls_to_router(self, full_recipe: Sequence[Provider]) -> Mapping[type[Request], RequestRouter]:
         request_cls_to_checkers_and_handlers: defaultdict[type[Request], list[CheckerAndHandler]] = defaultdict(list)
-        for provider in full_recipe:
+        for i, provider in enumerate(full_recipe):
             for request_cls, checker, handler in provider.get_request_handlers():
+                if self._build_profiler is not None:
+                    handler = self._build_profiler.wrap_handler(request_cls, provider, i, handler)  # noqa: PLW2901
                 request_cls_to_checkers_and_handlers[request_cls].append((checker, handler))
 
         return {
@@ -169,8 +186,18 @@ class SearchingRetort(BaseRetort, Provider, ABC):
         request_buses: Mapping[type[Request], RequestBus]
         no_request_bus_error_maker = self._create_no_request_bus_error_maker()
         call_cache = self._call_cache
+        build_profiler = self._build_profiler
 
         def mediator_factory(request, search_offset):
+            if build_profiler is not None:
+                return ProfilingMediator(
+                    request_buses=request_buses,
+                    request=request,
+                    search_offset=search_offset,
+                    no_request_bus_error_maker=no_request_bus_error_maker,
+                    call_cache=call_cache,
+                    build_profiler=build_profiler,
+                )
             return BuiltinMediator(
                 request_buses=request_buses,
                 request=request,
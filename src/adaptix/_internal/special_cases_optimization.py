@@ -1,5 +1,9 @@
-from typing import Optional, TypeVar, Union
+from collections.abc import Iterable, Set
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar, Union
 
+from .code_tools.inliner import InlinableCode
+from .common import Dumper, Loader, TypeHint
 from .model_tools.definitions import DefaultFactory, DefaultFactoryWithSelf, DefaultValue
 from .morphing.model.crown_definitions import Sieve
 
@@ -7,6 +11,9 @@ as_is_stub = lambda x: x  # noqa: E731
 as_is_stub_with_ctx = lambda x, ctx: x  # noqa: E731
 
 S = TypeVar("S", bound=Sieve)
+L = TypeVar("L", bound=Loader)
+D = TypeVar("D", bound=Dumper)
+C = TypeVar("C", bound=Callable)
 
 
 _DEFAULT_CLAUSE_ATTR_NAME = "_adaptix_default_clause"
@@ -19,3 +26,188 @@ def with_default_clause(default: Union[DefaultValue, DefaultFactory, DefaultFact
 
 def get_default_clause(sieve: Sieve) -> Optional[Union[DefaultValue, DefaultFactory, DefaultFactoryWithSelf]]:
     return getattr(sieve, _DEFAULT_CLAUSE_ATTR_NAME, None)
+
+
+@dataclass(frozen=True)
+class InputTypeFilter:
+    """Describes exact types of input data that loader surely rejects raising LoadError.
+
+    :param accepted: If it is set, data of any other type is rejected
+    :param rejected: Types that are rejected
+    """
+    accepted: Optional[frozenset[type]] = None
+    rejected: frozenset[type] = frozenset()
+
+    def may_accept(self, tp: type) -> bool:
+        if self.accepted is not None and tp not in self.accepted:
+            return False
+        return tp not in self.rejected
+
+
+_INPUT_TYPE_FILTER_ATTR_NAME = "_adaptix_input_type_filter"
+
+
+def with_input_type_filter(input_type_filter: InputTypeFilter, loader: L) -> L:
+    setattr(loader, _INPUT_TYPE_FILTER_ATTR_NAME, input_type_filter)
+    return loader
+
+
+def get_input_type_filter(loader: Loader) -> Optional[InputTypeFilter]:
+    return getattr(loader, _INPUT_TYPE_FILTER_ATTR_NAME, None)
+
+
+_REQUIRED_KEYS_ATTR_NAME = "_adaptix_required_keys"
+
+
+def with_required_keys(required_keys: Set[str], loader: L) -> L:
+    """Marks that loader raises LoadError for any mapping that does not contain all required keys"""
+    setattr(loader, _REQUIRED_KEYS_ATTR_NAME, required_keys)
+    return loader
+
+
+def get_required_keys(loader: Loader) -> Optional[Set[str]]:
+    return getattr(loader, _REQUIRED_KEYS_ATTR_NAME, None)
+
+
+_INLINABLE_CODE_ATTR_NAME = "_adaptix_inlinable_code"
+
+
+def with_inlinable_code(code: InlinableCode, converter: C) -> C:
+    """Marks that converter is a compiled version of the code, so it can be inlined into other generated code"""
+    setattr(converter, _INLINABLE_CODE_ATTR_NAME, code)
+    return converter
+
+
+def get_inlinable_code(converter: Callable) -> Optional[InlinableCode]:
+    return getattr(converter, _INLINABLE_CODE_ATTR_NAME, None)
+
+
+@dataclass(frozen=True)
+class OptionalWrapping:
+    """Describes converter that returns None for None and passes any other data to the inner converter.
+
+    :param inner: Converter of not-None data
+    :param union_error_message: If it is set, LoadError raised by the inner converter is replaced
+        with UnionLoadError having this message and containing TypeLoadError for None and the original error
+    """
+    inner: Callable
+    union_error_message: Optional[str] = None
+
+
+_OPTIONAL_WRAPPING_ATTR_NAME = "_adaptix_optional_wrapping"
+
+
+def with_optional_wrapping(optional_wrapping: OptionalWrapping, converter: C) -> C:
+    setattr(converter, _OPTIONAL_WRAPPING_ATTR_NAME, optional_wrapping)
+    return converter
+
+
+def get_optional_wrapping(converter: Callable) -> Optional[OptionalWrapping]:
+    return getattr(converter, _OPTIONAL_WRAPPING_ATTR_NAME, None)
+
+
+@dataclass(frozen=True)
+class ExactTypeCheck:
+    """Describes loader that accepts only data of exact types and raises TypeLoadError for any other data.
+
+    :param types: Accepted types, data of the first type is returned as is,
+        data of other types is converted by calling the first type
+    :param expected_type: Expected type of raised TypeLoadError
+    """
+    types: tuple[type, ...]
+    expected_type: TypeHint
+
+
+_EXACT_TYPE_CHECK_ATTR_NAME = "_adaptix_exact_type_check"
+
+
+def with_exact_type_check(exact_type_check: ExactTypeCheck, loader: L) -> L:
+    setattr(loader, _EXACT_TYPE_CHECK_ATTR_NAME, exact_type_check)
+    return loader
+
+
+def get_exact_type_check(loader: Loader) -> Optional[ExactTypeCheck]:
+    return getattr(loader, _EXACT_TYPE_CHECK_ATTR_NAME, None)
+
+
+_JSON_CHUNKS_DUMPER_ATTR_NAME = "_adaptix_json_chunks_dumper"
+
+
+def with_json_chunks_dumper(json_chunks_dumper: Callable[[Any], Iterable[str]], dumper: D) -> D:
+    setattr(dumper, _JSON_CHUNKS_DUMPER_ATTR_NAME, json_chunks_dumper)
+    return dumper
+
+
+def get_json_chunks_dumper(dumper: Dumper) -> Optional[Callable[[Any], Iterable[str]]]:
+    return getattr(dumper, _JSON_CHUNKS_DUMPER_ATTR_NAME, None)
+
+
+_SEQUENCE_LOADER_ATTR_NAME = "_adaptix_sequence_loader"
+
+
+def with_sequence_loader(sequence_loader: Callable[[list[Any], list[Any]], None], loader: L) -> L:
+    """Attach function loading a whole list of elements at once and appending loaded values to the second argument.
+    If some element is invalid, it raises the exception of this element (like the loader does)
+    after all preceding values are appended, so loading can be resumed from the index equal to the result length.
+    """
+    setattr(loader, _SEQUENCE_LOADER_ATTR_NAME, sequence_loader)
+    return loader
+
+
+def get_sequence_loader(loader: Loader) -> Optional[Callable[[list[Any], list[Any]], None]]:
+    return getattr(loader, _SEQUENCE_LOADER_ATTR_NAME, None)
+
+
+_SEQUENCE_DUMPER_ATTR_NAME = "_adaptix_sequence_dumper"
+
+
+def with_sequence_dumper(sequence_dumper: Callable[[list[Any], list[Any]], None], dumper: D) -> D:
+    """Attach function dumping a whole list of elements at once and appending dumped values to the second argument.
+    It must be equivalent to calling the dumper for each element in order, so an error of some element is raised
+    after all preceding values are appended. Such dumpers are safe to be applied to sequences at C level.
+    """
+    setattr(dumper, _SEQUENCE_DUMPER_ATTR_NAME, sequence_dumper)
+    return dumper
+
+
+def get_sequence_dumper(dumper: Dumper) -> Optional[Callable[[list[Any], list[Any]], None]]:
+    return getattr(dumper, _SEQUENCE_DUMPER_ATTR_NAME, None)
+
+
+_MODEL_LOADER_ATTR_NAME = "_adaptix_model_loader"
+
+
+def mark_model_loader(loader: L) -> L:
+    """Marks that loader is generated from the shape of the model"""
+    setattr(loader, _MODEL_LOADER_ATTR_NAME, True)
+    return loader
+
+
+def is_model_loader(loader: Loader) -> bool:
+    return getattr(loader, _MODEL_LOADER_ATTR_NAME, False)
+
+
+_CONVERTER_METADATA_ATTR_NAMES = (
+    _INPUT_TYPE_FILTER_ATTR_NAME,
+    _REQUIRED_KEYS_ATTR_NAME,
+    _INLINABLE_CODE_ATTR_NAME,
+    _OPTIONAL_WRAPPING_ATTR_NAME,
+    _EXACT_TYPE_CHECK_ATTR_NAME,
+    _JSON_CHUNKS_DUMPER_ATTR_NAME,
+    _SEQUENCE_LOADER_ATTR_NAME,
+    _SEQUENCE_DUMPER_ATTR_NAME,
+    _MODEL_LOADER_ATTR_NAME,
+)
+
+
+def copy_converter_metadata(source: Callable, target: C) -> C:
+    """Copies metadata attached to the source converter,
+    so converters using the target take the same optimized paths as for the source
+    """
+    for attr_name in _CONVERTER_METADATA_ATTR_NAMES:
+        try:
+            value = getattr(source, attr_name)
+        except AttributeError:
+            continue
+        setattr(target, attr_name, value)
+    return target
@@ -36,18 +36,17 @@ Trail = Sequence[TrailElement]
 T = TypeVar("T")
 
 
+# Trail is stored as a linked list of ``(element, rest)`` pairs starting from the outermost element.
+# Adding an element allocates only one pair and the tail is never copied
+_TRAIL_ATTR_NAME = "_adaptix_struct_trail"
+
+
 def append_trail(obj: T, trail_element: TrailElement) -> T:
     """Append a trail element to object. Trail stores in special attribute,
     if an object does not allow adding 3rd-party attributes, do nothing.
     Element inserting to start of the path (it is built in reverse order)
     """
-    try:
-        # noinspection PyProtectedMember
-        trail = obj._adaptix_struct_trail  # type: ignore[attr-defined]
-    except AttributeError:
-        obj._adaptix_struct_trail = deque([trail_element])  # type: ignore[attr-defined]
-    else:
-        trail.appendleft(trail_element)
+    setattr(obj, _TRAIL_ATTR_NAME, (trail_element, getattr(obj, _TRAIL_ATTR_NAME, None)))
     return obj
 
 
@@ -56,23 +55,21 @@ def extend_trail(obj: T, sub_trail: Reversible[TrailElement]) -> T:
     if an object does not allow adding 3rd-party attributes, do nothing.
     Sub path inserting to start (it is built in reverse order)
     """
-    try:
-        # noinspection PyProtectedMember
-        trail = obj._adaptix_struct_trail  # type: ignore[attr-defined]
-    except AttributeError:
-        obj._adaptix_struct_trail = deque(sub_trail)  # type: ignore[attr-defined]
-    else:
-        trail.extendleft(reversed(sub_trail))
+    node = getattr(obj, _TRAIL_ATTR_NAME, None)
+    for trail_element in reversed(sub_trail):
+        node = (trail_element, node)
+    setattr(obj, _TRAIL_ATTR_NAME, node)
     return obj
 
 
 def get_trail(obj: object) -> Trail:
     """Retrieve trail from an object. Trail stores in special private attribute that never be accessed directly"""
-    try:
-        # noinspection PyProtectedMember
-        return obj._adaptix_struct_trail  # type: ignore[attr-defined]
-    except AttributeError:
-        return deque()
+    trail: deque[TrailElement] = deque()
+    node = getattr(obj, _TRAIL_ATTR_NAME, None)
+    while node is not None:
+        trail_element, node = node
+        trail.append(trail_element)
+    return trail
 
 
 BaseExcT = TypeVar("BaseExcT", bound=BaseException)
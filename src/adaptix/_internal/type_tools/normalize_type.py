@@ -5,7 +5,9 @@ import types
 import typing
 from abc import ABC, abstractmethod
 from collections import abc as c_abc, defaultdict
-from collections.abc import Hashable, Iterable, Sequence
+from collections.abc import Hashable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from copy import copy
 from dataclasses import InitVar, dataclass
 from enum import Enum, EnumMeta
@@ -18,6 +20,7 @@ from typing import (
     Final,
     ForwardRef,
     Literal,
+    NamedTuple,
     NewType,
     NoReturn,
     Optional,
@@ -854,13 +857,89 @@ class TypeNormalizer:
 
 
 _STD_NORMALIZER = TypeNormalizer(ImplicitParamsGetter())
-_cached_normalize = lru_cache(maxsize=128)(_STD_NORMALIZER.normalize)
 
 
-def normalize_type(tp: TypeHint) -> BaseNormType:
+class _InterningTypeNormalizer(TypeNormalizer):
+    def __init__(self, implicit_params_getter: ImplicitParamsGetter, cache: "NormalizationCache"):
+        super().__init__(implicit_params_getter)
+        self._cache = cache
+
+    @overload
+    def normalize(self, tp: TypeVar) -> NormTV:
+        ...
+
+    @overload
+    def normalize(self, tp: TypeHint) -> BaseNormType:
+        ...
+
+    def normalize(self, tp: TypeHint) -> BaseNormType:
+        # result of forward ref evaluation depends on namespace, so it can not be cached
+        if self._namespace is not None:
+            return super().normalize(tp)
+        return self._cache.normalize(tp)
+
+    def normalize_uncached(self, tp: TypeHint) -> BaseNormType:
+        return super().normalize(tp)
+
+
+class NormalizationCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class NormalizationCache:
+    """LRU cache of normalized types.
+
+    :param maxsize: Maximum number of stored types, ``None`` means unbounded cache
+    :param intern: Normalize type arguments through the cache too.
+        So, equal nested types are normalized only once and are shared between all types containing them
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128, *, intern: bool = False):
+        if intern:
+            normalizer = _InterningTypeNormalizer(ImplicitParamsGetter(), self)
+            self._normalize_uncached = normalizer.normalize_uncached
+        else:
+            self._normalize_uncached = _STD_NORMALIZER.normalize
+        self._normalize_cached = lru_cache(maxsize=maxsize)(self._normalize_uncached)
+
+    def normalize(self, tp: TypeHint) -> BaseNormType:
+        try:
+            hash(tp)
+        except TypeError:
+            return self._normalize_uncached(tp)
+
+        return self._normalize_cached(tp)
+
+    def cache_info(self) -> NormalizationCacheInfo:
+        return NormalizationCacheInfo(*self._normalize_cached.cache_info())
+
+    def cache_clear(self) -> None:
+        self._normalize_cached.cache_clear()
+
+
+_normalization_cache: ContextVar[NormalizationCache] = ContextVar(
+    "adaptix_normalization_cache",
+    default=NormalizationCache(),
+)
+
+
+@contextmanager
+def using_normalization_cache(cache: NormalizationCache) -> Iterator[None]:
+    """Use passed cache for all types normalized inside the context"""
+    token = _normalization_cache.set(cache)
     try:
-        hash(tp)
-    except TypeError:
-        return _STD_NORMALIZER.normalize(tp)
+        yield
+    finally:
+        _normalization_cache.reset(token)
 
-    return _cached_normalize(tp)
+
+def get_normalization_cache() -> NormalizationCache:
+    """Return the cache that is currently used to normalize types"""
+    return _normalization_cache.get()
+
+
+def normalize_type(tp: TypeHint) -> BaseNormType:
+    return _normalization_cache.get().normalize(tp)
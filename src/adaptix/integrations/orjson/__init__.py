@@ -0,0 +1,6 @@
+from adaptix._internal.integrations.orjson.native import OrjsonRetort, native_orjson
+
+__all__ = (
+    "OrjsonRetort",
+    "native_orjson",
+)
@@ -1,4 +1,6 @@
+from adaptix._internal.morphing.runtime_profiler import ConverterStats, RuntimeProfiler
 from adaptix._internal.retort.base_retort import BaseRetort
+from adaptix._internal.retort.build_profiler import BuildProfiler, CachedCallStats, HandlerStats
 from adaptix._internal.retort.operating_retort import OperatingRetort
 from adaptix._internal.retort.searching_retort import ProviderNotFoundError
 from adaptix._internal.utils import create_deprecated_alias_getter
@@ -7,6 +9,11 @@ __all__ = (
     "BaseRetort",
     "ProviderNotFoundError",
     "OperatingRetort",
+    "BuildProfiler",
+    "HandlerStats",
+    "CachedCallStats",
+    "RuntimeProfiler",
+    "ConverterStats",
 )
 
 __getattr__ = create_deprecated_alias_getter(
@@ -1,6 +1,14 @@
 from adaptix._internal.type_tools import exec_type_checking, make_fragments_collector
+from adaptix._internal.type_tools.normalize_type import (
+    NormalizationCache,
+    NormalizationCacheInfo,
+    get_normalization_cache,
+)
 
 __all__ = (
     "exec_type_checking",
     "make_fragments_collector",
+    "NormalizationCache",
+    "NormalizationCacheInfo",
+    "get_normalization_cache",
 )
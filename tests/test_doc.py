@@ -6,6 +6,7 @@ from typing import Optional
 import pytest
 
 from adaptix._internal.feature_requirement import (
+    HAS_ORJSON_PKG,
     HAS_PY_311,
     HAS_SUPPORTED_PYDANTIC_PKG,
     HAS_SUPPORTED_SQLALCHEMY_PKG,
@@ -43,6 +44,7 @@ def pytest_generate_tests(metafunc):
 GLOB_REQUIREMENTS = {
     "loading-and-dumping/tutorial/unexpected_error": HAS_PY_311,
     "reference/integrations/native_pydantic": HAS_SUPPORTED_PYDANTIC_PKG,
+    "reference/integrations/orjson_retort": HAS_ORJSON_PKG,
     "loading-and-dumping/extended_usage/private_fields_including_no_rename_pydantic": HAS_SUPPORTED_PYDANTIC_PKG,
     "loading-and-dumping/extended_usage/private_fields_including_pydantic": HAS_SUPPORTED_PYDANTIC_PKG,
     "loading-and-dumping/extended_usage/private_fields_skipping_pydantic": HAS_SUPPORTED_PYDANTIC_PKG,
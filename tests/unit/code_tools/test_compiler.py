@@ -0,0 +1,71 @@
+import inspect
+from dataclasses import dataclass
+from pathlib import Path
+
+from adaptix import Retort, compilation_cache
+from adaptix._internal.code_tools.code_builder import CodeBuilder
+from adaptix._internal.code_tools.compiler import DiskCachingClosureCompiler
+
+
+def _make_builder(value: int) -> CodeBuilder:
+    builder = CodeBuilder()
+    builder += f"""
+        def closure():
+            return {value}
+        return closure
+    """
+    return builder
+
+
+def test_disk_caching_compiler(tmp_path):
+    first = DiskCachingClosureCompiler(tmp_path).compile("test", lambda uid: f"<first {uid}>", _make_builder(1), {})
+    assert first() == 1
+    assert len(list(tmp_path.iterdir())) == 1
+
+    second = DiskCachingClosureCompiler(tmp_path).compile("test", lambda uid: f"<second {uid}>", _make_builder(1), {})
+    assert second() == 1
+    assert second.__code__.co_filename.startswith("<second")
+    assert inspect.getsource(second)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    third = DiskCachingClosureCompiler(tmp_path).compile("test", lambda uid: f"<third {uid}>", _make_builder(2), {})
+    assert third() == 2
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_corrupted_entry(tmp_path):
+    DiskCachingClosureCompiler(tmp_path).compile("test", lambda uid: f"<first {uid}>", _make_builder(1), {})
+    for path in tmp_path.iterdir():
+        path.write_bytes(b"corrupted")
+
+    closure = DiskCachingClosureCompiler(tmp_path).compile("test", lambda uid: f"<second {uid}>", _make_builder(1), {})
+    assert closure() == 1
+
+
+@dataclass
+class Book:
+    title: str
+    price: int
+
+
+def test_compilation_cache(tmp_path):
+    retort = Retort(recipe=[compilation_cache(directory=tmp_path)])
+    assert retort.load({"title": "abc", "price": 100}, Book) == Book(title="abc", price=100)
+    assert retort.dump(Book(title="abc", price=100)) == {"title": "abc", "price": 100}
+    entries = set(tmp_path.iterdir())
+    assert len(entries) == 2
+
+    other_retort = Retort(recipe=[compilation_cache(directory=tmp_path)])
+    assert other_retort.load({"title": "abc", "price": 100}, Book) == Book(title="abc", price=100)
+    assert other_retort.dump(Book(title="abc", price=100)) == {"title": "abc", "price": 100}
+    assert set(tmp_path.iterdir()) == entries
+
+
+def test_failed_store(tmp_path, monkeypatch):
+    def failing_replace(self, target):
+        raise OSError
+
+    monkeypatch.setattr(Path, "replace", failing_replace)
+    closure = DiskCachingClosureCompiler(tmp_path).compile("test", lambda uid: f"<first {uid}>", _make_builder(1), {})
+    assert closure() == 1
+    assert list(tmp_path.iterdir()) == []
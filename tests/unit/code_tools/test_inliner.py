@@ -0,0 +1,42 @@
+import pytest
+
+from adaptix._internal.code_tools.inliner import InlinableCode, inline_code
+
+SOURCE = """
+def closure(data):
+    try:
+        value = converter(data)
+    except ValueError as e:
+        raise TypeError from e
+    return [value for value in range(value)]
+"""
+
+
+def test_inline_code():
+    inlined = inline_code(
+        InlinableCode(source=SOURCE, namespace={"converter": int}),
+        prefix="p_",
+        result_target="result",
+    )
+    assert inlined.arg == "p_data"
+    assert inlined.namespace == {"p_converter": int}
+
+    namespace = {**inlined.namespace, inlined.arg: "3"}
+    exec(inlined.body, namespace)  # noqa: S102
+    assert namespace["result"] == [0, 1, 2]
+    assert "value" not in namespace
+    assert "p_value" in namespace
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "def closure(data):\n    if data:\n        return 1\n    return 2",
+        "def closure(data):\n    data = 1",
+        "def closure(data, other):\n    return data",
+        "def closure(data):\n    func = lambda: data\n    return func",
+    ],
+)
+def test_not_inlinable_code(source):
+    with pytest.raises(ValueError):  # noqa: PT011
+        inline_code(InlinableCode(source=source, namespace={}), prefix="p_", result_target="result")
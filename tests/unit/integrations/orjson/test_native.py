@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+import orjson
+import pytest
+
+from adaptix import DebugTrail, Retort, dumper
+from adaptix.integrations.orjson import OrjsonRetort, native_orjson
+
+
+@dataclass
+class Event:
+    id: UUID
+    at: datetime
+    day: Optional[date]
+    start: time
+    price: Decimal
+    tags: list[str]
+
+
+EVENT = Event(
+    id=UUID("7e568b96-cd0c-4d3e-b0fa-43cb5d3aa699"),
+    at=datetime(2020, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc),
+    day=date(2020, 1, 2),
+    start=time(1, 2, 3),
+    price=Decimal("1.5"),
+    tags=["a", "b"],
+)
+
+
+def test_native_orjson():
+    retort = Retort(recipe=[native_orjson()])
+    assert retort.dump(EVENT) == {
+        "id": EVENT.id,
+        "at": EVENT.at,
+        "day": EVENT.day,
+        "start": "01:02:03",
+        "price": "1.5",
+        "tags": ["a", "b"],
+    }
+    assert Retort(recipe=[native_orjson(UUID)]).dump(EVENT)["at"] == "2020-01-02T03:04:05.000006+00:00"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        EVENT,
+        Event(**{**vars(EVENT), "at": datetime(2020, 1, 2, tzinfo=timezone(timedelta(hours=3))), "day": None}),
+    ],
+)
+def test_dumps_bytes(data):
+    retort = OrjsonRetort()
+    assert retort.dumps_bytes(data) == orjson.dumps(Retort().dump(data))
+    assert retort.dumps_bytes([data], list[Event]) == orjson.dumps(Retort().dump([data], list[Event]))
+    assert retort.load(orjson.loads(retort.dumps_bytes(data)), Event) == data
+    assert retort.get_bytes_dumper(Event) is retort.get_bytes_dumper(Event)
+
+
+def test_option():
+    retort = OrjsonRetort(option=orjson.OPT_UTC_Z | orjson.OPT_SORT_KEYS)
+    assert orjson.loads(retort.dumps_bytes(EVENT))["at"] == "2020-01-02T03:04:05.000006Z"
+    assert retort.dumps_bytes({"b": 1, "a": 2}, dict[str, int]) == b'{"a":2,"b":1}'
+    assert retort.replace(strict_coercion=False).dumps_bytes({"b": 1, "a": 2}, dict[str, int]) == b'{"a":2,"b":1}'
+
+
+def test_user_recipe_overrides_native_types():
+    retort = OrjsonRetort(recipe=[dumper(datetime, lambda value: value.timestamp())])
+    assert orjson.loads(retort.dumps_bytes(EVENT))["at"] == EVENT.at.timestamp()
+
+
+def test_retort_parameters():
+    retort = OrjsonRetort(option=orjson.OPT_SORT_KEYS, debug_trail=DebugTrail.DISABLE, strict_coercion=False)
+    assert retort.dumps_bytes({"b": 1, "a": 2}, dict[str, int]) == b'{"a":2,"b":1}'
+    assert retort.load("1", int) == 1
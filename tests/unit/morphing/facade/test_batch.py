@@ -0,0 +1,124 @@
+import json
+from dataclasses import dataclass
+
+import pytest
+from tests_helpers import raises_exc, with_trail
+
+from adaptix import BatchLoadResult, DebugTrail, Retort
+from adaptix.load_error import AggregateLoadError, TypeLoadError
+
+
+@dataclass
+class Book:
+    title: str
+    price: int
+
+
+GOOD_RECORDS = [{"title": "a", "price": 1}, {"title": "b", "price": 2}]
+BAD_RECORDS = [{"title": "a", "price": 1}, {"title": "b", "price": "2"}, {"title": 3, "price": 3}]
+
+
+def test_load_many(debug_trail):
+    retort = Retort(debug_trail=debug_trail)
+    assert retort.load_many(GOOD_RECORDS, Book) == [Book("a", 1), Book("b", 2)]
+    assert retort.load_many(iter(GOOD_RECORDS), Book) == [Book("a", 1), Book("b", 2)]
+    assert retort.load_many([], Book) == []
+    assert retort.get_batch_loader(Book) is retort.get_batch_loader(Book)
+
+
+def test_load_many_dt_disable():
+    retort = Retort(debug_trail=DebugTrail.DISABLE)
+    raises_exc(
+        TypeLoadError(int, "2"),
+        lambda: retort.load_many(BAD_RECORDS, Book),
+    )
+
+
+def test_load_many_dt_first():
+    retort = Retort(debug_trail=DebugTrail.FIRST)
+    raises_exc(
+        with_trail(TypeLoadError(int, "2"), [1, "price"]),
+        lambda: retort.load_many(BAD_RECORDS, Book),
+    )
+
+
+def test_load_many_dt_all():
+    retort = Retort(debug_trail=DebugTrail.ALL)
+    raises_exc(
+        AggregateLoadError(
+            f"while loading batch of {Book}",
+            [
+                with_trail(
+                    AggregateLoadError(
+                        f"while loading model {Book}",
+                        [with_trail(TypeLoadError(int, "2"), ["price"])],
+                    ),
+                    [1],
+                ),
+                with_trail(
+                    AggregateLoadError(
+                        f"while loading model {Book}",
+                        [with_trail(TypeLoadError(str, 3), ["title"])],
+                    ),
+                    [2],
+                ),
+            ],
+        ),
+        lambda: retort.load_many(BAD_RECORDS, Book),
+    )
+
+
+@pytest.mark.parametrize("debug_trail", [DebugTrail.DISABLE, DebugTrail.FIRST])
+def test_load_many_collect_errors(debug_trail):
+    retort = Retort(debug_trail=debug_trail)
+    result = retort.load_many(BAD_RECORDS, Book, collect_errors=True)
+
+    assert result == BatchLoadResult(values={0: Book("a", 1)}, errors=result.errors)
+    assert list(result.errors) == [1, 2]
+    assert isinstance(result.errors[1], TypeLoadError)
+    assert isinstance(result.errors[2], TypeLoadError)
+
+    assert retort.load_many(GOOD_RECORDS, Book, collect_errors=True) == BatchLoadResult(
+        values={0: Book("a", 1), 1: Book("b", 2)},
+        errors={},
+    )
+
+
+def test_iter_load(debug_trail):
+    retort = Retort(debug_trail=debug_trail)
+    consumed = []
+
+    def records():
+        for record in GOOD_RECORDS:
+            consumed.append(record)
+            yield record
+
+    values = retort.iter_load(records(), Book)
+    assert consumed == []
+    assert next(values) == Book("a", 1)
+    assert consumed == GOOD_RECORDS[:1]
+    assert list(values) == [Book("b", 2)]
+
+
+def test_iter_load_parser():
+    retort = Retort()
+    lines = [b'{"title": "a", "price": 1}\n', b"\n", b'{"title": "b", "price": 2}\n', b'{"title": "c", "price": 3}']
+
+    assert list(retort.iter_load(lines, Book, parser=json.loads)) == [Book("a", 1), Book("b", 2), Book("c", 3)]
+    assert list(retort.iter_load(lines, Book, parser=json.loads, chunk_size=2)) == [
+        [Book("a", 1), Book("b", 2)],
+        [Book("c", 3)],
+    ]
+    with pytest.raises(ValueError, match="chunk_size must be positive"):
+        retort.iter_load(lines, Book, chunk_size=0)
+
+
+def test_iter_load_dt_first():
+    retort = Retort(debug_trail=DebugTrail.FIRST)
+    values = retort.iter_load(BAD_RECORDS, Book)
+
+    assert next(values) == Book("a", 1)
+    raises_exc(
+        with_trail(TypeLoadError(int, "2"), [1, "price"]),
+        lambda: next(values),
+    )
@@ -0,0 +1,211 @@
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Optional, Union
+from uuid import UUID
+
+import pytest
+from tests_helpers import raises_exc, with_trail
+
+from adaptix import DebugTrail, ExtraForbid, Retort, dumper, loader, memoized_loader, name_mapping
+from adaptix._internal.compat import CompatExceptionGroup
+from adaptix.load_error import (
+    AggregateLoadError,
+    ExtraFieldsLoadError,
+    NoRequiredFieldsLoadError,
+    TypeLoadError,
+    ValueLoadError,
+)
+from adaptix.retort import ProviderNotFoundError
+
+
+@dataclass
+class Event:
+    id: int
+    score: float
+    day: date
+    note: Optional[str] = None
+    tags: list[str] = field(default_factory=list)
+
+
+COLUMNS = {
+    "id": [1, 2],
+    "score": [1.5, 2],
+    "day": ["2024-01-02", "2024-03-04"],
+    "note": ["x", None],
+    "tags": [["a"], []],
+}
+EVENTS = [
+    Event(id=1, score=1.5, day=date(2024, 1, 2), note="x", tags=["a"]),
+    Event(id=2, score=2.0, day=date(2024, 3, 4), note=None, tags=[]),
+]
+
+
+def test_load_columns(debug_trail):
+    retort = Retort(debug_trail=debug_trail)
+    assert retort.load_columns(COLUMNS, Event) == EVENTS
+    assert retort.load_columns({**COLUMNS, "id": (1, 2), "extra": 1}, Event) == EVENTS
+    assert retort.load_columns({"id": [], "score": [], "day": []}, Event) == []
+    assert retort.get_columns_loader(Event) is retort.get_columns_loader(Event)
+
+
+def test_omitted_optional_columns():
+    retort = Retort()
+    assert retort.load_columns({"id": [1], "score": [0.5], "day": ["2024-01-02"], "tags": [["a"]]}, Event) == [
+        Event(id=1, score=0.5, day=date(2024, 1, 2), tags=["a"]),
+    ]
+
+
+def test_kw_only_fields():
+    @dataclass(kw_only=True)
+    class Point:
+        x: int
+        y: int = 0
+
+    assert Retort().load_columns({"x": [1, 2], "y": [3, 4]}, Point) == [Point(x=1, y=3), Point(x=2, y=4)]
+
+
+def test_name_mapping():
+    retort = Retort(recipe=[name_mapping(Event, map={"id": "event_id"}, extra_in=ExtraForbid())])
+    data = {"event_id": COLUMNS["id"], **COLUMNS}
+    raises_exc(
+        ExtraFieldsLoadError(["id"], data),
+        lambda: retort.load_columns(data, Event),
+    )
+    del data["id"]
+    assert retort.load_columns(data, Event) == EVENTS
+
+
+def test_data_errors():
+    retort = Retort(debug_trail=DebugTrail.DISABLE)
+    raises_exc(
+        TypeLoadError(Mapping, [1]),
+        lambda: retort.load_columns([1], Event),
+    )
+    raises_exc(
+        NoRequiredFieldsLoadError(["score", "day"], {"id": [1]}),
+        lambda: retort.load_columns({"id": [1]}, Event),
+    )
+    data = {**COLUMNS, "id": [1]}
+    raises_exc(
+        ValueLoadError("Columns have different lengths", data),
+        lambda: retort.load_columns(data, Event),
+    )
+
+
+def test_dt_disable():
+    retort = Retort(debug_trail=DebugTrail.DISABLE)
+    raises_exc(
+        TypeLoadError(int, "2"),
+        lambda: retort.load_columns({**COLUMNS, "id": [1, "2"]}, Event),
+    )
+
+
+def test_dt_first():
+    retort = Retort(debug_trail=DebugTrail.FIRST)
+    raises_exc(
+        with_trail(TypeLoadError(int, "2"), ["id", 1]),
+        lambda: retort.load_columns({**COLUMNS, "id": [1, "2"]}, Event),
+    )
+    raises_exc(
+        with_trail(TypeLoadError(Iterable, 1), ["id"]),
+        lambda: retort.load_columns({**COLUMNS, "id": 1}, Event),
+    )
+
+
+def test_dt_all():
+    retort = Retort(debug_trail=DebugTrail.ALL)
+    raises_exc(
+        AggregateLoadError(
+            f"while loading columns of {Event}",
+            [
+                with_trail(TypeLoadError(int, None), ["id", 0]),
+                with_trail(TypeLoadError(int, "2"), ["id", 1]),
+                with_trail(TypeLoadError(Union[float, int], "3"), ["score", 0]),
+            ],
+        ),
+        lambda: retort.load_columns({**COLUMNS, "id": [None, "2"], "score": ["3", 4]}, Event),
+    )
+
+
+def test_dt_all_resumes_loading():
+    calls = []
+
+    def parse(data):
+        calls.append(data)
+        try:
+            return date.fromisoformat(data)
+        except ValueError:
+            raise ValueLoadError("Bad date", data) from None
+
+    retort = Retort(debug_trail=DebugTrail.ALL, recipe=[memoized_loader(date), loader(date, parse)])
+    days = ["2024-01-02", "bad", "2024-01-03", "2024-01-02", "worse"]
+    raises_exc(
+        AggregateLoadError(
+            f"while loading columns of {Event}",
+            [
+                with_trail(ValueLoadError("Bad date", "bad"), ["day", 1]),
+                with_trail(ValueLoadError("Bad date", "worse"), ["day", 4]),
+            ],
+        ),
+        lambda: retort.load_columns({"id": [1] * 5, "score": [1] * 5, "day": days}, Event),
+    )
+    assert calls == ["2024-01-02", "bad", "2024-01-03", "2024-01-02", "worse"]
+
+
+def test_dt_all_resumes_loading_after_non_load_error():
+    @dataclass
+    class Item:
+        uuid: UUID
+
+    retort = Retort(debug_trail=DebugTrail.ALL, recipe=[memoized_loader()])
+    raises_exc(
+        CompatExceptionGroup(
+            f"while loading columns of {Item}",
+            [
+                with_trail(ValueError("badly formed hexadecimal UUID string"), ["uuid", 1]),
+                with_trail(ValueError("badly formed hexadecimal UUID string"), ["uuid", 2]),
+            ],
+        ),
+        lambda: retort.load_columns({"uuid": ["2f2bba5d-5c62-4ad0-9ec4-1b3ab12d1a80", "bad", "bad2"]}, Item),
+    )
+
+
+def test_dump_columns():
+    retort = Retort()
+    assert retort.dump_columns(EVENTS, Event) == {
+        "id": [1, 2],
+        "score": [1.5, 2.0],
+        "day": ["2024-01-02", "2024-03-04"],
+        "note": ["x", None],
+        "tags": [["a"], []],
+    }
+    assert retort.dump_columns(iter(EVENTS), Event) == retort.dump_columns(EVENTS, Event)
+    assert retort.dump_columns([], Event) == {"id": [], "score": [], "day": [], "note": [], "tags": []}
+    assert retort.load_columns(retort.dump_columns(EVENTS, Event), Event) == EVENTS
+
+
+def test_dump_columns_dt_first():
+    def dump_tag(data):
+        raise ValueError("bad tag")
+
+    retort = Retort(debug_trail=DebugTrail.FIRST, recipe=[dumper(str, dump_tag)])
+    raises_exc(
+        with_trail(ValueError("bad tag"), [0]),
+        lambda: retort.dump_columns([Event(id=1, score=1.5, day=date(2024, 1, 2), tags=["a"])], Event),
+    )
+
+
+def test_not_supported():
+    retort = Retort(
+        recipe=[
+            name_mapping(Event, map={"id": ("meta", "id")}),
+            name_mapping(Event, omit_default=True),
+        ],
+    )
+    with pytest.raises(ProviderNotFoundError):
+        retort.get_columns_loader(Event)
+    with pytest.raises(ProviderNotFoundError):
+        retort.get_columns_dumper(Event)
+    with pytest.raises(ProviderNotFoundError):
+        Retort().get_columns_loader(list[int])
@@ -0,0 +1,105 @@
+import importlib.metadata
+import importlib.util
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Optional, Union
+
+import pytest
+from tests_helpers import raises_exc, with_trail
+
+from adaptix import DebugTrail, P, Retort, loader
+from adaptix.load_error import AggregateLoadError, TypeLoadError
+
+
+@dataclass
+class Node:
+    value: int
+    children: list["Node"] = field(default_factory=list)
+    created_at: Optional[datetime] = None
+
+
+@dataclass
+class Book:
+    title: str
+    price: int
+
+
+@dataclass
+class Tree:
+    value: int
+    child: Union["Tree", int, None] = None
+    branches: tuple["Tree", ...] = ()
+
+
+def _import_module(path):
+    spec = importlib.util.spec_from_file_location("frozen_module", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_freeze(tmp_path, debug_trail):
+    retort = Retort(
+        debug_trail=debug_trail,
+        recipe=[
+            loader(P[Book].title, lambda x: x.upper()),
+        ],
+    )
+    path = tmp_path / "frozen.py"
+    retort.freeze([Node, Book, list[Book]], path=path)
+    frozen = _import_module(path)
+
+    data = {"value": 1, "children": [{"value": 2, "created_at": "2020-01-01T00:00:00+00:00"}]}
+    node = Node(value=1, children=[Node(value=2, created_at=datetime(2020, 1, 1, tzinfo=timezone.utc))])
+    assert frozen.load(data, Node) == node
+    assert frozen.dump(node) == retort.dump(node)
+    assert frozen.load([{"title": "abc", "price": 1}], list[Book]) == [Book(title="ABC", price=1)]
+    assert set(frozen.loaders) == {Node, Book, list[Book]}
+    assert set(frozen.dumpers) == {Node, Book, list[Book]}
+
+
+def test_freeze_recursive(tmp_path, debug_trail):
+    retort = Retort(debug_trail=debug_trail)
+    path = tmp_path / "frozen.py"
+    retort.freeze([Tree], path=path)
+    frozen = _import_module(path)
+
+    tree = Tree(value=1, child=Tree(value=2, child=3), branches=(Tree(value=4, branches=(Tree(value=5),)),))
+    assert frozen.dump(tree) == retort.dump(tree)
+    assert frozen.load(retort.dump(tree), Tree) == tree
+
+
+def test_freeze_errors(tmp_path):
+    retort = Retort(debug_trail=DebugTrail.ALL)
+    path = tmp_path / "frozen.py"
+    retort.freeze([Node], path=path, dumpers=False)
+    frozen = _import_module(path)
+
+    assert frozen.dumpers == {}
+    raises_exc(
+        AggregateLoadError(
+            f"while loading model {Node}",
+            [
+                with_trail(TypeLoadError(int, "abc"), ["value"]),
+            ],
+        ),
+        lambda: frozen.load({"value": "abc"}, Node),
+    )
+
+
+def test_frozen_source(tmp_path):
+    path = tmp_path / "frozen.py"
+    Retort().freeze([Node], path=path)
+    source = path.read_text()
+    assert "def model_loader_Node(data):" in source
+    assert "def model_dumper_Node(data):" in source
+    assert "import pickle" not in source
+    assert "import marshal" not in source
+
+
+def test_version_guard(tmp_path, monkeypatch):
+    path = tmp_path / "frozen.py"
+    Retort().freeze([Book], path=path)
+    monkeypatch.setattr(importlib.metadata, "version", lambda name: "0.0.0")
+    with pytest.raises(ImportError, match="you have to regenerate it"):
+        _import_module(path)
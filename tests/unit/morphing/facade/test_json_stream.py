@@ -0,0 +1,111 @@
+import io
+import json
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import pytest
+from tests_helpers import raises_exc, with_trail
+
+from adaptix import DebugTrail, Retort, dumper, name_mapping
+from adaptix.struct_trail import Attr
+
+
+@dataclass
+class Item:
+    name: str
+    tags: list[str]
+    price: float = 0.0
+
+
+@dataclass
+class Order:
+    id: int
+    items: list[Item]
+    by_key: dict[str, Optional[Item]]
+    note: Optional[Item] = None
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+ORDER = Order(
+    id=1,
+    items=[Item("a", ["x", "y"], 1.5), Item("ö", [])],
+    by_key={"k": None, "m": Item("q", ["z"])},
+    extra={"source": "web", "flags": [1, 2]},
+)
+
+
+def dump_json_text(retort: Retort, data: Any, tp: Any = None) -> str:
+    return json.dumps(retort.dump(data, tp), ensure_ascii=False, separators=(",", ":"))
+
+
+@pytest.mark.parametrize(
+    "recipe",
+    [
+        pytest.param([], id="default"),
+        pytest.param(
+            [
+                name_mapping(Item, omit_default=True),
+                name_mapping(Order, map={"id": ("meta", "id")}, extra_in="extra", extra_out="extra"),
+            ],
+            id="nested_and_sieved",
+        ),
+        pytest.param([name_mapping(Order, as_list=True)], id="as_list"),
+        pytest.param([dumper(Item, lambda item: item.name.upper())], id="custom_dumper"),
+    ],
+)
+@pytest.mark.parametrize("buffer_size", [1, 7, 2 ** 16])
+def test_iter_dump_json(debug_trail, recipe, buffer_size):
+    retort = Retort(debug_trail=debug_trail, recipe=recipe)
+    blocks = list(retort.iter_dump_json(ORDER, buffer_size=buffer_size))
+    assert b"".join(blocks).decode() == dump_json_text(retort, ORDER)
+    if buffer_size == 1:
+        assert len(blocks) > 1
+
+
+def test_iter_dump_json_explicit_type():
+    retort = Retort()
+    data = [Item("a", []), Item("b", ["c"])]
+    assert b"".join(retort.iter_dump_json(data, list[Item])).decode() == dump_json_text(retort, data, list[Item])
+    assert b"".join(retort.iter_dump_json(None, Optional[Item])) == b"null"
+
+
+def test_dump_json():
+    retort = Retort()
+
+    text_stream = io.StringIO()
+    retort.dump_json(ORDER, fp=text_stream, buffer_size=10)
+    assert text_stream.getvalue() == dump_json_text(retort, ORDER)
+
+    binary_stream = io.BytesIO()
+    retort.dump_json(ORDER, fp=binary_stream, binary=True, buffer_size=10)
+    assert binary_stream.getvalue().decode() == dump_json_text(retort, ORDER)
+
+
+def _failing_dumper(value):
+    raise ValueError(value)
+
+
+@pytest.mark.parametrize(
+    ["debug_trail", "trail"],
+    [
+        (DebugTrail.DISABLE, []),
+        (DebugTrail.FIRST, [Attr("items"), 1, Attr("name")]),
+        (DebugTrail.ALL, [Attr("items"), 1, Attr("name")]),
+    ],
+)
+def test_error_trail(debug_trail, trail):
+    retort = Retort(
+        debug_trail=debug_trail,
+        recipe=[
+            dumper(str, lambda value: _failing_dumper(value) if value == "ö" else value),
+        ],
+    )
+    raises_exc(
+        with_trail(ValueError("ö"), trail),
+        lambda: b"".join(retort.iter_dump_json(ORDER)),
+    )
+
+
+def test_bad_buffer_size():
+    with pytest.raises(ValueError, match="buffer_size must be positive"):
+        Retort().iter_dump_json(ORDER, buffer_size=0)
@@ -1,7 +1,9 @@
+from dataclasses import dataclass
+
 import pytest
-from tests_helpers import PlaceholderProvider, full_match
+from tests_helpers import PlaceholderProvider, full_match, parametrize_bool
 
-from adaptix import DebugTrail, Retort
+from adaptix import DebugTrail, ProviderNotFoundError, Retort
 
 
 def test_retort_replace():
@@ -45,3 +47,34 @@ def test_generic_class_inferring():
         ),
     ):
         Retort().dump([1, 2, 3])
+
+
+@parametrize_bool("parallel")
+def test_warmup(parallel):
+    @dataclass
+    class Book:
+        title: str
+
+    retort = Retort()
+    retort.warmup([Book, list[Book]], dumpers=False, parallel=parallel)
+    assert set(retort._loader_cache) == {Book, list[Book]}
+    assert not retort._dumper_cache
+
+    loader = retort.get_loader(Book)
+    retort.warmup([Book], parallel=parallel)
+    assert retort.get_loader(Book) is loader
+    assert set(retort._dumper_cache) == {Book}
+
+
+@parametrize_bool("parallel")
+def test_warmup_error(parallel):
+    class First:
+        pass
+
+    class Second:
+        pass
+
+    retort = Retort()
+    with pytest.raises(ProviderNotFoundError) as exc_info:
+        retort.warmup([int, First, Second], dumpers=False, parallel=parallel)
+    assert exc_info.value.message == f"Cannot produce loader for type {First!r}"
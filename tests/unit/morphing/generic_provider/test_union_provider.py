@@ -255,3 +255,85 @@ def test_dump_literal_in_union(
 
     with pytest.raises(KeyError):
         dumper_(wrong_value)
+
+
+@dataclass
+class Cat:
+    name: str
+    lives: int = 9
+
+
+@dataclass
+class Dog:
+    name: str
+    breed: str
+
+
+def test_loading_dispatching(debug_trail):
+    loader_ = Retort(debug_trail=debug_trail).get_loader(Union[int, str, None, Cat, Dog])
+
+    assert loader_(1) == 1
+    assert loader_("a") == "a"
+    assert loader_(None) is None
+    assert loader_({"name": "Tom"}) == Cat(name="Tom")
+    assert loader_({"name": "Rex", "breed": "pug"}) == Cat(name="Rex")
+    assert loader_({"name": "Rex", "breed": "pug", "lives": 3}) == Cat(name="Rex", lives=3)
+    assert Retort(debug_trail=debug_trail).get_loader(Union[Dog, Cat])({"name": "Tom"}) == Cat(name="Tom")
+
+    if debug_trail == DebugTrail.DISABLE:
+        raises_exc(LoadError(), lambda: loader_({"breed": "pug"}))
+    else:
+        exc = pytest.raises(UnionLoadError, lambda: loader_({"breed": "pug"})).value
+        assert len(exc.exceptions) == 5
+        assert {
+            sub_exc.expected_type for sub_exc in exc.exceptions if type(sub_exc) is TypeLoadError
+        } == {int, str, None}
+
+
+@dataclass
+class Payment:
+    amount: Decimal
+    currency: str
+
+
+@dataclass
+class Refund:
+    amount: Decimal
+    reason: str
+
+
+def test_loading_dispatching_skips_rejecting_loaders():
+    calls = []
+
+    def counting_loader(data):
+        calls.append(data)
+        return Decimal(data)
+
+    loader_ = Retort(recipe=[loader(Decimal, counting_loader)]).get_loader(Union[Payment, Refund, int])
+
+    assert loader_(1) == 1
+    assert calls == []
+    assert loader_({"amount": "1", "reason": "broken"}) == Refund(amount=Decimal(1), reason="broken")
+    assert calls == ["1"]
+
+
+def test_loading_dispatching_does_not_repeat_loaders(debug_trail):
+    calls = []
+
+    def counting_loader(data):
+        calls.append(data)
+        return Decimal(data)
+
+    loader_ = Retort(
+        debug_trail=debug_trail,
+        recipe=[loader(Decimal, counting_loader)],
+    ).get_loader(Union[Payment, Refund, int])
+
+    with pytest.raises(LoadError) as exc_info:
+        loader_({"amount": "1", "currency": 1, "reason": 2})
+    assert calls == ["1", "1"]
+    if debug_trail != DebugTrail.DISABLE:
+        assert isinstance(exc_info.value, UnionLoadError)
+        assert len(exc_info.value.exceptions) == 3
+        assert isinstance(exc_info.value.exceptions[0], TypeLoadError)
+        assert exc_info.value.exceptions[0].expected_type is int
@@ -0,0 +1,121 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import pytest
+from tests_helpers import raises_exc
+
+from adaptix import DebugTrail, Retort, inline_nested_models, loader
+from adaptix._internal.morphing.model.basic_gen import CodeGenAccumulator
+from adaptix._internal.special_cases_optimization import get_inlinable_code
+
+
+@dataclass
+class Item:
+    id: int
+    name: str = "unnamed"
+
+
+@dataclass
+class Customer:
+    name: str
+    favorite: Optional[Item] = None
+
+
+@dataclass
+class Order:
+    customer: Customer
+    main: Item
+    extra: Optional[Item]
+    items: list[Item]
+
+
+VALID_DATA = {
+    "customer": {"name": "Alice", "favorite": {"id": 1}},
+    "main": {"id": 2, "name": "Book"},
+    "extra": None,
+    "items": [{"id": 3}],
+}
+
+INVALID_DATA = [
+    {"customer": {"name": 1, "favorite": {"id": "x"}}, "main": {"id": 2}, "extra": {"id": "y"}, "items": []},
+    {"customer": {"name": "Alice"}, "main": {}, "extra": None, "items": []},
+    {"customer": 1, "main": None},
+    [],
+]
+
+
+def _catch_error(func) -> Exception:
+    try:
+        func()
+    except Exception as e:
+        return e
+    pytest.fail("Exception is not raised")
+
+
+@pytest.fixture(params=list(DebugTrail))
+def debug_trail(request):
+    return request.param
+
+
+def test_loading(debug_trail):
+    retort = Retort(debug_trail=debug_trail)
+    inlining_retort = retort.extend(recipe=[inline_nested_models()])
+
+    assert inlining_retort.load(VALID_DATA, Order) == retort.load(VALID_DATA, Order)
+    for data in INVALID_DATA:
+        expected = _catch_error(lambda: retort.load(data, Order))  # noqa: B023
+        raises_exc(expected, lambda: inlining_retort.load(data, Order))  # noqa: B023
+
+
+def test_dumping(debug_trail):
+    retort = Retort(debug_trail=debug_trail)
+    inlining_retort = retort.extend(recipe=[inline_nested_models()])
+    order = retort.load(VALID_DATA, Order)
+
+    assert inlining_retort.dump(order) == retort.dump(order)
+
+    invalid_order: Any = Order(customer=Customer(name="Bob", favorite=1), main=None, extra=None, items=[])
+    expected = _catch_error(lambda: retort.dump(invalid_order))
+    raises_exc(expected, lambda: inlining_retort.dump(invalid_order))
+
+
+def _get_generated_code(*recipe) -> dict[Any, str]:
+    accumulator = CodeGenAccumulator()
+    retort = Retort(recipe=[accumulator, *recipe])
+    retort.get_loader(Order)
+    return accumulator.code_dict
+
+
+def test_code_is_inlined():
+    assert "loader_customer(" in _get_generated_code()[Order]
+
+    code = _get_generated_code(inline_nested_models())[Order]
+    assert "loader_customer(" not in code
+    assert "loader_main(" not in code
+    assert "loader_extra(" not in code
+    assert "loader_items(" in code
+
+
+def test_max_depth():
+    code = _get_generated_code(inline_nested_models(max_depth=1))[Order]
+    assert "loader_customer(" not in code
+    assert "loader_favorite(" in code  # levels are counted from the outermost model
+    assert "loader_main(" not in code
+
+
+def test_inlinable_code_is_attached_only_for_inlining():
+    assert get_inlinable_code(Retort().get_loader(Order)) is None
+    assert get_inlinable_code(Retort().get_dumper(Order)) is None
+    assert get_inlinable_code(Retort(recipe=[inline_nested_models()]).get_loader(Order)) is None
+
+
+def test_overridden_loader_is_not_inlined():
+    code = _get_generated_code(inline_nested_models(), loader(Item, lambda data: Item(id=0)))[Order]
+    assert "loader_customer(" not in code
+    assert "loader_main(" in code
+
+
+def test_fast_path_is_not_repeated():
+    code = _get_generated_code(inline_nested_models())[Order]
+    # only the inlined loaders of Item that do not inline other models have the fast path
+    assert code.count(" is dict and ") == 3
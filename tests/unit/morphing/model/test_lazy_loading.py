@@ -0,0 +1,133 @@
+import pickle
+from dataclasses import dataclass, field, replace
+from typing import NamedTuple, Optional
+
+from tests_helpers import raises_exc, with_trail
+
+from adaptix import DebugTrail, Retort, lazy_loading, name_mapping
+from adaptix.load_error import AggregateLoadError, TypeLoadError
+
+
+@dataclass
+class Item:
+    id: int
+    name: str = "unnamed"
+
+
+@dataclass(frozen=True)
+class Order:
+    number: int
+    main: Item
+    extra: Optional[Item]
+    items: list[Item]
+    tags: dict[str, int] = field(default_factory=dict)
+
+
+DATA = {
+    "number": 1,
+    "main": {"id": 2, "name": "Book"},
+    "extra": None,
+    "items": [{"id": 3}],
+    "tags": {"a": 1},
+}
+ORDER = Order(number=1, main=Item(2, "Book"), extra=None, items=[Item(3)], tags={"a": 1})
+
+
+def test_deferred_fields():
+    retort = Retort(recipe=[lazy_loading(Order)])
+    order = retort.load(DATA, Order)
+    assert isinstance(order, Order)
+    assert order.__class__ is Order
+    assert {
+        field_id: type(value).__name__
+        for field_id, value in vars(order).items()
+    } == {
+        "number": "int",
+        "main": "_DeferredValue",
+        "extra": "_DeferredValue",
+        "items": "_DeferredValue",
+        "tags": "_DeferredValue",
+    }
+
+    assert order.main == Item(2, "Book")
+    assert vars(order)["main"] is order.main
+    assert order == ORDER
+    assert ORDER.__eq__(order) is True
+    assert retort.dump(order) == Retort().dump(ORDER)
+
+
+def test_same_recipe():
+    recipe = [name_mapping(Order, map={"main": ("nested", "main")})]
+    data = {**DATA, "nested": {"main": DATA["main"]}}
+    del data["main"]
+    lazy_order = Retort(recipe=[lazy_loading(Order), *recipe]).load(data, Order)
+    assert lazy_order == Retort(recipe=recipe).load(data, Order)
+
+
+def test_model_copying():
+    order = Retort(recipe=[lazy_loading(Order)]).load(DATA, Order)
+
+    unpickled = pickle.loads(pickle.dumps(order))  # noqa: S301
+    assert type(unpickled) is Order
+    assert unpickled == ORDER
+
+    replaced = replace(order, number=10)
+    assert type(replaced) is Order
+    assert replaced == replace(ORDER, number=10)
+
+
+def test_top_level_errors():
+    retort = Retort(recipe=[lazy_loading(Order)], debug_trail=DebugTrail.FIRST)
+    raises_exc(
+        with_trail(TypeLoadError(int, "1"), ["number"]),
+        lambda: retort.load({**DATA, "number": "1"}, Order),
+    )
+    # data of deferred fields is not checked at loading
+    retort.load({**DATA, "items": None}, Order)
+
+
+def test_access_errors(debug_trail):
+    retort = Retort(recipe=[lazy_loading(Order)], debug_trail=debug_trail)
+    order = retort.load({**DATA, "items": [{"id": "x"}]}, Order)
+    assert order.main == Item(2, "Book")
+
+    def make_exc():
+        if debug_trail == DebugTrail.DISABLE:
+            return TypeLoadError(int, "x")
+        if debug_trail == DebugTrail.FIRST:
+            return with_trail(TypeLoadError(int, "x"), ["items", 0, "id"])
+        return with_trail(
+            AggregateLoadError(
+                f"while loading iterable {list}",
+                [
+                    with_trail(
+                        AggregateLoadError(
+                            f"while loading model {Item}",
+                            [with_trail(TypeLoadError(int, "x"), ["id"])],
+                        ),
+                        [0],
+                    ),
+                ],
+            ),
+            ["items"],
+        )
+
+    raises_exc(make_exc(), lambda: order.items)
+    # failed loading is repeated at the next access
+    raises_exc(make_exc(), lambda: order.items)
+
+
+def test_nested_lazy_models():
+    retort = Retort(recipe=[lazy_loading()])
+    order = retort.load(DATA, Order)
+    assert type(vars(order)["main"]).__name__ == "_DeferredValue"
+    assert order.main == Item(2, "Book")
+
+
+def test_not_supported_model():
+    class Point(NamedTuple):
+        x: int
+        y: list[int]
+
+    retort = Retort(recipe=[lazy_loading(Point)])
+    assert retort.load({"x": 1, "y": [2]}, Point) == Point(1, [2])
@@ -2,7 +2,7 @@
 from collections.abc import Mapping as CollectionsMapping, Sequence as CollectionsSequence
 from dataclasses import dataclass, replace
 from types import MappingProxyType
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Union
 
 import pytest
 from tests_helpers import DebugCtx, full_match, parametrize_bool, raises_exc, with_trail
@@ -116,6 +116,7 @@ def make_loader_getter(
     def getter():
         retort = Retort(
             recipe=[
+                debug_ctx.accum,
                 ValueProvider(InputShapeRequest, shape),
                 ValueProvider(InputNameLayoutRequest, name_layout),
                 bound(int, ValueProvider(LoaderRequest, int_loader)),
@@ -1266,3 +1267,90 @@ def test_skipped_pos_optional_pos_field(debug_ctx, extra_policy):
     loader = loader_getter()
 
     assert loader({"a": 1, "c": 3}) == gauge(1, c=3)
+
+
+@dataclass
+class Scalars:
+    a: int
+    b: float
+    c: bool
+    d: str = ""
+
+
+def test_scalar_fields(debug_ctx, debug_trail, trail_select):
+    loader = Retort(debug_trail=debug_trail, recipe=[debug_ctx.accum]).get_loader(Scalars)
+    assert all(f"loader_{field_id}(" not in debug_ctx.source for field_id in "abcd")
+
+    assert loader({"a": 1, "b": 2, "c": True, "d": "x"}) == Scalars(a=1, b=2.0, c=True, d="x")
+    assert type(loader({"a": 1, "b": 2, "c": True}).b) is float
+
+    raises_exc(
+        trail_select(
+            disable=TypeLoadError(int, input_value=True),
+            first=with_trail(TypeLoadError(int, input_value=True), ["a"]),
+            all=AggregateLoadError(
+                f"while loading model {Scalars}",
+                [
+                    with_trail(TypeLoadError(int, input_value=True), ["a"]),
+                    with_trail(TypeLoadError(Union[float, int], "2"), ["b"]),
+                    with_trail(TypeLoadError(bool, 1), ["c"]),
+                    with_trail(TypeLoadError(str, None), ["d"]),
+                ],
+            ),
+        ),
+        lambda: loader({"a": True, "b": "2", "c": 1, "d": None}),
+    )
+
+
+@pytest.mark.parametrize("extra_policy", [ExtraSkip(), ExtraForbid(), ExtraCollect()])
+def test_exact_keys_fast_path(debug_ctx, debug_trail, extra_policy, trail_select):
+    loader = make_loader_getter(
+        shape=shape(
+            TestField("a", ParamKind.POS_OR_KW, is_required=True),
+            TestField("b", ParamKind.POS_OR_KW, is_required=False),
+            kwargs=ParamKwargs(Any),
+        ),
+        name_layout=InputNameLayout(
+            crown=InpDictCrown(
+                {
+                    "a": InpFieldCrown("a"),
+                    "b": InpFieldCrown("b"),
+                },
+                extra_policy=extra_policy,
+            ),
+            extra_move=ExtraKwargs(),
+        ),
+        debug_trail=debug_trail,
+        debug_ctx=debug_ctx,
+    )()
+    assert "if type(data) is dict" in debug_ctx.source
+
+    for data_factory in [dict, MappingProxyType]:
+        assert loader(data_factory({"a": 1, "b": 2})) == gauge(1, b=2)
+        assert loader(data_factory({"a": 1})) == gauge(1)
+        raises_exc(
+            trail_select(
+                disable=LoadError(),
+                first=with_trail(LoadError(), ["b"]),
+                all=AggregateLoadError(
+                    f"while loading model {Gauge}",
+                    [with_trail(LoadError(), ["b"])],
+                ),
+            ),
+            lambda: loader(data_factory({"a": 1, "b": LoadError()})),  # noqa: B023
+        )
+
+    data = {"a": 1, "c": 3}
+    if extra_policy == ExtraSkip():
+        assert loader(data) == gauge(1)
+    elif extra_policy == ExtraCollect():
+        assert loader(data) == gauge(1, c=3)
+    else:
+        raises_exc(
+            trail_select(
+                disable=ExtraFieldsLoadError({"c"}, data),
+                first=ExtraFieldsLoadError({"c"}, data),
+                all=AggregateLoadError(f"while loading model {Gauge}", [ExtraFieldsLoadError({"c"}, data)]),
+            ),
+            lambda: loader(data),
+        )
@@ -0,0 +1,117 @@
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+import pytest
+from tests_helpers import raises_exc, with_trail
+
+from adaptix import DebugTrail, Retort, loader, name_mapping
+from adaptix.load_error import TypeLoadError
+from adaptix.retort import ProviderNotFoundError
+
+
+@dataclass
+class Item:
+    id: int
+
+
+@dataclass(frozen=True)
+class Order:
+    number: int
+    comment: str
+    items: list[Item]
+    tags: list[str] = field(default_factory=list)
+    priority: int = 0
+
+    def __post_init__(self):
+        if self.number < 0:
+            raise ValueError("number must not be negative")
+
+
+DATA = {
+    "number": 1,
+    "comment": "fast",
+    "items": [{"id": 2}],
+    "tags": ["a"],
+    "priority": 3,
+}
+
+
+def test_projection():
+    retort = Retort()
+    order = retort.get_loader(Order, only=["comment", "priority"])({**DATA, "items": "bad", "extra": 1})
+    assert order.__class__ is Order
+    assert order.comment == "fast"
+    assert order.priority == 3
+    assert order.tags == []
+    assert repr(order) == "Order(number=NOT_LOADED, comment='fast', items=NOT_LOADED, tags=[], priority=3)"
+    with pytest.raises(AttributeError, match="Field 'number' is not loaded"):
+        order.number  # noqa: B018
+
+    assert (
+        retort.get_loader(Order, only=("comment", "priority"))
+        is retort.get_loader(Order, only=["priority", "comment"])
+    )
+
+
+@pytest.mark.parametrize(
+    ["only", "expected"],
+    [
+        (
+            ["number", "comment", "items", "tags", "priority"],
+            Order(number=1, comment="fast", items=[Item(2)], tags=["a"], priority=3),
+        ),
+        (
+            ["number", "comment", "items"],
+            Order(number=1, comment="fast", items=[Item(2)]),
+        ),
+    ],
+)
+def test_required_fields_selected(only, expected):
+    projected_loader = Retort().get_loader(Order, only=only)
+    order = projected_loader(DATA)
+    assert type(order) is Order
+    assert order == expected
+    # the original constructor is called
+    with pytest.raises(ValueError, match="number must not be negative"):
+        projected_loader({**DATA, "number": -1})
+
+
+def test_errors():
+    retort = Retort(
+        debug_trail=DebugTrail.FIRST,
+        recipe=[name_mapping(Order, map={"comment": ("meta", "comment"), "number": ("meta", "number")})],
+    )
+    projected_loader = retort.get_loader(Order, only=["number"])
+    assert projected_loader({"meta": {"number": 5}}).number == 5
+    raises_exc(
+        with_trail(TypeLoadError(int, "1"), ["meta", "number"]),
+        lambda: projected_loader({"meta": {"number": "1", "comment": 1}}),
+    )
+
+
+def test_list_crown():
+    retort = Retort(recipe=[name_mapping(Order, map={"number": ("values", 1), "comment": ("values", 0)})])
+    projected_loader = retort.get_loader(Order, only=["number"])
+    assert projected_loader({"values": [None, 5]}).number == 5
+    assert projected_loader({"values": [None, 5, None]}).number == 5
+
+
+def test_not_supported():
+    class Point(NamedTuple):
+        x: int
+        y: int = 0
+
+    retort = Retort()
+    assert retort.get_loader(Point, only=["x"])({"x": 1, "y": "bad"}) == Point(1)
+    with pytest.raises(ProviderNotFoundError):
+        retort.get_loader(Point, only=["y"])
+    with pytest.raises(ProviderNotFoundError):
+        retort.get_loader(Order, only=["unknown"])
+    with pytest.raises(ProviderNotFoundError):
+        retort.get_loader(list[int], only=["x"])
+
+
+def test_overridden_loader():
+    retort = Retort(recipe=[loader(Order, lambda data: Order(number=1, comment="", items=[]))])
+    with pytest.raises(ValueError, match="is overridden by the recipe"):
+        retort.get_loader(Order, only=["number"])
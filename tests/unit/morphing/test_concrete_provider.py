@@ -1,6 +1,8 @@
 # ruff: noqa: DTZ001
 import re
 import typing
+from array import array
+from binascii import b2a_base64
 from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
 from fractions import Fraction
@@ -8,14 +10,16 @@ from io import BytesIO
 from typing import Union
 
 import pytest
-from tests_helpers import cond_list, raises_exc
+from tests_helpers import cond_list, raises_exc, requires, with_trail
 
-from adaptix import Retort
-from adaptix._internal.feature_requirement import HAS_PY_311, IS_PYPY
+from adaptix import DebugTrail, Retort, numeric_array, numpy_array, raw_bytes
+from adaptix._internal.compat import CompatExceptionGroup
+from adaptix._internal.feature_requirement import HAS_NUMPY_PKG, HAS_PY_311, IS_PYPY
 from adaptix._internal.morphing.concrete_provider import (
     DatetimeFormatProvider,
     DateTimestampProvider,
     DatetimeTimestampProvider,
+    IOBytesBase64Provider,
 )
 from adaptix.load_error import FormatMismatchLoadError, TypeLoadError, ValueLoadError
 
@@ -277,6 +281,62 @@ def test_date_timestamp_provider(strict_coercion, debug_trail):
     assert dumper(dt) == ts
 
 
+@pytest.mark.parametrize(
+    ["tp", "provider"],
+    [
+        (datetime, DatetimeTimestampProvider(tz=timezone.utc)),
+        (date, DateTimestampProvider()),
+    ],
+)
+def test_timestamp_sequences(strict_coercion, tp, provider):
+    retort = Retort(
+        strict_coercion=strict_coercion,
+        debug_trail=DebugTrail.FIRST,
+        recipe=[
+            provider,
+        ],
+    )
+    dts = [datetime(2011, 11, 4, tzinfo=timezone.utc), datetime(2012, 1, 2, 6, 38, tzinfo=timezone.utc)]
+    timestamps = [int(dt.timestamp()) for dt in dts]
+    expected = dts if tp is datetime else [dt.date() for dt in dts]
+
+    assert retort.load(timestamps, list[tp]) == expected
+    assert retort.load(tuple(timestamps), list[tp]) == expected
+    raises_exc(
+        with_trail(TypeLoadError(Union[float, int], None), [1]),
+        lambda: retort.load([timestamps[0], None], list[tp]),
+    )
+    raises_exc(
+        with_trail(ValueLoadError("Timestamp is out of the range of supported values", float("inf")), [1]),
+        lambda: retort.load([timestamps[0], float("inf")], list[tp]),
+    )
+    if tp is datetime:
+        assert retort.dump(dts, list[datetime]) == timestamps
+
+
+def test_timestamp_sequence_dumping_errors():
+    dts = [datetime(2011, 11, 4, tzinfo=timezone.utc), datetime(2012, 1, 2, 6, 38, tzinfo=timezone.utc)]
+    timestamps = [dt.timestamp() for dt in dts]
+    recipe = [DatetimeTimestampProvider(tz=timezone.utc)]
+
+    assert Retort(recipe=recipe, debug_trail=DebugTrail.DISABLE).dump(dts, list[datetime]) == timestamps
+    assert Retort(recipe=recipe, debug_trail=DebugTrail.ALL).dump(tuple(dts), list[datetime]) == timestamps
+    raises_exc(
+        with_trail(AttributeError("'int' object has no attribute 'timestamp'"), [1]),
+        lambda: Retort(recipe=recipe, debug_trail=DebugTrail.FIRST).dump([dts[0], 1, dts[1]], list[datetime]),
+    )
+    raises_exc(
+        CompatExceptionGroup(
+            f"while dumping iterable {list}",
+            [
+                with_trail(AttributeError("'int' object has no attribute 'timestamp'"), [1]),
+                with_trail(AttributeError("'str' object has no attribute 'timestamp'"), [3]),
+            ],
+        ),
+        lambda: Retort(recipe=recipe, debug_trail=DebugTrail.ALL).dump([dts[0], 1, dts[1], "x"], list[datetime]),
+    )
+
+
 def test_seconds_timedelta_provider(strict_coercion, debug_trail):
     retort = Retort(
         strict_coercion=strict_coercion,
@@ -318,6 +378,7 @@ def test_none_provider(strict_coercion, debug_trail):
         (bytearray, lambda x: x.decode(), lambda x: bytearray(x.encode())),
         (BytesIO, lambda x: x.getvalue().decode(), lambda x: BytesIO(x.encode())),
         (typing.IO[bytes], lambda x: x.read().decode(), lambda x: BytesIO(x.encode())),
+        (memoryview, lambda x: bytes(x).decode(), lambda x: memoryview(x.encode())),
     ],
 )
 def test_bytes_like_provider(
@@ -366,6 +427,132 @@ def test_bytes_like_provider(
     assert dumper(get_bytes(string)) == b64_string.decode()
 
 
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 4, 10, 11])
+def test_io_bytes_chunked_dumping(size):
+    retort = Retort(recipe=[IOBytesBase64Provider(chunk_size=4)])
+    content = bytes(range(size))
+
+    assert retort.dump(BytesIO(content), typing.IO[bytes]) == b2a_base64(content, newline=False).decode()
+
+
+def test_raw_bytes(strict_coercion, debug_trail):
+    retort = Retort(
+        strict_coercion=strict_coercion,
+        debug_trail=debug_trail,
+        recipe=[raw_bytes()],
+    )
+
+    assert retort.load(b"abc", bytes) == b"abc"
+    assert retort.load(bytearray(b"abc"), bytes) == b"abc"
+    assert retort.load(memoryview(b"abc"), bytearray) == bytearray(b"abc")
+    assert retort.load(b"abc", memoryview) == memoryview(b"abc")
+    assert retort.load(b"abc", BytesIO).getvalue() == b"abc"
+    assert retort.load(b"abc", typing.IO[bytes]).read() == b"abc"
+    raises_exc(
+        TypeLoadError(bytes, "YWJj"),
+        lambda: retort.load("YWJj", bytes),
+    )
+
+    assert retort.dump(b"abc") == b"abc"
+    assert retort.dump(bytearray(b"abc")) == bytearray(b"abc")
+    assert retort.dump(BytesIO(b"abc")) == b"abc"
+    assert retort.dump(BytesIO(b"abc"), typing.IO[bytes]) == b"abc"
+
+
+def test_array_provider(strict_coercion, debug_trail):
+    retort = Retort(
+        strict_coercion=strict_coercion,
+        debug_trail=debug_trail,
+        recipe=[
+            numeric_array(typecode="i"),
+        ],
+    )
+
+    loader = retort.get_loader(array)
+    assert loader([1, 2, 3]) == array("i", [1, 2, 3])
+    assert loader((1, 2, 3)) == array("i", [1, 2, 3])
+    assert loader(array("i", [1, 2, 3]).tobytes()) == array("i", [1, 2, 3])
+    assert loader(memoryview(array("i", [1, 2, 3]))) == array("i", [1, 2, 3])
+    assert loader("AQAAAAIAAAADAAAA") == array("i", [1, 2, 3])
+
+    raises_exc(
+        ValueLoadError("'float' object cannot be interpreted as an integer", [1.5]),
+        lambda: loader([1.5]),
+    )
+    raises_exc(
+        ValueLoadError("bytes length not a multiple of item size", b"abc"),
+        lambda: loader(b"abc"),
+    )
+    raises_exc(
+        ValueLoadError("Bad base64 string", "Hello, world"),
+        lambda: loader("Hello, world"),
+    )
+    raises_exc(
+        TypeLoadError(Union[list, tuple, str, bytes, bytearray, memoryview], 108),
+        lambda: loader(108),
+    )
+
+    assert retort.dump(array("i", [1, 2, 3])) == [1, 2, 3]
+    assert retort.extend(
+        recipe=[numeric_array(typecode="i", dump_as="base64")],
+    ).dump(array("i", [1, 2, 3])) == "AQAAAAIAAAADAAAA"
+    buffer = retort.extend(
+        recipe=[numeric_array(typecode="i", dump_as="buffer")],
+    ).dump(array("i", [1, 2, 3]))
+    assert isinstance(buffer, memoryview)
+    assert buffer.tolist() == [1, 2, 3]
+
+
+def test_array_provider_without_typecode():
+    assert Retort().dump(array("d", [1, 2])) == [1.0, 2.0]
+    with pytest.raises(Exception, match="Cannot produce loader"):
+        Retort().get_loader(array)
+    with pytest.raises(ValueError, match="Typecode 'u' is not supported"):
+        numeric_array(typecode="u")
+
+
+@requires(HAS_NUMPY_PKG)
+def test_numpy_array_provider(strict_coercion, debug_trail):
+    import numpy as np
+    from numpy.typing import NDArray
+
+    retort = Retort(
+        strict_coercion=strict_coercion,
+        debug_trail=debug_trail,
+        recipe=[
+            numpy_array(),
+        ],
+    )
+
+    loader = retort.get_loader(NDArray[np.int32])
+    loaded = loader([[1, 2], [3, 4]])
+    assert loaded.dtype == np.int32
+    assert loaded.tolist() == [[1, 2], [3, 4]]
+
+    data = np.array([1, 2, 3], dtype=np.int32).tobytes()
+    loaded = loader(data)
+    assert loaded.tolist() == [1, 2, 3]
+    assert not loaded.flags.writeable
+    assert loader("AQAAAAIAAAADAAAA").tolist() == [1, 2, 3]
+
+    raises_exc(
+        TypeLoadError(Union[list, tuple, str, bytes, bytearray, memoryview], 108),
+        lambda: loader(108),
+    )
+    assert retort.dump(np.array([[1, 2], [3, 4]]), NDArray[np.int32]) == [[1, 2], [3, 4]]
+
+    shaped_retort = retort.extend(
+        recipe=[numpy_array(dtype=np.int32, shape=(None, 2), dump_as="base64")],
+    )
+    shaped_loader = shaped_retort.get_loader(np.ndarray)
+    assert shaped_loader("AQAAAAIAAAADAAAABAAAAA==").tolist() == [[1, 2], [3, 4]]
+    raises_exc(
+        ValueLoadError("Array of shape (None, 2) is expected, got (1, 3)", [[1, 2, 3]]),
+        lambda: shaped_loader([[1, 2, 3]]),
+    )
+    assert shaped_retort.dump(np.array([[1, 2], [3, 4]], dtype=np.int32)) == "AQAAAAIAAAADAAAABAAAAA=="
+
+
 def test_regex_provider(strict_coercion, debug_trail):
     retort = Retort(
         strict_coercion=strict_coercion,
@@ -268,3 +268,47 @@ def test_dumping(retort, debug_trail):
             ),
             lambda: iterable_dumper(["10", 20]),
         )
+
+
+def test_scalar_elements(strict_coercion, debug_trail):
+    retort = Retort(strict_coercion=strict_coercion, debug_trail=debug_trail)
+
+    int_list_loader = retort.get_loader(List[int])
+    data = [1, 2, 3]
+    loaded = int_list_loader(data)
+    assert loaded == [1, 2, 3]
+    assert loaded is not data
+    assert int_list_loader((1, 2, 3)) == [1, 2, 3]
+    assert int_list_loader([]) == []
+    assert int_list_loader(deque([1, 2, 3])) == [1, 2, 3]
+
+    float_tuple_loader = retort.get_loader(Tuple[float, ...])
+    loaded = float_tuple_loader([1, 2.5, 3])
+    assert loaded == (1.0, 2.5, 3.0)
+    assert [type(el) for el in loaded] == [float, float, float]
+
+    if strict_coercion and debug_trail == DebugTrail.ALL:
+        raises_exc(
+            AggregateLoadError(
+                "while loading iterable <class 'list'>",
+                [with_trail(TypeLoadError(int, input_value=True), [1])],
+            ),
+            lambda: int_list_loader([1, True, 3]),
+        )
+    elif strict_coercion:
+        raises_exc(
+            with_trail(
+                TypeLoadError(int, input_value=True),
+                [] if debug_trail == DebugTrail.DISABLE else [1],
+            ),
+            lambda: int_list_loader([1, True, 3]),
+        )
+    else:
+        assert int_list_loader(["1", 2]) == [1, 2]
+
+    int_list_dumper = retort.get_dumper(List[int])
+    data = [1, 2, 3]
+    dumped = int_list_dumper(data)
+    assert dumped == [1, 2, 3]
+    assert dumped is not data
+    assert retort.get_dumper(Iterable[int])({1, 2}) in [(1, 2), (2, 1)]
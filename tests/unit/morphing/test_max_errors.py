@@ -0,0 +1,200 @@
+from dataclasses import dataclass
+
+import pytest
+from tests_helpers import raises_exc, with_trail
+
+from adaptix import DebugTrail, Retort
+from adaptix._internal.morphing.load_error import render_truncation_note
+from adaptix.load_error import AggregateLoadError, TypeLoadError
+from adaptix.struct_trail import ItemKey
+
+
+@dataclass
+class Item:
+    id: int
+
+
+def truncated(exc):
+    return render_truncation_note(exc, 2)
+
+
+def test_iterable():
+    retort = Retort(max_errors=2)
+    raises_exc(
+        truncated(
+            AggregateLoadError(
+                f"while loading iterable {list}",
+                [
+                    with_trail(TypeLoadError(int, "a"), [0]),
+                    with_trail(TypeLoadError(int, "b"), [2]),
+                ],
+            ),
+        ),
+        lambda: retort.load(["a", 1, "b", "c"], list[int]),
+    )
+    raises_exc(
+        AggregateLoadError(
+            f"while loading iterable {list}",
+            [with_trail(TypeLoadError(int, "a"), [0])],
+        ),
+        lambda: retort.load(["a", 1], list[int]),
+    )
+
+
+def test_dict():
+    retort = Retort(max_errors=2)
+    raises_exc(
+        truncated(
+            AggregateLoadError(
+                f"while loading {dict}",
+                [
+                    with_trail(TypeLoadError(int, "x"), ["a"]),
+                    with_trail(TypeLoadError(int, "y"), ["b"]),
+                ],
+            ),
+        ),
+        lambda: retort.load({"a": "x", "b": "y", "c": "z"}, dict[str, int]),
+    )
+
+
+def test_batch():
+    retort = Retort(max_errors=2)
+    raises_exc(
+        truncated(
+            AggregateLoadError(
+                f"while loading batch of {Item}",
+                [
+                    with_trail(
+                        AggregateLoadError(
+                            f"while loading model {Item}",
+                            [with_trail(TypeLoadError(int, str(idx)), ["id"])],
+                        ),
+                        [idx],
+                    )
+                    for idx in range(2)
+                ],
+            ),
+        ),
+        lambda: retort.load_many([{"id": str(idx)} for idx in range(5)], Item),
+    )
+
+
+def test_columns():
+    retort = Retort(max_errors=2)
+    raises_exc(
+        truncated(
+            AggregateLoadError(
+                f"while loading columns of {Item}",
+                [
+                    with_trail(TypeLoadError(int, "a"), ["id", 0]),
+                    with_trail(TypeLoadError(int, "b"), ["id", 1]),
+                ],
+            ),
+        ),
+        lambda: retort.load_columns({"id": ["a", "b", "c"]}, Item),
+    )
+
+
+def test_not_truncated_at_the_end():
+    retort = Retort(max_errors=2)
+    raises_exc(
+        AggregateLoadError(
+            f"while loading iterable {list}",
+            [
+                with_trail(TypeLoadError(int, "a"), [0]),
+                with_trail(TypeLoadError(int, "b"), [1]),
+            ],
+        ),
+        lambda: retort.load(["a", "b"], list[int]),
+    )
+    raises_exc(
+        AggregateLoadError(
+            f"while loading {dict}",
+            [
+                with_trail(TypeLoadError(int, "x"), ["a"]),
+                with_trail(TypeLoadError(int, "y"), ["b"]),
+            ],
+        ),
+        lambda: retort.load({"a": "x", "b": "y"}, dict[str, int]),
+    )
+    raises_exc(
+        AggregateLoadError(
+            f"while loading batch of {Item}",
+            [
+                with_trail(
+                    AggregateLoadError(
+                        f"while loading model {Item}",
+                        [with_trail(TypeLoadError(int, str(idx)), ["id"])],
+                    ),
+                    [idx],
+                )
+                for idx in range(2)
+            ],
+        ),
+        lambda: retort.load_many([{"id": str(idx)} for idx in range(2)], Item),
+    )
+    raises_exc(
+        AggregateLoadError(
+            f"while loading columns of {Item}",
+            [
+                with_trail(TypeLoadError(int, "a"), ["id", 0]),
+                with_trail(TypeLoadError(int, "b"), ["id", 1]),
+            ],
+        ),
+        lambda: retort.load_columns({"id": ["a", "b"]}, Item),
+    )
+
+
+def test_dict_key_and_value_errors():
+    retort = Retort(max_errors=1)
+    raises_exc(
+        render_truncation_note(
+            AggregateLoadError(
+                f"while loading {dict}",
+                [with_trail(TypeLoadError(int, "a"), [ItemKey("a")])],
+            ),
+            1,
+        ),
+        lambda: retort.load({"a": "x"}, dict[int, int]),
+    )
+
+
+@dataclass
+class Pair:
+    a: int
+    b: int
+
+
+def test_columns_left():
+    retort = Retort(max_errors=2)
+    raises_exc(
+        truncated(
+            AggregateLoadError(
+                f"while loading columns of {Pair}",
+                [
+                    with_trail(TypeLoadError(int, "x"), ["a", 0]),
+                    with_trail(TypeLoadError(int, "y"), ["a", 1]),
+                ],
+            ),
+        ),
+        lambda: retort.load_columns({"a": ["x", "y"], "b": [1, 2]}, Pair),
+    )
+
+
+def test_other_modes():
+    retort = Retort(max_errors=1, debug_trail=DebugTrail.FIRST)
+    raises_exc(
+        with_trail(TypeLoadError(int, "a"), [0]),
+        lambda: retort.load(["a", "b"], list[int]),
+    )
+
+
+def test_validation():
+    with pytest.raises(ValueError, match="max_errors must be positive"):
+        Retort(max_errors=0)
+    with pytest.raises(ValueError, match="max_errors must be positive"):
+        Retort().replace(max_errors=0)
+    retort = Retort().replace(max_errors=1)
+    with pytest.raises(AggregateLoadError) as exc_info:
+        retort.load(["a", "b"], list[int])
+    assert len(exc_info.value.exceptions) == 1
@@ -0,0 +1,125 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from ipaddress import IPv4Address
+from uuid import UUID
+
+from tests_helpers import raises_exc, with_trail
+
+from adaptix import DebugTrail, Retort, loader, memoized_loader
+from adaptix._internal.compat import CompatExceptionGroup
+from adaptix.load_error import AggregateLoadError, TypeLoadError, ValueLoadError
+
+
+def test_memoized_values():
+    retort = Retort(recipe=[memoized_loader()])
+    assert retort.load("2024-01-02T03:04:05", datetime) is retort.load("2024-01-02T03:04:05", datetime)
+    assert retort.load("2024-01-02", date) == date(2024, 1, 2)
+    assert retort.load("127.0.0.1", IPv4Address) is retort.load("127.0.0.1", IPv4Address)
+    uuid = "2f2bba5d-5c62-4ad0-9ec4-1b3ab12d1a80"
+    assert retort.load(uuid, UUID) is retort.load(uuid, UUID)
+    assert retort.load(uuid, UUID) == UUID(uuid)
+
+
+def test_errors():
+    retort = Retort(recipe=[memoized_loader()])
+    raises_exc(
+        ValueLoadError("Invalid isoformat string", "bad"),
+        lambda: retort.load("bad", date),
+    )
+    raises_exc(
+        TypeLoadError(str, 1),
+        lambda: retort.load(1, date),
+    )
+
+
+def test_maxsize():
+    calls = []
+
+    def parse(data):
+        calls.append(data)
+        return int(data)
+
+    retort = Retort(recipe=[memoized_loader(int, maxsize=1), loader(int, parse)])
+    for data in ["1", "1", "2", "1"]:
+        retort.load(data, int)
+    assert calls == ["1", "2", "1"]
+
+
+def test_sequences(debug_trail):
+    calls = []
+
+    def parse(data):
+        calls.append(data)
+        return date.fromisoformat(data)
+
+    @dataclass
+    class Log:
+        day: date
+
+    retort = Retort(recipe=[memoized_loader(date), loader(date, parse)], debug_trail=debug_trail)
+    data = ["2024-01-02", "2024-01-03", "2024-01-02"]
+    expected = [date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 2)]
+    assert retort.load(data, list[date]) == expected
+    assert sorted(calls) == ["2024-01-02", "2024-01-03"]
+    calls.clear()
+    assert retort.load_columns({"day": data}, Log) == [Log(day) for day in expected]
+    assert sorted(calls) == ["2024-01-02", "2024-01-03"]
+
+
+def test_sequence_errors():
+    retort = Retort(recipe=[memoized_loader()], debug_trail=DebugTrail.FIRST)
+    raises_exc(
+        with_trail(ValueLoadError("Invalid isoformat string", "bad"), [1]),
+        lambda: retort.load(["2024-01-02", "bad"], list[date]),
+    )
+    raises_exc(
+        with_trail(TypeLoadError(str, 1), [1]),
+        lambda: retort.load(["2024-01-02", 1], list[date]),
+    )
+
+
+def test_sequence_loading_is_resumed():
+    calls = []
+
+    def parse(data):
+        calls.append(data)
+        try:
+            return date.fromisoformat(data)
+        except ValueError:
+            raise ValueLoadError("Bad date", data) from None
+
+    retort = Retort(recipe=[memoized_loader(date), loader(date, parse)], debug_trail=DebugTrail.ALL)
+    raises_exc(
+        AggregateLoadError(
+            f"while loading iterable {list}",
+            [
+                with_trail(ValueLoadError("Bad date", "bad"), [1]),
+                with_trail(ValueLoadError("Bad date", "worse"), [3]),
+            ],
+        ),
+        lambda: retort.load(["2024-01-02", "bad", "2024-01-03", "worse"], list[date]),
+    )
+    assert calls == ["2024-01-02", "bad", "2024-01-03", "worse"]
+
+
+def test_sequence_non_load_errors():
+    uuid = "2f2bba5d-5c62-4ad0-9ec4-1b3ab12d1a80"
+    data = [uuid, "bad", "bad2"]
+
+    retort = Retort(recipe=[memoized_loader()], debug_trail=DebugTrail.FIRST)
+    raises_exc(
+        with_trail(ValueError("badly formed hexadecimal UUID string"), [1]),
+        lambda: retort.load(data, list[UUID]),
+    )
+
+    retort = Retort(recipe=[memoized_loader()], debug_trail=DebugTrail.ALL)
+    raises_exc(
+        CompatExceptionGroup(
+            f"while loading iterable {list}",
+            [
+                with_trail(ValueError("badly formed hexadecimal UUID string"), [1]),
+                with_trail(ValueError("badly formed hexadecimal UUID string"), [2]),
+            ],
+        ),
+        lambda: retort.load(data, list[UUID]),
+    )
@@ -0,0 +1,103 @@
+import json
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from adaptix import Retort
+from adaptix.load_error import AggregateLoadError
+from adaptix.retort import RuntimeProfiler
+
+
+@dataclass
+class Item:
+    id: int
+    note: Optional[str] = None
+
+
+@dataclass
+class Order:
+    items: list[Item]
+    owner: str
+
+
+def get_stats(profiler: RuntimeProfiler):
+    return {(stats.kind, stats.path): stats for stats in profiler.get_stats()}
+
+
+def test_loader_stats():
+    profiler = RuntimeProfiler()
+    retort = Retort(runtime_profiler=profiler)
+
+    data = {"items": [{"id": 1}, {"id": 2, "note": "a"}, {"id": 3}], "owner": "x"}
+    assert retort.load(data, Order) == Order(items=[Item(1), Item(2, "a"), Item(3)], owner="x")
+
+    stats = get_stats(profiler)
+    assert stats["loader", "Order"].calls == 1
+    assert stats["loader", "Order"].type == "Order"
+    assert stats["loader", "Order.items[0]"].calls == 3
+    assert stats["loader", "Order.items[0]"].absent is None
+    assert stats["loader", "Order.items[0].note"].calls == 1
+    assert stats["loader", "Order.items[0].note"].absent == 2
+    assert stats["loader", "Order"].total_time >= stats["loader", "Order.items"].total_time
+    assert all(kind == "loader" for kind, path in stats)
+
+
+def test_error_stats():
+    profiler = RuntimeProfiler()
+    retort = Retort(runtime_profiler=profiler)
+
+    with pytest.raises(AggregateLoadError):
+        retort.load({"items": [{"id": 1}, {"id": "2"}], "owner": "x"}, Order)
+
+    stats = get_stats(profiler)
+    assert stats["loader", "Order.items[0]"].calls == 2
+    assert stats["loader", "Order.items[0]"].errors == 1
+    assert stats["loader", "Order"].errors == 1
+
+
+def test_dumper_stats():
+    profiler = RuntimeProfiler()
+    retort = Retort(runtime_profiler=profiler)
+
+    assert retort.dump(Order(items=[Item(1)], owner="x")) == {"items": [{"id": 1, "note": None}], "owner": "x"}
+
+    stats = get_stats(profiler)
+    assert stats["dumper", "Order"].calls == 1
+    assert stats["dumper", "Order.items[0]"].calls == 1
+    assert stats["dumper", "Order.items[0]"].absent is None
+
+
+def test_optimizations_are_kept():
+    profiler = RuntimeProfiler()
+    retort = Retort(runtime_profiler=profiler)
+    retort.load({"items": [{"id": 1}], "owner": "x"}, Order)
+    retort.dump(Order(items=[Item(1)], owner="x"))
+
+    # int loader is replaced with an exact type check and int dumper is as-is, so they are not called
+    stats = get_stats(profiler)
+    assert ("loader", "Order.items[0].id") not in stats
+    assert ("dumper", "Order.items[0].id") not in stats
+    assert ("loader", "Order.owner") not in stats
+
+
+def test_export_and_reset():
+    profiler = RuntimeProfiler()
+    retort = Retort(runtime_profiler=profiler)
+    retort.load({"items": [], "owner": "x"}, Order)
+
+    data = json.loads(profiler.to_json())
+    assert {stats["path"] for stats in data["converters"]} == {"Order", "Order.items"}
+    assert "Order.items" in profiler.render_table()
+
+    profiler.reset()
+    assert profiler.get_stats() == []
+
+
+def test_no_profiling_by_default():
+    retort = Retort()
+    profiler = RuntimeProfiler()
+    retort.replace(runtime_profiler=profiler).load({"id": 1}, Item)
+    retort.load({"id": 1}, Item)
+
+    assert get_stats(profiler)["loader", "Item"].calls == 1
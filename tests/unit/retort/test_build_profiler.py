@@ -0,0 +1,77 @@
+import json
+from dataclasses import dataclass
+
+from adaptix import Retort
+from adaptix.retort import BuildProfiler
+
+
+@dataclass
+class Book:
+    title: str
+    price: int
+
+
+@dataclass
+class Library:
+    books: list[Book]
+    best: Book
+
+
+def test_handler_stats():
+    profiler = BuildProfiler()
+    retort = Retort(build_profiler=profiler)
+    retort.get_loader(Library)
+
+    stats = {(item.request_cls, item.provider.split(" #")[0]): item for item in profiler.get_handler_stats()}
+    model_stats = stats["LoaderRequest", "ModelLoaderProvider"]
+    assert model_stats.calls == 3  # Library, Book inside list and Book at field
+    assert model_stats.cannot_provide == 0
+    assert model_stats.total_time >= model_stats.own_time >= 0
+
+    shape_stats = stats["InputShapeRequest", "ConcatProvider"]
+    assert shape_stats.cannot_provide > 0
+
+    assert all(item.request_cls != "DumperRequest" for item in profiler.get_handler_stats())
+
+
+def test_cached_call_stats():
+    profiler = BuildProfiler()
+    retort = Retort(build_profiler=profiler)
+    retort.get_loader(Library)
+
+    shape_stats = next(item for item in profiler.get_cached_call_stats() if item.func.endswith("._get_shape"))
+    assert shape_stats.hits > 0
+    assert shape_stats.misses > 0
+
+
+def test_export():
+    profiler = BuildProfiler()
+    retort = Retort(build_profiler=profiler)
+    retort.get_dumper(Library)
+
+    data = json.loads(profiler.to_json())
+    assert {item["request_cls"] for item in data["handlers"]} >= {"DumperRequest", "OutputShapeRequest"}
+    assert data["cached_calls"]
+
+    table = profiler.render_table()
+    assert "ModelDumperProvider" in table
+    assert "_get_shape" in table
+
+
+def test_reset():
+    profiler = BuildProfiler()
+    retort = Retort(build_profiler=profiler)
+    retort.get_loader(Library)
+    profiler.reset()
+
+    assert profiler.get_handler_stats() == []
+    assert profiler.get_cached_call_stats() == []
+
+
+def test_replace():
+    profiler = BuildProfiler()
+    retort = Retort().replace(build_profiler=profiler)
+    retort.get_loader(Book)
+
+    assert profiler.get_handler_stats()
+    assert retort.load({"title": "a", "price": 1}, Book) == Book(title="a", price=1)
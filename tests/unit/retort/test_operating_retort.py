@@ -14,8 +14,8 @@ def test_cannot_produce_loader():
     @dataclass
     class Stub:
         f1: int
-        f2: memoryview
-        f3: memoryview
+        f2: slice
+        f3: slice
 
     raises_exc(
         with_cause(
@@ -33,7 +33,7 @@ def test_cannot_produce_loader():
                                 is_terminal=False,
                                 is_demonstrative=True,
                             ),
-                            f"Location: `{Stub.__qualname__}.f2: memoryview`",
+                            f"Location: `{Stub.__qualname__}.f2: slice`",
                         ),
                         with_notes(
                             CannotProvide(
@@ -41,7 +41,7 @@ def test_cannot_produce_loader():
                                 is_terminal=False,
                                 is_demonstrative=True,
                             ),
-                            f"Location: `{Stub.__qualname__}.f3: memoryview`",
+                            f"Location: `{Stub.__qualname__}.f3: slice`",
                         ),
                     ],
                     is_terminal=True,
@@ -60,8 +60,8 @@ def test_cannot_produce_dumper():
     @dataclass
     class Stub:
         f1: int
-        f2: memoryview
-        f3: memoryview
+        f2: slice
+        f3: slice
 
     raises_exc(
         with_cause(
@@ -79,7 +79,7 @@ def test_cannot_produce_dumper():
                                 is_terminal=False,
                                 is_demonstrative=True,
                             ),
-                            f"Location: `{Stub.__qualname__}.f2: memoryview`",
+                            f"Location: `{Stub.__qualname__}.f2: slice`",
                         ),
                         with_notes(
                             CannotProvide(
@@ -87,7 +87,7 @@ def test_cannot_produce_dumper():
                                 is_terminal=False,
                                 is_demonstrative=True,
                             ),
-                            f"Location: `{Stub.__qualname__}.f3: memoryview`",
+                            f"Location: `{Stub.__qualname__}.f3: slice`",
                         ),
                     ],
                     is_terminal=True,
@@ -0,0 +1,134 @@
+import collections.abc
+import re
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any, Generic, List, TypeVar
+
+import pytest
+from tests_helpers.misc import create_mediator
+
+from adaptix import P
+from adaptix._internal.model_tools.definitions import NoDefault
+from adaptix._internal.provider.essential import RequestChecker
+from adaptix._internal.provider.loc_stack_filtering import (
+    AnyLocStackChecker,
+    LocStack,
+    LocStackChecker,
+    LocStackEndChecker,
+    create_loc_stack_checker,
+)
+from adaptix._internal.provider.located_request import LocatedRequest, LocatedRequestChecker
+from adaptix._internal.provider.location import FieldLoc, GenericParamLoc, TypeHintLoc
+from adaptix._internal.retort.routers import create_router_for_located_request
+
+T = TypeVar("T")
+
+
+class Gen(Generic[T]):
+    pass
+
+
+class CustomChecker(LocStackChecker):
+    def check_loc_stack(self, mediator, loc_stack: LocStack) -> bool:
+        return len(loc_stack) == 2
+
+
+def field_loc(name: str, tp: Any) -> FieldLoc:
+    return FieldLoc(type=tp, field_id=name, default=NoDefault(), metadata={})
+
+
+CHECKERS: Sequence[LocStackChecker] = [
+    create_loc_stack_checker(P.a),
+    create_loc_stack_checker(int),
+    create_loc_stack_checker(str),
+    create_loc_stack_checker(re.compile("b.*")),
+    create_loc_stack_checker(P[collections.abc.Sequence]),
+    create_loc_stack_checker(List[int]),
+    create_loc_stack_checker(P[Gen].generic_arg(0, int)),
+    create_loc_stack_checker(P.a & P[str]),
+    create_loc_stack_checker(~P.c),
+    create_loc_stack_checker(P.a | P[float]),
+    create_loc_stack_checker(P.a ^ P[int]),
+    CustomChecker(),
+    create_loc_stack_checker(P.a & CustomChecker()),
+    LocStackEndChecker([AnyLocStackChecker(), create_loc_stack_checker(int)]),
+    create_loc_stack_checker(float),
+    create_loc_stack_checker(bytes),
+    create_loc_stack_checker(P.ANY),
+]
+
+LOC_STACKS: Sequence[LocStack] = [
+    LocStack(TypeHintLoc(int)),
+    LocStack(TypeHintLoc(float)),
+    LocStack(TypeHintLoc(bytes)),
+    LocStack(TypeHintLoc(List[int])),
+    LocStack(TypeHintLoc(List[str])),
+    LocStack(TypeHintLoc(Gen[int]), GenericParamLoc(type=int, generic_pos=0)),
+    LocStack(TypeHintLoc(Gen[str]), GenericParamLoc(type=str, generic_pos=0)),
+    LocStack(TypeHintLoc(object), field_loc("a", int)),
+    LocStack(TypeHintLoc(object), field_loc("a", str)),
+    LocStack(TypeHintLoc(object), field_loc("b", float)),
+    LocStack(TypeHintLoc(object), field_loc("c", bytes)),
+    LocStack(field_loc("a", str)),
+    LocStack(TypeHintLoc("not normalizable")),
+]
+
+
+def route_linear(checkers: Sequence[RequestChecker], request: LocatedRequest) -> list[int]:
+    mediator = create_mediator()
+    return [i for i, checker in enumerate(checkers) if checker.check_request(mediator, request)]
+
+
+def route_all(router, request: LocatedRequest) -> list[int]:
+    mediator = create_mediator()
+    result = []
+    search_offset = 0
+    while True:
+        try:
+            handler, search_offset = router.route_handler(mediator, request, search_offset)
+        except StopIteration:
+            return result
+        result.append(handler)
+
+
+@pytest.mark.parametrize("loc_stack", LOC_STACKS)
+def test_same_as_linear_search(loc_stack):
+    checkers = [LocatedRequestChecker(lsc) for lsc in CHECKERS]
+    router = create_router_for_located_request([(checker, i) for i, checker in enumerate(checkers)])
+    request = LocatedRequest(loc_stack=loc_stack)
+
+    expected = route_linear(checkers, request)
+    assert route_all(router, request) == expected
+    # second call is served from cache of candidates
+    assert route_all(router, request) == expected
+
+
+def test_origin_combo_is_not_repeated():
+    checkers = [
+        LocatedRequestChecker(create_loc_stack_checker(int)),
+        LocatedRequestChecker(create_loc_stack_checker(P.a)),
+        LocatedRequestChecker(create_loc_stack_checker(str)),
+        LocatedRequestChecker(create_loc_stack_checker(float)),
+    ]
+    router = create_router_for_located_request([(checker, i) for i, checker in enumerate(checkers)])
+    request = LocatedRequest(loc_stack=LocStack(TypeHintLoc(int)))
+
+    assert route_all(router, request) == [0]
+
+
+def test_abc_register_after_routing():
+    class Base(ABC):
+        @abstractmethod
+        def method(self):
+            ...
+
+    class Registered:
+        pass
+
+    checkers = [LocatedRequestChecker(create_loc_stack_checker(P[Base]))]
+    router = create_router_for_located_request([(checker, i) for i, checker in enumerate(checkers)])
+    request = LocatedRequest(loc_stack=LocStack(TypeHintLoc(Registered)))
+
+    assert route_all(router, request) == []
+    Base.register(Registered)
+    assert route_all(router, request) == [0]
@@ -1,6 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
 import pytest
 
-from adaptix._internal.datastructures import ClassDispatcher
+from adaptix._internal.datastructures import ClassDispatcher, SingleFlightDict
 
 
 class Cls1:
@@ -62,3 +65,49 @@ def test_class_dispatcher_dispatch_multi():
 
     dispatcher2 = ClassDispatcher({BaseRight: 2, BaseLeft: 1})
     assert dispatcher2.dispatch(Child) == 1
+
+
+def test_single_flight_dict_computes_once():
+    cache: SingleFlightDict[str, int] = SingleFlightDict()
+    started = Event()
+    release = Event()
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        started.set()
+        release.wait()
+        return value
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(cache.get_or_compute, "key", compute, idx) for idx in range(4)]
+        started.wait()
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert results == [calls[0]] * 4
+    assert cache == {"key": calls[0]}
+
+
+def test_single_flight_dict_error():
+    cache: SingleFlightDict[str, int] = SingleFlightDict()
+
+    def fail():
+        raise ValueError("computation failed")
+
+    with pytest.raises(ValueError, match="computation failed"):
+        cache.get_or_compute("key", fail)
+    assert cache.get_or_compute("key", lambda: 1) == 1
+    assert cache.get_or_compute("key", fail) == 1
+
+
+def test_single_flight_dict_reentrant():
+    cache: SingleFlightDict[str, int] = SingleFlightDict()
+
+    def compute(depth):
+        if depth == 0:
+            return 0
+        return cache.get_or_compute("key", compute, depth - 1) + 1
+
+    assert cache.get_or_compute("key", compute, 2) == 2
@@ -1,5 +1,3 @@
-from collections import deque
-
 import pytest
 
 from adaptix.struct_trail import append_trail, extend_trail, get_trail
@@ -14,20 +12,21 @@ def test_append_trail():
     exc = Exception()
 
     append_trail(exc, "foo")
-    assert _raw_trail(exc) == deque(["foo"])
+    assert _raw_trail(exc) == ("foo", None)
     append_trail(exc, "bar")
-    assert _raw_trail(exc) == deque(["bar", "foo"])
+    assert _raw_trail(exc) == ("bar", ("foo", None))
     append_trail(exc, 3)
-    assert _raw_trail(exc) == deque([3, "bar", "foo"])
+    assert _raw_trail(exc) == (3, ("bar", ("foo", None)))
 
 
 def test_extend_trail():
     exc = Exception()
 
     extend_trail(exc, ["a", "b"])
-    assert _raw_trail(exc) == deque(["a", "b"])
+    assert _raw_trail(exc) == ("a", ("b", None))
     extend_trail(exc, ["c", "d"])
-    assert _raw_trail(exc) == deque(["c", "d", "a", "b"])
+    assert _raw_trail(exc) == ("c", ("d", ("a", ("b", None))))
+    assert list(get_trail(exc)) == ["c", "d", "a", "b"]
 
 
 def test_get_trail():
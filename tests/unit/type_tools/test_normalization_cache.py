@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+from typing import Annotated
+
+from adaptix import Retort
+from adaptix._internal.type_tools import normalize_type
+from adaptix._internal.type_tools.normalize_type import using_normalization_cache
+from adaptix.type_tools import NormalizationCache, NormalizationCacheInfo, get_normalization_cache
+
+
+def test_cache_info():
+    cache = NormalizationCache(maxsize=2)
+    assert cache.cache_info() == NormalizationCacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+    assert cache.normalize(list[int]) == normalize_type(list[int])
+    assert cache.normalize(list[int]) == normalize_type(list[int])
+    cache.normalize(list[str])
+    cache.normalize(list[bytes])
+    assert cache.cache_info() == NormalizationCacheInfo(hits=1, misses=3, maxsize=2, currsize=2)
+
+    cache.cache_clear()
+    assert cache.cache_info() == NormalizationCacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+
+def test_unhashable_type():
+    cache = NormalizationCache()
+    assert cache.normalize(Annotated[int, {}]) == normalize_type(Annotated[int, {}])
+    assert cache.cache_info().currsize == 0
+
+
+def test_intern():
+    cache = NormalizationCache(maxsize=None, intern=True)
+
+    norm1 = cache.normalize(dict[str, list[int]])
+    norm2 = cache.normalize(tuple[list[int], ...])
+    assert norm1 == normalize_type(dict[str, list[int]])
+    assert norm2 == normalize_type(tuple[list[int], ...])
+    assert norm1.args[1] is norm2.args[0]
+    assert cache.cache_info().hits == 1
+
+
+def test_context():
+    default_cache = get_normalization_cache()
+    cache = NormalizationCache()
+    with using_normalization_cache(cache):
+        assert get_normalization_cache() is cache
+        normalize_type(list[int])
+    assert get_normalization_cache() is default_cache
+    assert cache.cache_info().misses == 1
+
+
+def test_retort_cache():
+    @dataclass
+    class Book:
+        title: str
+        tags: list[str]
+
+    cache = NormalizationCache()
+    retort = Retort(normalization_cache=cache)
+    retort.get_loader(Book)
+    assert cache.cache_info().currsize > 0
+
+    other_cache = NormalizationCache()
+    retort.replace(normalization_cache=other_cache).get_dumper(Book)
+    assert other_cache.cache_info().currsize > 0